@@ -14,6 +14,39 @@ class Settings:
     # MongoDB
     MONGO_URI = os.getenv("MONGO_URI")
     MONGO_DB = os.getenv("MONGO_DB", "sales_mongo")
+    MONGO_TOTALS_TTL = float(os.getenv("MONGO_TOTALS_TTL", "30"))
+    MONGO_TOTALS_MAXSIZE = int(os.getenv("MONGO_TOTALS_MAXSIZE", "1024"))
+    MONGO_STATS_TTL = float(os.getenv("MONGO_STATS_TTL", "300"))
+    MONGO_ESTIMATED_COUNT = os.getenv("MONGO_ESTIMATED_COUNT", "false").lower() == "true"
+    MONGO_BULK_CHUNK_SIZE = int(os.getenv("MONGO_BULK_CHUNK_SIZE", "1000"))
+    MONGO_MAX_BATCH_IDS = int(os.getenv("MONGO_MAX_BATCH_IDS", "500"))
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "10000"))
+    MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "0")) or None
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "0")) or None
+    MONGO_WARMUP_CONNECTIONS = int(os.getenv("MONGO_WARMUP_CONNECTIONS", "10"))
+    MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", "true").lower() == "true"
+
+    # USD->CRC daily rates for total_usd on CRC ordenes; empty uses the ETL's TIPOS_DE_CAMBIO.csv
+    EXCHANGE_RATES_CSV = os.getenv("EXCHANGE_RATES_CSV", "")
+
+    # /admin routes (explain, indexes, agg_ventas rebuild, cache): off unless enabled, and every
+    # request must send ADMIN_TOKEN in the X-Admin-Token header
+    ADMIN_ROUTES_ENABLED = os.getenv("ADMIN_ROUTES_ENABLED", "false").lower() == "true"
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+    # Metrics (/metrics) and Mongo slow-query log; 0 disables the log
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    MONGO_SLOW_QUERY_MS = float(os.getenv("MONGO_SLOW_QUERY_MS", "100"))
+
+    # Read cache (memory, redis or none)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+    CACHE_TTL = float(os.getenv("CACHE_TTL", "60"))
+    CACHE_MAXSIZE = int(os.getenv("CACHE_MAXSIZE", "2048"))
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_REDIS_TIMEOUT = float(os.getenv("CACHE_REDIS_TIMEOUT", "0.5"))
     
     # MySQL
     MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
@@ -21,6 +54,11 @@ class Settings:
     MYSQL_USER = os.getenv("MYSQL_USER", "root")
     MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
     MYSQL_DB = os.getenv("MYSQL_DB", "sales_mysql")
+    MYSQL_ENABLED = os.getenv("MYSQL_ENABLED", "false").lower() == "true"
+    MYSQL_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "5"))
+    MYSQL_MAX_OVERFLOW = int(os.getenv("MYSQL_MAX_OVERFLOW", "10"))
+    MYSQL_POOL_RECYCLE = int(os.getenv("MYSQL_POOL_RECYCLE", "1800"))
+    MYSQL_POOL_TIMEOUT = int(os.getenv("MYSQL_POOL_TIMEOUT", "30"))
     
 
 settings = Settings()
\ No newline at end of file
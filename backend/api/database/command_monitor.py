@@ -0,0 +1,118 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+from pymongo import monitoring
+from api.config import settings
+from api.metrics import MONGO_COMMAND_DOCUMENTS, MONGO_COMMAND_DURATION, MONGO_COMMAND_FAILURES, MONGO_SLOW_COMMANDS
+
+logger = logging.getLogger(__name__)
+
+# Handshake and heartbeat traffic would drown the application commands
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "saslStart", "saslContinue", "endSessions", "buildInfo"}
+
+# Command fields whose shape goes in the slow log, and the write batches summarized by size
+SHAPE_FIELDS = ("filter", "query", "sort", "projection", "pipeline", "key", "update", "hint")
+BATCH_FIELDS = ("documents", "updates", "deletes")
+
+
+def command_collection(command_name: str, command: dict) -> str:
+    """Collection a command targets: the value of its first key, or 'collection' for getMore"""
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    value = command.get(command_name)
+    return value if isinstance(value, str) else ""
+
+
+def redact(value: Any, depth: int = 0) -> Any:
+    """Keys and operators of a filter/pipeline with every value replaced by '?'; lists keep
+    their first 3 elements, nesting stops at 5 levels"""
+    if isinstance(value, dict):
+        if depth >= 5:
+            return "{...}"
+        return {str(key): redact(item, depth + 1) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [redact(item, depth + 1) for item in value[:3]]
+        if len(value) > 3:
+            items.append(f"... {len(value) - 3} more")
+        return items
+    return "?"
+
+
+def command_shape(command_name: str, command: dict) -> dict:
+    """What the slow log shows of a command: no document contents and no full batches"""
+    shape = {}
+    for field in SHAPE_FIELDS:
+        # The first key names the collection (update: "ordenes"), not a document
+        if field in command and field != command_name:
+            shape[field] = redact(command[field])
+    for field in BATCH_FIELDS:
+        batch = command.get(field)
+        if isinstance(batch, list):
+            shape[field] = len(batch)
+            if batch and field != "documents":
+                # One update/delete statement is representative of the batch
+                shape[f"{field}[0]"] = redact(batch[0])
+    return shape
+
+
+def reply_documents(reply: dict) -> int:
+    """Documents in a cursor batch, or n for writes and counts"""
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        batch = cursor.get("firstBatch", cursor.get("nextBatch"))
+        if batch is not None:
+            return len(batch)
+    n = reply.get("n")
+    return n if isinstance(n, int) else 0
+
+
+class CommandStatsListener(monitoring.CommandListener):
+    """Records duration, documents and collection of every command; logs the ones over slow_ms"""
+
+    def __init__(self, slow_ms: float = None):
+        self.slow_ms = settings.MONGO_SLOW_QUERY_MS if slow_ms is None else slow_ms
+        # (connection, request id) -> (collection, command kept for the slow log)
+        self._pending: Dict[Tuple, Tuple[str, Optional[dict]]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        collection = command_collection(event.command_name, event.command)
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (collection, event.command if self.slow_ms > 0 else None)
+
+    def _finish(self, event) -> Optional[Tuple[str, Optional[dict]]]:
+        with self._lock:
+            return self._pending.pop((event.connection_id, event.request_id), None)
+
+    def succeeded(self, event):
+        pending = self._finish(event)
+        if pending is None:
+            return
+        collection, command = pending
+        seconds = event.duration_micros / 1e6
+        MONGO_COMMAND_DURATION.observe(seconds, event.command_name, collection)
+        documents = reply_documents(event.reply)
+        if documents:
+            MONGO_COMMAND_DOCUMENTS.inc(event.command_name, collection, amount=documents)
+        if self.slow_ms > 0 and seconds * 1000 >= self.slow_ms:
+            MONGO_SLOW_COMMANDS.inc(event.command_name, collection)
+            logger.warning(
+                "Slow MongoDB %s on %s (%.1f ms, %d docs): %s",
+                event.command_name, collection, seconds * 1000, documents, json.dumps(command_shape(event.command_name, command or {}))
+            )
+
+    def failed(self, event):
+        pending = self._finish(event)
+        if pending is None:
+            return
+        collection, _ = pending
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1e6, event.command_name, collection)
+        MONGO_COMMAND_FAILURES.inc(event.command_name, collection)
+
+
+def command_listeners() -> list:
+    """Listeners to register on new Mongo clients; none when metrics are off"""
+    return [CommandStatsListener()] if settings.METRICS_ENABLED else []
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+from typing import Dict, List
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from api.services.mongo.text_search import TEXT_INDEX, TEXT_INDEX_OPTIONS, build_search
+
+# Declarative registry of the indexes each collection needs; ensure_indexes applies it idempotently
+INDEXES: Dict[str, List[IndexModel]] = {
+    "clientes": [
+        IndexModel([("email", ASCENDING)], name="clientes_email_unique", unique=True),
+    ],
+    "productos": [
+        IndexModel([("categoria", ASCENDING)], name="productos_categoria"),
+        IndexModel([("codigo", ASCENDING)], name="productos_codigo_unique", unique=True),
+        IndexModel(TEXT_INDEX, **TEXT_INDEX_OPTIONS),
+        IndexModel([("search_terms", ASCENDING)], name="productos_search_terms"),
+        IndexModel([("nombre_norm", ASCENDING)], name="productos_nombre_norm"),
+    ],
+    "ordenes": [
+        # (cliente_id, _id) serves the equality + _id keyset sort of get_ordenes_by_cliente without a SORT stage
+        IndexModel([("cliente_id", ASCENDING), ("_id", ASCENDING)], name="ordenes_cliente"),
+        # (cliente_id, fecha, _id): one cliente's ordenes in date order (export with cliente_id and order)
+        IndexModel([("cliente_id", ASCENDING), ("fecha", ASCENDING), ("_id", ASCENDING)], name="ordenes_cliente_fecha"),
+        # (fecha, _id) also serves the keyset sort of the date range route
+        IndexModel([("fecha", ASCENDING), ("_id", ASCENDING)], name="ordenes_fecha"),
+        # High-water mark of the incremental ETL extractor (etl/extractors/mongo_ordenes.py)
+        IndexModel([("actualizado", ASCENDING), ("_id", ASCENDING)], name="ordenes_actualizado"),
+    ],
+    "agg_ventas": [
+        IndexModel([("anio", ASCENDING), ("mes", ASCENDING)], name="agg_ventas_periodo"),
+    ],
+}
+
+
+def ensure_indexes(db) -> dict:
+    """Create every registered index; failures (e.g. duplicates under a unique key) are reported, not raised"""
+    report = {}
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+        results = report[collection_name] = {}
+        for model in models:
+            name = model.document["name"]
+            try:
+                collection.create_indexes([model])
+                results[name] = "ok"
+            except OperationFailure as e:
+                results[name] = f"error: {e.details.get('errmsg', str(e)) if e.details else str(e)}"
+    return report
+
+
+def query_catalog(db) -> List[dict]:
+    """The queries issued by the Mongo services, filled with values sampled from the data"""
+    cliente = db.clientes.find_one({}, {"email": 1}) or {}
+    producto = db.productos.find_one({}, {"categoria": 1, "codigo": 1, "nombre": 1}) or {}
+    orden = db.ordenes.find_one({}, {"cliente_id": 1, "fecha": 1}) or {}
+    fecha = orden.get("fecha") if isinstance(orden.get("fecha"), datetime) else datetime(2024, 1, 1)
+    search_word = (producto.get("nombre") or "producto").split()[0]
+
+    catalog = [
+        ("clientes.get_clientes", "clientes", {}, [("_id", 1)]),
+        ("clientes.email", "clientes", {"email": cliente.get("email", "")}, None),
+        ("productos.get_productos", "productos", {}, [("_id", 1)]),
+        ("productos.get_productos_by_categoria", "productos", {"categoria": producto.get("categoria", "")}, None),
+        ("productos.codigo", "productos", {"codigo": producto.get("codigo", "")}, None),
+        ("ordenes.get_ordenes", "ordenes", {}, [("_id", 1)]),
+        ("ordenes.get_ordenes_by_cliente", "ordenes", {"cliente_id": orden.get("cliente_id", "")}, [("_id", 1)]),
+        (
+            "ordenes.get_ordenes_by_fecha", "ordenes",
+            {"fecha": {"$gte": fecha, "$lte": fecha + timedelta(days=30)}}, [("fecha", 1), ("_id", 1)]
+        ),
+        (
+            "ordenes.get_ordenes_by_fecha[desc]", "ordenes",
+            {"fecha": {"$gte": fecha, "$lte": fecha + timedelta(days=30)}}, [("fecha", -1), ("_id", -1)]
+        ),
+        (
+            "ordenes.export_ordenes[cliente]", "ordenes",
+            {"cliente_id": orden.get("cliente_id", "")}, [("fecha", 1), ("_id", 1)]
+        ),
+        ("ordenes.migrate_fecha", "ordenes", {"fecha": {"$type": "string"}}, None),
+    ]
+    for mode in ("text", "prefix", "regex"):
+        search_filter, _, sort = build_search(search_word, mode)
+        catalog.append((f"productos.search_productos[{mode}]", "productos", search_filter, sort))
+
+    return [
+        {"name": name, "collection": collection, "filter": filter_criteria, "sort": sort}
+        for name, collection, filter_criteria, sort in catalog
+    ]
+
+
+def _plan_stages(plan) -> List[str]:
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            stages.extend(_plan_stages(value))
+    return stages
+
+
+def explain_queries(db) -> List[dict]:
+    """Run explain() on every catalogued query and flag the ones answered by a collection scan"""
+    results = []
+    for query in query_catalog(db):
+        cursor = db[query["collection"]].find(query["filter"])
+        if query["sort"]:
+            cursor = cursor.sort(query["sort"])
+        try:
+            plan = cursor.limit(20).explain()
+        except OperationFailure as e:
+            results.append({"name": query["name"], "error": str(e)})
+            continue
+
+        stages = _plan_stages(plan.get("queryPlanner", {}).get("winningPlan", {}))
+        stats = plan.get("executionStats", {})
+        results.append({
+            "name": query["name"],
+            "collection": query["collection"],
+            "stages": stages,
+            "collscan": "COLLSCAN" in stages,
+            "in_memory_sort": "SORT" in stages,
+            "docs_examined": stats.get("totalDocsExamined"),
+        })
+    return results
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from motor.motor_asyncio import AsyncIOMotorClient
+from api.config import settings
+from api.database.mongo_connection import pool_options
+from api.database.pool_monitor import PoolStatsListener
+from api.database.command_monitor import command_listeners
+
+
+class AsyncMongoDBConnection:
+    _client = None
+    _db = None
+    pool_stats = PoolStatsListener()
+
+    @classmethod
+    def get_client(cls) -> AsyncIOMotorClient:
+        # Motor connects lazily, so creating the client never blocks the event loop
+        if cls._client is None:
+            cls._client = AsyncIOMotorClient(
+                settings.MONGO_URI,
+                event_listeners=[cls.pool_stats, *command_listeners()],
+                **pool_options()
+            )
+        return cls._client
+
+    @classmethod
+    def get_db(cls):
+        if cls._db is None:
+            cls._db = cls.get_client()[settings.MONGO_DB]
+        return cls._db
+
+    @classmethod
+    async def connect(cls, warmup: int = None):
+        """Open the client and pre-open `warmup` pooled connections with concurrent pings"""
+        warmup = settings.MONGO_WARMUP_CONNECTIONS if warmup is None else warmup
+        client = cls.get_client()
+        workers = min(max(warmup, 1), settings.MONGO_MAX_POOL_SIZE)
+        await asyncio.gather(*(client.admin.command("ping") for _ in range(workers)))
+        print(f"MongoDB (async) pool warmed up with {workers} connections")
+
+    @classmethod
+    async def ping(cls) -> float:
+        """Round trip of a ping in milliseconds"""
+        start = time.perf_counter()
+        await cls.get_client().admin.command("ping")
+        return (time.perf_counter() - start) * 1000
+
+    @classmethod
+    def close(cls):
+        if cls._client is not None:
+            cls._client.close()
+        cls._client = None
+        cls._db = None
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {"connected": cls._client is not None, "pools": cls.pool_stats.stats()}
+
+def get_async_clientes_collection():
+    return AsyncMongoDBConnection.get_db().clientes
+
+def get_async_productos_collection():
+    return AsyncMongoDBConnection.get_db().productos
+
+def get_async_ordenes_collection():
+    return AsyncMongoDBConnection.get_db().ordenes
+
+def get_async_agg_ventas_collection():
+    return AsyncMongoDBConnection.get_db().agg_ventas
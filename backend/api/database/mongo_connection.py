@@ -1,18 +1,43 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pymongo
 from api.config import settings
+from api.database.pool_monitor import PoolStatsListener
+from api.database.command_monitor import command_listeners
+from api.metrics import MONGO_CONNECTION_FAILURES
+
+def pool_options() -> dict:
+    """Connection pool and timeout options shared by the Mongo clients"""
+    return {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": settings.MONGO_SOCKET_TIMEOUT_MS,
+    }
 
 class MongoDBConnection:
     _client = None
     _db = None
+    pool_stats = PoolStatsListener()
     
     @classmethod
     def get_client(cls):
         if cls._client is None:
             try:
-                cls._client = pymongo.MongoClient(settings.MONGO_URI)
+                cls._client = pymongo.MongoClient(
+                    settings.MONGO_URI,
+                    event_listeners=[cls.pool_stats, *command_listeners()],
+                    **pool_options()
+                )
                 cls._client.admin.command('ping')
                 print("MongoDB connection successful")
             except Exception as e:
+                if cls._client is not None:
+                    cls._client.close()
+                cls._client = None
+                MONGO_CONNECTION_FAILURES.inc()
                 print(f"MongoDB connection failed: {e}")
                 raise
         return cls._client
@@ -24,6 +49,34 @@ class MongoDBConnection:
             cls._db = client[settings.MONGO_DB]
         return cls._db
 
+    @classmethod
+    def connect(cls, warmup: int = None):
+        """Open the client and pre-open `warmup` pooled connections with concurrent pings"""
+        warmup = settings.MONGO_WARMUP_CONNECTIONS if warmup is None else warmup
+        client = cls.get_client()
+        workers = min(max(warmup, 1), settings.MONGO_MAX_POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda _: client.admin.command('ping'), range(workers)))
+        print(f"MongoDB pool warmed up with {workers} connections")
+
+    @classmethod
+    def ping(cls) -> float:
+        """Round trip of a ping in milliseconds"""
+        start = time.perf_counter()
+        cls.get_client().admin.command('ping')
+        return (time.perf_counter() - start) * 1000
+
+    @classmethod
+    def close(cls):
+        if cls._client is not None:
+            cls._client.close()
+        cls._client = None
+        cls._db = None
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {"connected": cls._client is not None, "pools": cls.pool_stats.stats()}
+
 def get_clientes_collection():
     return MongoDBConnection.get_db().clientes
 
@@ -31,4 +84,7 @@ def get_productos_collection():
     return MongoDBConnection.get_db().productos
 
 def get_ordenes_collection():
-    return MongoDBConnection.get_db().ordenes
\ No newline at end of file
+    return MongoDBConnection.get_db().ordenes
+
+def get_agg_ventas_collection():
+    return MongoDBConnection.get_db().agg_ventas
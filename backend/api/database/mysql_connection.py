@@ -0,0 +1,65 @@
+import time
+from sqlalchemy import create_engine, text
+from api.config import settings
+
+
+class MySQLConnection:
+    """Pooled SQLAlchemy engine for the MySQL source, opened by the app lifespan when MYSQL_ENABLED"""
+    _engine = None
+
+    @classmethod
+    def get_engine(cls):
+        if cls._engine is None:
+            url = (
+                f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}"
+                f"@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DB}"
+            )
+            cls._engine = create_engine(
+                url,
+                pool_size=settings.MYSQL_POOL_SIZE,
+                max_overflow=settings.MYSQL_MAX_OVERFLOW,
+                pool_recycle=settings.MYSQL_POOL_RECYCLE,
+                pool_timeout=settings.MYSQL_POOL_TIMEOUT,
+                pool_pre_ping=True
+            )
+        return cls._engine
+
+    @classmethod
+    def connect(cls, warmup: int = None):
+        """Check out `warmup` connections at once so the pool is full before traffic arrives"""
+        warmup = settings.MYSQL_POOL_SIZE if warmup is None else warmup
+        engine = cls.get_engine()
+        connections = [engine.connect() for _ in range(max(warmup, 1))]
+        try:
+            for connection in connections:
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()
+        print(f"MySQL pool warmed up with {len(connections)} connections")
+
+    @classmethod
+    def ping(cls) -> float:
+        start = time.perf_counter()
+        with cls.get_engine().connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return (time.perf_counter() - start) * 1000
+
+    @classmethod
+    def close(cls):
+        if cls._engine is not None:
+            cls._engine.dispose()
+        cls._engine = None
+
+    @classmethod
+    def stats(cls) -> dict:
+        if cls._engine is None:
+            return {"connected": False}
+        pool = cls._engine.pool
+        return {
+            "connected": True,
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
@@ -0,0 +1,64 @@
+import threading
+from collections import defaultdict
+from pymongo import monitoring
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Counts connection pool events per server so /health can report pool usage"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers = defaultdict(lambda: defaultdict(int))
+
+    def _incr(self, event, key: str, amount: int = 1):
+        address = "%s:%s" % event.address
+        with self._lock:
+            self._servers[address][key] += amount
+
+    def pool_created(self, event):
+        self._incr(event, "pools_created")
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._incr(event, "pools_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._incr(event, "created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._incr(event, "closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._incr(event, "checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._incr(event, "checked_out")
+
+    def connection_checked_in(self, event):
+        self._incr(event, "checked_in")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                address: {
+                    "open": counts["created"] - counts["closed"],
+                    "in_use": counts["checked_out"] - counts["checked_in"],
+                    "created": counts["created"],
+                    "closed": counts["closed"],
+                    "checkouts": counts["checked_out"],
+                    "checkout_failures": counts["checkout_failures"],
+                    "pools_cleared": counts["pools_cleared"],
+                }
+                for address, counts in self._servers.items()
+            }
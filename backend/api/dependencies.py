@@ -1,7 +1,12 @@
-from api.database.mongo_connection import get_clientes_collection, get_productos_collection, get_ordenes_collection
+from api.database.mongo_connection import get_clientes_collection, get_productos_collection, get_ordenes_collection, get_agg_ventas_collection
 from api.services.mongo.clientes_service import ClienteService
 from api.services.mongo.ordenes_service import OrdenService
 from api.services.mongo.productos_service import ProductoService
+from api.services.mongo.ventas_aggregates import VentasAggregates
+from api.database.mongo_async_connection import get_async_clientes_collection, get_async_productos_collection, get_async_ordenes_collection, get_async_agg_ventas_collection
+from api.services.mongo_async.clientes_service import AsyncClienteService
+from api.services.mongo_async.ordenes_service import AsyncOrdenService
+from api.services.mongo_async.productos_service import AsyncProductoService
 
 def get_mongo_clientes_service() -> ClienteService:
     return ClienteService(get_clientes_collection())
@@ -10,7 +15,20 @@ def get_mongo_productos_service() -> ProductoService:
     return ProductoService(get_productos_collection())
 
 def get_mongo_ordenes_service() -> OrdenService:
-    return OrdenService(get_ordenes_collection())
+    return OrdenService(get_ordenes_collection(), VentasAggregates(get_agg_ventas_collection()))
+
+def get_mongo_ventas_aggregates() -> VentasAggregates:
+    return VentasAggregates(get_agg_ventas_collection())
+
+# Async (Motor) MongoDB dependencies
+async def get_mongo_async_clientes_service() -> AsyncClienteService:
+    return AsyncClienteService(get_async_clientes_collection())
+
+async def get_mongo_async_productos_service() -> AsyncProductoService:
+    return AsyncProductoService(get_async_productos_collection())
+
+async def get_mongo_async_ordenes_service() -> AsyncOrdenService:
+    return AsyncOrdenService(get_async_ordenes_collection(), VentasAggregates(get_async_agg_ventas_collection()))
 
 # MSSQL dependencies
 
@@ -0,0 +1,23 @@
+"""Ensure the registered indexes and fill nombre_norm/search_terms on existing documents.
+
+Usage (from backend/): python -m api.jobs.backfill_producto_search [--batch-size N]
+"""
+import argparse
+from api.database.indexes import ensure_indexes
+from api.database.mongo_connection import MongoDBConnection, get_productos_collection
+from api.services.mongo.productos_service import ProductoService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill producto search fields")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per bulk write")
+    args = parser.parse_args()
+
+    print(ensure_indexes(MongoDBConnection.get_db())["productos"])
+    service = ProductoService(get_productos_collection())
+    updated = service.backfill_search_fields(batch_size=args.batch_size)
+    print(f"Backfilled search fields on {updated} productos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Verify stored ordenes totals against their items.
+
+Usage (from backend/): python -m api.jobs.check_orden_totals [--batch-size N] [--fix]
+"""
+import argparse
+import json
+from api.database.mongo_connection import get_ordenes_collection
+from api.services.mongo.ordenes_service import OrdenService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check (and optionally repair) stored ordenes totals")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per cursor batch and per bulk write")
+    parser.add_argument("--fix", action="store_true", help="Rewrite total/total_usd where they drifted")
+    args = parser.parse_args()
+
+    report = OrdenService(get_ordenes_collection()).check_totals(batch_size=args.batch_size, fix=args.fix)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Convert ordenes fecha values stored as strings into BSON dates.
+
+Usage (from backend/): python -m api.jobs.migrate_orden_fecha [--batch-size N] [--dry-run]
+Safe to rerun: only string values are read, and each update matches the value it replaces.
+Unparseable values are reported (sample of _ids) and left for a manual fix.
+"""
+import argparse
+import json
+from api.database.indexes import ensure_indexes
+from api.database.mongo_connection import MongoDBConnection, get_ordenes_collection
+from api.services.mongo.ordenes_service import OrdenService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate ordenes fecha strings to BSON dates")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per cursor batch and per bulk write")
+    parser.add_argument("--dry-run", action="store_true", help="Only count convertible and unparseable values")
+    args = parser.parse_args()
+
+    # The string scan and the range route both walk ordenes_fecha
+    ensure_indexes(MongoDBConnection.get_db())
+    report = OrdenService(get_ordenes_collection()).migrate_fecha(batch_size=args.batch_size, dry_run=args.dry_run)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
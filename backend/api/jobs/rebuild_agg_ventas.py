@@ -0,0 +1,22 @@
+"""Rebuild the agg_ventas monthly buckets from the ordenes collection.
+
+Run once after deploying the aggregates (ordenes written before them are not folded in),
+or to repair drift. Usage (from backend/): python -m api.jobs.rebuild_agg_ventas [--batch-size N]
+"""
+import argparse
+import json
+from api.database.mongo_connection import get_agg_ventas_collection, get_ordenes_collection
+from api.services.mongo.ventas_aggregates import VentasAggregates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute agg_ventas from ordenes")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per cursor batch and per insert")
+    args = parser.parse_args()
+
+    report = VentasAggregates(get_agg_ventas_collection()).rebuild(get_ordenes_collection(), batch_size=args.batch_size)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,49 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 #from api.routers import mysql_routes, supabase_routes, mongo_routes, neo4j_routes, dw_routes
-from api.routers import mongo_routes
+from api.routers import mongo_routes, mongo_async_routes, health_routes, admin_routes
 from api.config import settings
+from api.database.mongo_connection import MongoDBConnection
+from api.database.indexes import ensure_indexes
+from api.database.mongo_async_connection import AsyncMongoDBConnection
+from api.database.mysql_connection import MySQLConnection
+from api.metrics import MetricsMiddleware
+
+
+async def _warm_up(name: str, connect):
+    # A database that is down must not keep the API from starting; /health reports it
+    try:
+        await connect()
+    except Exception as e:
+        print(f"{name} warm-up failed: {e}")
+
+def _ensure_mongo_indexes():
+    for collection, results in ensure_indexes(MongoDBConnection.get_db()).items():
+        for name, result in results.items():
+            if result != "ok":
+                print(f"MongoDB index {collection}.{name}: {result}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await _warm_up("MongoDB", lambda: run_in_threadpool(MongoDBConnection.connect))
+    if settings.MONGO_ENSURE_INDEXES:
+        await _warm_up("MongoDB indexes", lambda: run_in_threadpool(_ensure_mongo_indexes))
+    await _warm_up("MongoDB (async)", AsyncMongoDBConnection.connect)
+    if settings.MYSQL_ENABLED:
+        await _warm_up("MySQL", lambda: run_in_threadpool(MySQLConnection.connect))
+    yield
+    MongoDBConnection.close()
+    AsyncMongoDBConnection.close()
+    MySQLConnection.close()
 
 
 app = FastAPI(
     title="Multi-Database API",
     description="API with some databases...",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -18,11 +53,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 # Register routes
+app.include_router(health_routes.router, tags=["Health"])
+if settings.ADMIN_ROUTES_ENABLED:
+    app.include_router(admin_routes.router, prefix="/admin", tags=["Admin"])
 # app.include_router(mysql_routes.router, prefix="/mysql", tags=["MySQL"])
 # app.include_router(supabase_routes.router, prefix="/supabase", tags=["Supabase"])
 app.include_router(mongo_routes.router, prefix="/mongo", tags=["MongoDB"])
+app.include_router(mongo_async_routes.router, prefix="/mongo-async", tags=["MongoDB (async)"])
 # app.include_router(neo4j_routes.router, prefix="/neo4j", tags=["Neo4j"])
 # app.include_router(dw_routes.router, prefix="/dw", tags=["DataWarehouse"])
 
@@ -0,0 +1,162 @@
+"""In-process metrics rendered in the Prometheus text format at /metrics.
+
+Histograms and counters are labelled series guarded by one lock per metric. Nothing here
+runs unless settings.METRICS_ENABLED is on: main.py only installs MetricsMiddleware and the
+Mongo clients only register the command listener when it is.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Seconds; covers a sub-millisecond cache hit up to a 10 s export
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labels, labels)} {value:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self) -> Dict[tuple, Tuple[List[int], float, int]]:
+        with self._lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self.snapshot().items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound:g}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labels, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_labels(self.labels, labels)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Request latency by route template", ("method", "route", "status")
+))
+MONGO_COMMAND_DURATION = REGISTRY.register(Histogram(
+    "mongo_command_duration_seconds", "MongoDB command latency", ("command", "collection")
+))
+MONGO_COMMAND_DOCUMENTS = REGISTRY.register(Counter(
+    "mongo_command_documents_total", "Documents returned (cursor batches) or affected (n) by MongoDB commands", ("command", "collection")
+))
+MONGO_COMMAND_FAILURES = REGISTRY.register(Counter(
+    "mongo_command_failures_total", "MongoDB commands that failed", ("command", "collection")
+))
+MONGO_SLOW_COMMANDS = REGISTRY.register(Counter(
+    "mongo_slow_commands_total", "MongoDB commands slower than MONGO_SLOW_QUERY_MS", ("command", "collection")
+))
+AGG_VENTAS_FOLD_FAILURES = REGISTRY.register(Counter(
+    "agg_ventas_fold_failures_total", "agg_ventas folds that failed after the orden write committed; python -m api.jobs.rebuild_agg_ventas repairs them", ("operation",)
+))
+MONGO_CONNECTION_FAILURES = REGISTRY.register(Counter(
+    "mongo_connection_failures_total", "Failed attempts to open the MongoDB client"
+))
+
+
+def route_template(scope) -> str:
+    """Matched route path with the include prefixes, e.g. /mongo/productos/{producto_id}"""
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    path = scope["path"]
+    regex = getattr(route, "path_regex", None)
+    if regex is None or regex.match(path):
+        return route.path
+    # Recent FastAPI keeps the router's own route (without the include prefix) in the scope
+    for index, char in enumerate(path):
+        if char == "/" and regex.match(path[index:]):
+            return path[:index] + route.path
+    return route.path
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request under its route template (not the raw path)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, scope["method"], route_template(scope), status[0])
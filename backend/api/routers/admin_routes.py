@@ -0,0 +1,64 @@
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from api.config import settings
+from api.database.indexes import ensure_indexes, explain_queries
+from api.database.mongo_connection import MongoDBConnection, get_agg_ventas_collection, get_ordenes_collection
+from api.services.mongo.ventas_aggregates import VentasAggregates
+from api.services.cache import ReadCache
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """Admin routes are expensive or destructive: require the configured token"""
+    if not settings.ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin token required")
+
+# Mounted only when ADMIN_ROUTES_ENABLED (api/main.py)
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+@router.get("/mongo/explain", response_model=dict)
+def explain_mongo_queries():
+    """explain() every service query and flag collection scans"""
+    try:
+        results = explain_queries(MongoDBConnection.get_db())
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error explaining queries: {str(e)}"
+        )
+    return {
+        "queries": results,
+        "collscans": [result["name"] for result in results if result.get("collscan")]
+    }
+
+@router.post("/mongo/indexes", response_model=dict)
+def ensure_mongo_indexes():
+    """Re-apply the index registry and report the outcome per index"""
+    try:
+        return ensure_indexes(MongoDBConnection.get_db())
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error ensuring indexes: {str(e)}"
+        )
+
+@router.post("/mongo/agg-ventas/rebuild", response_model=dict)
+def rebuild_agg_ventas():
+    """Recompute the monthly sales buckets from every orden"""
+    try:
+        return VentasAggregates(get_agg_ventas_collection()).rebuild(get_ordenes_collection())
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error rebuilding agg_ventas: {str(e)}"
+        )
+
+@router.get("/cache", response_model=dict)
+def get_cache_stats():
+    """Read cache backend, size and per-namespace hit/miss counters"""
+    return ReadCache.report()
+
+@router.post("/cache/clear", response_model=dict)
+def clear_cache():
+    """Drop every cached read"""
+    ReadCache.invalidate_all()
+    return ReadCache.report()
@@ -0,0 +1,30 @@
+import hashlib
+from typing import Any
+from fastapi import Request, Response, status
+from api.routers.json_response import BSONJSONResponse, dumps
+
+
+def compute_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def with_etag(request: Request, value: Any) -> Response:
+    """Serialize value once, tag it with an ETag over the body, or answer 304 when the client already holds it"""
+    body = dumps(value)
+    etag = compute_etag(body)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type=BSONJSONResponse.media_type, headers={"ETag": etag})
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Response, status
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from api.config import settings
+from api.database.mongo_connection import MongoDBConnection
+from api.database.mongo_async_connection import AsyncMongoDBConnection
+from api.database.mysql_connection import MySQLConnection
+from api.metrics import REGISTRY
+
+router = APIRouter()
+
+async def _check(ping, stats: dict) -> dict:
+    try:
+        return {"status": "up", "ping_ms": round(await ping(), 2), **stats}
+    except Exception as e:
+        return {"status": "down", "error": str(e), **stats}
+
+@router.get("/health")
+async def health(response: Response):
+    """Liveness of each configured database plus its connection pool statistics"""
+    checks = {
+        "mongo": await _check(
+            lambda: run_in_threadpool(MongoDBConnection.ping), MongoDBConnection.stats()
+        ),
+        "mongo_async": await _check(AsyncMongoDBConnection.ping, AsyncMongoDBConnection.stats()),
+    }
+    if settings.MYSQL_ENABLED:
+        checks["mysql"] = await _check(
+            lambda: run_in_threadpool(MySQLConnection.ping), MySQLConnection.stats()
+        )
+
+    healthy = all(check["status"] == "up" for check in checks.values())
+    if not healthy:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": "ok" if healthy else "degraded", "databases": checks}
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Request and MongoDB command metrics in the Prometheus text format"""
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("# metrics disabled (METRICS_ENABLED=false)\n", status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,38 @@
+"""One-pass JSON responses for Mongo documents.
+
+Routes that return BSONJSONResponse skip FastAPI's response_model validation and
+jsonable_encoder walk: the helper dict is encoded straight to bytes by orjson, and the BSON
+types it cannot encode natively go through bson_default. response_model stays on the
+decorators for the OpenAPI schema.
+"""
+import base64
+from decimal import Decimal
+from typing import Any
+import orjson
+from bson import Decimal128, ObjectId, Timestamp
+from fastapi.responses import JSONResponse
+
+
+def bson_default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal128):
+        return float(value.to_decimal())
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Timestamp):
+        return value.as_datetime()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=bson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class BSONJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,73 @@
+import json
+from typing import AsyncIterator, Callable, List, Tuple
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from api.services.mongo.bulk import IndexedRow, merge_bulk_results, new_bulk_result, row_error
+
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def _is_ndjson(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type in NDJSON_TYPES
+
+
+async def _ndjson_rows(request: Request) -> AsyncIterator[Tuple[int, object, str]]:
+    """Parse an NDJSON body line by line as it streams in"""
+    index = 0
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _parse_line(index, line)
+                index += 1
+    if buffer.strip():
+        yield _parse_line(index, buffer)
+
+
+def _parse_line(index: int, line: bytes) -> Tuple[int, object, str]:
+    try:
+        return index, json.loads(line), None
+    except ValueError as e:
+        return index, None, f"Invalid JSON: {e}"
+
+
+async def iter_bulk_chunks(request: Request, chunk_size: int) -> AsyncIterator[Tuple[List[IndexedRow], List[dict]]]:
+    """Yield (rows, parse_errors) chunks from a JSON array body or an NDJSON stream"""
+    if _is_ndjson(request):
+        rows, errors = [], []
+        async for index, row, error in _ndjson_rows(request):
+            if error:
+                errors.append(row_error(index, error))
+            else:
+                rows.append((index, row))
+            if len(rows) + len(errors) >= chunk_size:
+                yield rows, errors
+                rows, errors = [], []
+        if rows or errors:
+            yield rows, errors
+        return
+
+    try:
+        data = json.loads(await request.body())
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON body: {e}")
+    if not isinstance(data, list):
+        raise ValueError("Expected a JSON array or an NDJSON body")
+
+    for start in range(0, len(data), chunk_size):
+        yield list(enumerate(data[start:start + chunk_size], start)), []
+
+
+async def run_bulk(request: Request, chunk_size: int, write_chunk: Callable[[List[IndexedRow]], dict]) -> dict:
+    """Feed each chunk to a (sync) service writer in the threadpool and merge the results"""
+    result = new_bulk_result()
+    async for rows, parse_errors in iter_bulk_chunks(request, chunk_size):
+        part = await run_in_threadpool(write_chunk, rows) if rows else new_bulk_result()
+        part["received"] += len(parse_errors)
+        part["errors"] = parse_errors + part["errors"]
+        merge_bulk_results(result, part)
+    result["errors"].sort(key=lambda err: err["index"])
+    return result
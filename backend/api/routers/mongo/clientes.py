@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from typing import Optional
 from api.services.mongo.clientes_service import ClienteService
 from api.schemas.mongo import ClienteResponse
+from api.config import settings
 from api.dependencies import get_mongo_clientes_service
+from api.routers.etag import with_etag
+from api.services.mongo.batch_loader import split_ids
 from api.schemas.froms import ClienteFormData
+from api.routers.mongo.bulk_body import run_bulk
 
 router = APIRouter(prefix="/clientes", tags=["mongo-clientes"])
 
@@ -19,14 +24,40 @@ def create_cliente(
             detail=f"Error creating cliente: {str(e)}"
         )
 
+@router.post("/bulk", response_model=dict)
+async def bulk_create_clientes(
+    request: Request,
+    chunk_size: int = Query(settings.MONGO_BULK_CHUNK_SIZE, ge=1, le=10000, description="Rows validated and written per batch"),
+    upsert: bool = Query(False, description="Upsert on email instead of inserting"),
+    service: ClienteService = Depends(get_mongo_clientes_service)
+):
+    """Create many clientes from a JSON array or an NDJSON stream (application/x-ndjson)"""
+    try:
+        return await run_bulk(request, chunk_size, lambda rows: service.bulk_create_clientes(rows, upsert=upsert))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error bulk creating clientes: {str(e)}"
+        )
+
 @router.get("/", response_model=dict)
 def get_clientes(
+    request: Request,
     page: int = 1, 
     limit: int = 20,
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    ids: Optional[str] = Query(None, description="Comma-separated cliente ids; returns just those, fetched with one $in"),
     service: ClienteService = Depends(get_mongo_clientes_service)
 ):
     try:
-        return service.get_clientes(page=page, limit=limit)
+        if ids is not None:
+            return with_etag(request, service.get_clientes_by_ids(split_ids(ids)))
+        return with_etag(request, service.get_clientes(page=page, limit=limit, cursor=cursor, include_total=total))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -36,12 +67,13 @@ def get_clientes(
 @router.get("/{cliente_id}", response_model=ClienteResponse)
 def get_cliente(
     cliente_id: str,
+    request: Request,
     service: ClienteService = Depends(get_mongo_clientes_service)
 ):
     cliente = service.get_cliente_by_id(cliente_id)
     if not cliente:
         raise HTTPException(status_code=404, detail="Cliente not found")
-    return cliente
+    return with_etag(request, cliente)
 
 @router.patch("/{cliente_id}", response_model=ClienteResponse)
 def update_cliente(
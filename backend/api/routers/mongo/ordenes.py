@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
+from fastapi.responses import StreamingResponse
 from api.services.mongo.ordenes_service import OrdenService
 from api.schemas.mongo import OrdenResponse
+from api.config import settings
 from api.dependencies import get_mongo_ordenes_service
+from api.routers.json_response import BSONJSONResponse
 from api.schemas.froms import OrdenFormData
+from api.routers.mongo.bulk_body import run_bulk
 
 router = APIRouter(prefix="/ordenes", tags=["mongo-ordenes"])
 
@@ -21,14 +25,42 @@ def create_orden(
             detail=f"Error creating orden: {str(e)}"
         )
 
+@router.post("/bulk", response_model=dict)
+async def bulk_create_ordenes(
+    request: Request,
+    chunk_size: int = Query(settings.MONGO_BULK_CHUNK_SIZE, ge=1, le=10000, description="Rows validated and written per batch"),
+    service: OrdenService = Depends(get_mongo_ordenes_service)
+):
+    """Create many ordenes from a JSON array or an NDJSON stream (application/x-ndjson)"""
+    try:
+        return await run_bulk(request, chunk_size, service.bulk_create_ordenes)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error bulk creating ordenes: {str(e)}"
+        )
+
 @router.get("/", response_model=dict)
 def get_ordenes(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    expand: Optional[str] = Query(None, description="Comma-separated related documents to join in: cliente, productos"),
     service: OrdenService = Depends(get_mongo_ordenes_service)
 ):
     try:
-        return service.get_ordenes(page=page, limit=limit)
+        return BSONJSONResponse(service.get_ordenes(
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=total,
+            expand=[name.strip() for name in expand.split(",") if name.strip()] if expand else []
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -40,10 +72,14 @@ def get_ordenes_by_cliente(
     cliente_id: str,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
     service: OrdenService = Depends(get_mongo_ordenes_service)
 ):
     try:
-        return service.get_ordenes_by_cliente(cliente_id=cliente_id, page=page, limit=limit)
+        return BSONJSONResponse(service.get_ordenes_by_cliente(cliente_id=cliente_id, page=page, limit=limit, cursor=cursor, include_total=total))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -56,27 +92,75 @@ def get_ordenes_by_fecha(
     fecha_fin: datetime = Query(..., description="End date (YYYY-MM-DD)"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    order: Literal["asc", "desc"] = Query("asc", description="Sort on (fecha, _id), served by the ordenes_fecha index"),
     service: OrdenService = Depends(get_mongo_ordenes_service)
 ):
     try:
-        return service.get_ordenes_by_fecha(
+        return BSONJSONResponse(service.get_ordenes_by_fecha(
             fecha_inicio=fecha_inicio,
             fecha_fin=fecha_fin,
             page=page,
-            limit=limit
-        )
+            limit=limit,
+            cursor=cursor,
+            include_total=total,
+            order=order
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error fetching ordenes by date range: {str(e)}"
         )
 
+@router.get("/export")
+def export_ordenes(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson: one orden per line, csv: one row per item"),
+    fecha_inicio: Optional[datetime] = Query(None, description="Start date (YYYY-MM-DD)"),
+    fecha_fin: Optional[datetime] = Query(None, description="End date (YYYY-MM-DD)"),
+    cliente_id: Optional[str] = Query(None, description="Only ordenes of this cliente"),
+    batch_size: int = Query(1000, ge=1, le=50000, description="Cursor batch size and rows per streamed chunk"),
+    order: Optional[Literal["asc", "desc"]] = Query(None, description="Stream in (fecha, _id) order on the ordenes_fecha index; unsorted when omitted"),
+    service: OrdenService = Depends(get_mongo_ordenes_service)
+):
+    try:
+        chunks = service.export_ordenes(
+            format=format,
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            cliente_id=cliente_id,
+            batch_size=batch_size,
+            order=order
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error exporting ordenes: {str(e)}"
+        )
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=ordenes.{format}"}
+    )
+
 @router.get("/stats", response_model=dict)
 def get_ordenes_stats(
+    fecha_inicio: Optional[datetime] = Query(None, description="Start date (YYYY-MM-DD), day granularity"),
+    fecha_fin: Optional[datetime] = Query(None, description="End date (YYYY-MM-DD), inclusive"),
+    group_by: Optional[str] = Query(None, description="Comma-separated breakdown: canal, moneda, dia, mes, anio"),
     service: OrdenService = Depends(get_mongo_ordenes_service)
 ):
     try:
-        return service.get_ordenes_stats()
+        return service.get_ordenes_stats(
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            group_by=[name.strip() for name in group_by.split(",") if name.strip()] if group_by else []
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,7 +175,7 @@ def get_orden(
     orden = service.get_orden_by_id(orden_id)
     if not orden:
         raise HTTPException(status_code=404, detail="Orden not found")
-    return orden
+    return BSONJSONResponse(orden)
 
 @router.patch("/{orden_id}", response_model=OrdenResponse)
 def update_orden(
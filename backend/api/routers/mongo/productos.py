@@ -1,10 +1,15 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from api.services.mongo.productos_service import ProductoService
 from api.schemas.mongo import ProductoResponse
+from api.config import settings
 from api.dependencies import get_mongo_productos_service
+from api.routers.etag import with_etag
+from api.services.mongo.batch_loader import split_ids
+from api.routers.json_response import BSONJSONResponse
 from api.schemas.froms import ProductoFormData
+from api.routers.mongo.bulk_body import run_bulk
 
 router = APIRouter(prefix="/productos", tags=["mongo-productos"])
 
@@ -21,14 +26,40 @@ def create_producto(
             detail=f"Error creating producto: {str(e)}"
         )
 
+@router.post("/bulk", response_model=dict)
+async def bulk_create_productos(
+    request: Request,
+    chunk_size: int = Query(settings.MONGO_BULK_CHUNK_SIZE, ge=1, le=10000, description="Rows validated and written per batch"),
+    upsert: bool = Query(False, description="Upsert on codigo instead of inserting"),
+    service: ProductoService = Depends(get_mongo_productos_service)
+):
+    """Create many productos from a JSON array or an NDJSON stream (application/x-ndjson)"""
+    try:
+        return await run_bulk(request, chunk_size, lambda rows: service.bulk_create_productos(rows, upsert=upsert))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error bulk creating productos: {str(e)}"
+        )
+
 @router.get("/", response_model=dict)
 def get_productos(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    ids: Optional[str] = Query(None, description="Comma-separated producto ids; returns just those, fetched with one $in"),
     service: ProductoService = Depends(get_mongo_productos_service)
 ):
     try:
-        return service.get_productos(page=page, limit=limit)
+        if ids is not None:
+            return with_etag(request, service.get_productos_by_ids(split_ids(ids)))
+        return with_etag(request, service.get_productos(page=page, limit=limit, cursor=cursor, include_total=total))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -37,13 +68,15 @@ def get_productos(
 
 @router.get("/search", response_model=dict)
 def search_productos(
-    query: str = Query(..., description="Search term for name or category"),
+    query: str = Query(..., min_length=1, description="Search term for name or category"),
+    mode: Literal["text", "prefix", "regex"] = Query("text", description="text: ranked full-text, prefix: autocomplete on word prefixes, regex: substring scan"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
     service: ProductoService = Depends(get_mongo_productos_service)
 ):
     try:
-        return service.search_productos(query=query, page=page, limit=limit)
+        return BSONJSONResponse(service.search_productos(query=query, page=page, limit=limit, include_total=total, mode=mode))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -53,12 +86,14 @@ def search_productos(
 @router.get("/categoria/{categoria}", response_model=dict)
 def get_productos_by_categoria(
     categoria: str,
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
     service: ProductoService = Depends(get_mongo_productos_service)
 ):
     try:
-        return service.get_productos_by_categoria(categoria=categoria, page=page, limit=limit)
+        return with_etag(request, service.get_productos_by_categoria(categoria=categoria, page=page, limit=limit, include_total=total))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -68,12 +103,13 @@ def get_productos_by_categoria(
 @router.get("/{producto_id}", response_model=ProductoResponse)
 def get_producto(
     producto_id: str,
+    request: Request,
     service: ProductoService = Depends(get_mongo_productos_service)
 ):
     producto = service.get_producto_by_id(producto_id)
     if not producto:
         raise HTTPException(status_code=404, detail="Producto not found")
-    return producto
+    return with_etag(request, producto)
 
 @router.patch("/{producto_id}", response_model=ProductoResponse)
 def update_producto(
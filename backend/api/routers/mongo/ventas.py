@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from typing import Optional
+from api.services.mongo.ventas_aggregates import VentasAggregates
+from api.dependencies import get_mongo_ventas_aggregates
+
+router = APIRouter(prefix="/ventas", tags=["mongo-ventas"])
+
+@router.get("/agregados", response_model=list)
+def get_ventas_agregados(
+    anio: Optional[int] = Query(None, ge=1900, le=9999, description="Year"),
+    mes: Optional[int] = Query(None, ge=1, le=12, description="Month (1-12)"),
+    aggregates: VentasAggregates = Depends(get_mongo_ventas_aggregates)
+):
+    """Monthly USD sales per producto in the AGG_VENTAS_USD shape, read from the maintained buckets"""
+    try:
+        return aggregates.monthly(anio=anio, mes=mes)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching ventas agregados: {str(e)}"
+        )
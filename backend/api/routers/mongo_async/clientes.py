@@ -0,0 +1,76 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from typing import Optional
+from api.services.mongo_async.clientes_service import AsyncClienteService
+from api.schemas.mongo import ClienteResponse
+from api.dependencies import get_mongo_async_clientes_service
+from api.routers.etag import with_etag
+from api.services.mongo.batch_loader import split_ids
+from api.schemas.froms import ClienteFormData
+
+router = APIRouter(prefix="/clientes", tags=["mongo-async-clientes"])
+
+@router.post("/", response_model=ClienteResponse)
+async def create_cliente(
+    cliente: ClienteFormData,
+    service: AsyncClienteService = Depends(get_mongo_async_clientes_service)
+):
+    try:
+        return await service.create_cliente(cliente)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating cliente: {str(e)}"
+        )
+
+@router.get("/", response_model=dict)
+async def get_clientes(
+    request: Request,
+    page: int = 1, 
+    limit: int = 20,
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    ids: Optional[str] = Query(None, description="Comma-separated cliente ids; returns just those, fetched with one $in"),
+    service: AsyncClienteService = Depends(get_mongo_async_clientes_service)
+):
+    try:
+        if ids is not None:
+            return with_etag(request, await service.get_clientes_by_ids(split_ids(ids)))
+        return with_etag(request, await service.get_clientes(page=page, limit=limit, cursor=cursor, include_total=total))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching clientes: {str(e)}"
+        )
+
+@router.get("/{cliente_id}", response_model=ClienteResponse)
+async def get_cliente(
+    cliente_id: str,
+    request: Request,
+    service: AsyncClienteService = Depends(get_mongo_async_clientes_service)
+):
+    cliente = await service.get_cliente_by_id(cliente_id)
+    if not cliente:
+        raise HTTPException(status_code=404, detail="Cliente not found")
+    return with_etag(request, cliente)
+
+@router.patch("/{cliente_id}", response_model=ClienteResponse)
+async def update_cliente(
+    cliente_id: str,
+    cliente_update: ClienteFormData,
+    service: AsyncClienteService = Depends(get_mongo_async_clientes_service)
+):
+    updated_cliente = await service.update_cliente(cliente_id, cliente_update)
+    if not updated_cliente:
+        raise HTTPException(status_code=404, detail="Cliente not found")
+    return updated_cliente
+
+@router.delete("/{cliente_id}")
+async def delete_cliente(
+    cliente_id: str,
+    service: AsyncClienteService = Depends(get_mongo_async_clientes_service)
+):
+    if not await service.delete_cliente(cliente_id):
+        raise HTTPException(status_code=404, detail="Cliente not found")
+    return {"message": "Cliente deleted successfully"}
\ No newline at end of file
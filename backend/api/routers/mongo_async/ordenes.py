@@ -0,0 +1,147 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from datetime import datetime
+from typing import Literal, Optional
+from api.services.mongo_async.ordenes_service import AsyncOrdenService
+from api.schemas.mongo import OrdenResponse
+from api.dependencies import get_mongo_async_ordenes_service
+from api.routers.json_response import BSONJSONResponse
+from api.schemas.froms import OrdenFormData
+
+router = APIRouter(prefix="/ordenes", tags=["mongo-async-ordenes"])
+
+@router.post("/", response_model=OrdenResponse)
+async def create_orden(
+    orden: OrdenFormData,
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    try:
+        return await service.create_orden(orden)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating orden: {str(e)}"
+        )
+
+@router.get("/", response_model=dict)
+async def get_ordenes(
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    expand: Optional[str] = Query(None, description="Comma-separated related documents to join in: cliente, productos"),
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    try:
+        return BSONJSONResponse(await service.get_ordenes(
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=total,
+            expand=[name.strip() for name in expand.split(",") if name.strip()] if expand else []
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching ordenes: {str(e)}"
+        )
+
+@router.get("/cliente/{cliente_id}", response_model=dict)
+async def get_ordenes_by_cliente(
+    cliente_id: str,
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    try:
+        return BSONJSONResponse(await service.get_ordenes_by_cliente(cliente_id=cliente_id, page=page, limit=limit, cursor=cursor, include_total=total))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching ordenes by cliente: {str(e)}"
+        )
+
+@router.get("/fecha", response_model=dict)
+async def get_ordenes_by_fecha(
+    fecha_inicio: datetime = Query(..., description="Start date (YYYY-MM-DD)"),
+    fecha_fin: datetime = Query(..., description="End date (YYYY-MM-DD)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    order: Literal["asc", "desc"] = Query("asc", description="Sort on (fecha, _id), served by the ordenes_fecha index"),
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    try:
+        return BSONJSONResponse(await service.get_ordenes_by_fecha(
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=total,
+            order=order
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching ordenes by date range: {str(e)}"
+        )
+
+@router.get("/stats", response_model=dict)
+async def get_ordenes_stats(
+    fecha_inicio: Optional[datetime] = Query(None, description="Start date (YYYY-MM-DD), day granularity"),
+    fecha_fin: Optional[datetime] = Query(None, description="End date (YYYY-MM-DD), inclusive"),
+    group_by: Optional[str] = Query(None, description="Comma-separated breakdown: canal, moneda, dia, mes, anio"),
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    try:
+        return await service.get_ordenes_stats(
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            group_by=[name.strip() for name in group_by.split(",") if name.strip()] if group_by else []
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching ordenes statistics: {str(e)}"
+        )
+
+@router.get("/{orden_id}", response_model=OrdenResponse)
+async def get_orden(
+    orden_id: str,
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    orden = await service.get_orden_by_id(orden_id)
+    if not orden:
+        raise HTTPException(status_code=404, detail="Orden not found")
+    return BSONJSONResponse(orden)
+
+@router.patch("/{orden_id}", response_model=OrdenResponse)
+async def update_orden(
+    orden_id: str,
+    orden_update: OrdenFormData,
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    updated_orden = await service.update_orden(orden_id, orden_update)
+    if not updated_orden:
+        raise HTTPException(status_code=404, detail="Orden not found")
+    return updated_orden
+
+@router.delete("/{orden_id}")
+async def delete_orden(
+    orden_id: str,
+    service: AsyncOrdenService = Depends(get_mongo_async_ordenes_service)
+):
+    if not await service.delete_orden(orden_id):
+        raise HTTPException(status_code=404, detail="Orden not found")
+    return {"message": "Orden deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,112 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from datetime import datetime
+from typing import Literal, Optional
+from api.services.mongo_async.productos_service import AsyncProductoService
+from api.schemas.mongo import ProductoResponse
+from api.dependencies import get_mongo_async_productos_service
+from api.routers.etag import with_etag
+from api.services.mongo.batch_loader import split_ids
+from api.routers.json_response import BSONJSONResponse
+from api.schemas.froms import ProductoFormData
+
+router = APIRouter(prefix="/productos", tags=["mongo-async-productos"])
+
+@router.post("/", response_model=ProductoResponse)
+async def create_producto(
+    producto: ProductoFormData,
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    try:
+        return await service.create_producto(producto)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating producto: {str(e)}"
+        )
+
+@router.get("/", response_model=dict)
+async def get_productos(
+    request: Request,
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    ids: Optional[str] = Query(None, description="Comma-separated producto ids; returns just those, fetched with one $in"),
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    try:
+        if ids is not None:
+            return with_etag(request, await service.get_productos_by_ids(split_ids(ids)))
+        return with_etag(request, await service.get_productos(page=page, limit=limit, cursor=cursor, include_total=total))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching productos: {str(e)}"
+        )
+
+@router.get("/search", response_model=dict)
+async def search_productos(
+    query: str = Query(..., min_length=1, description="Search term for name or category"),
+    mode: Literal["text", "prefix", "regex"] = Query("text", description="text: ranked full-text, prefix: autocomplete on word prefixes, regex: substring scan"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    try:
+        return BSONJSONResponse(await service.search_productos(query=query, page=page, limit=limit, include_total=total, mode=mode))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error searching productos: {str(e)}"
+        )
+
+@router.get("/categoria/{categoria}", response_model=dict)
+async def get_productos_by_categoria(
+    categoria: str,
+    request: Request,
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    total: bool = Query(True, description="Include the total count; false skips count_documents"),
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    try:
+        return with_etag(request, await service.get_productos_by_categoria(categoria=categoria, page=page, limit=limit, include_total=total))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching productos by category: {str(e)}"
+        )
+
+@router.get("/{producto_id}", response_model=ProductoResponse)
+async def get_producto(
+    producto_id: str,
+    request: Request,
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    producto = await service.get_producto_by_id(producto_id)
+    if not producto:
+        raise HTTPException(status_code=404, detail="Producto not found")
+    return with_etag(request, producto)
+
+@router.patch("/{producto_id}", response_model=ProductoResponse)
+async def update_producto(
+    producto_id: str,
+    producto_update: ProductoFormData,
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    updated_producto = await service.update_producto(producto_id, producto_update)
+    if not updated_producto:
+        raise HTTPException(status_code=404, detail="Producto not found")
+    return updated_producto
+
+@router.delete("/{producto_id}")
+async def delete_producto(
+    producto_id: str,
+    service: AsyncProductoService = Depends(get_mongo_async_productos_service)
+):
+    if not await service.delete_producto(producto_id):
+        raise HTTPException(status_code=404, detail="Producto not found")
+    return {"message": "Producto deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from .mongo_async.clientes import router as clientes_router
+from .mongo_async.productos import router as productos_router
+from .mongo_async.ordenes import router as ordenes_router
+
+
+router = APIRouter()
+
+router.include_router(clientes_router)
+router.include_router(productos_router)
+router.include_router(ordenes_router)
\ No newline at end of file
@@ -2,10 +2,12 @@ from fastapi import APIRouter
 from .mongo.clientes import router as clientes_router
 from .mongo.productos import router as productos_router
 from .mongo.ordenes import router as ordenes_router
+from .mongo.ventas import router as ventas_router
 
 
 router = APIRouter()
 
 router.include_router(clientes_router)
 router.include_router(productos_router)
-router.include_router(ordenes_router)
\ No newline at end of file
+router.include_router(ordenes_router)
+router.include_router(ventas_router)
\ No newline at end of file
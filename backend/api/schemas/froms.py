@@ -29,7 +29,7 @@ class OrdenItem(BaseModel):
 # OrdenFormData Model
 class OrdenFormData(BaseModel):
     cliente_id: str = Field(..., description="ID del cliente")
-    fecha: str = Field(..., description="Fecha de la orden")
+    fecha: datetime = Field(..., description="Fecha de la orden (ISO 8601), guardada como fecha BSON")
     canal: str = Field(..., description="Canal de venta")
     moneda: str = Field(..., description="Tipo de moneda")
     items: List[OrdenItem] = Field(..., min_items=1, description="Lista de items de la orden")
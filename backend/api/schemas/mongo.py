@@ -29,11 +29,12 @@ class ProductoResponse(BaseModel):
 class OrdenResponse(BaseModel):
     id: str 
     cliente_id: str 
-    fecha: str 
+    fecha: datetime
     canal: str 
     moneda: str
     items: List[OrdenItem] 
     descripcion: Optional[str] 
     total: float
+    total_usd: Optional[float] = None
     creado: datetime
     actualizado: datetime
\ No newline at end of file
@@ -0,0 +1,249 @@
+"""Read-through cache for service read methods.
+
+Entries live in a shared backend: an in-process LRU with TTL (default) or any Redis-compatible
+client (redis.Redis, fakeredis.FakeRedis) when CACHE_BACKEND=redis. Each service class owns a
+ReadCache namespace; writes bump the namespace generation, which orphans every entry of that
+namespace at once (they age out of the LRU or expire in Redis).
+"""
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+from bson import json_util
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+class LRUBackend:
+    """Bounded in-process store; entries expire after their ttl"""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def bump(self, namespace: str) -> int:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            return self._generations[namespace]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Entries serialized with bson.json_util in a Redis-compatible client (get/set/incr)"""
+
+    def __init__(self, client, prefix: str = "api-cache"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any:
+        data = self.client.get(f"{self.prefix}:{key}")
+        return json_util.loads(data) if data is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        self.client.set(f"{self.prefix}:{key}", json_util.dumps(value), ex=max(int(ttl), 1))
+
+    def generation(self, namespace: str) -> int:
+        return int(self.client.get(f"{self.prefix}:gen:{namespace}") or 0)
+
+    def bump(self, namespace: str) -> int:
+        return self.client.incr(f"{self.prefix}:gen:{namespace}")
+
+    def clear(self):
+        # Entries are orphaned by bumping every namespace (see invalidate_all); nothing to scan
+        pass
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+def create_backend():
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package (pip install redis)")
+        return RedisBackend(redis.Redis.from_url(settings.CACHE_REDIS_URL, socket_timeout=settings.CACHE_REDIS_TIMEOUT))
+    return LRUBackend(settings.CACHE_MAXSIZE)
+
+
+class ReadCache:
+    """One cache namespace with hit/miss counters; the backend is shared by every namespace"""
+
+    _backend = None
+    _backend_lock = threading.Lock()
+    namespaces: Dict[str, "ReadCache"] = {}
+
+    def __init__(self, namespace: str, ttl: float = None):
+        self.namespace = namespace
+        self.ttl = settings.CACHE_TTL if ttl is None else ttl
+        self.enabled = settings.CACHE_BACKEND != "none" and self.ttl > 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+        # Reads run on threadpool workers; counter updates are read-modify-write
+        self._counter_lock = threading.Lock()
+        ReadCache.namespaces[namespace] = self
+
+    @classmethod
+    def backend(cls):
+        if cls._backend is None:
+            with cls._backend_lock:
+                if cls._backend is None:
+                    cls._backend = create_backend()
+        return cls._backend
+
+    @classmethod
+    def use_backend(cls, backend):
+        """Swap the shared backend (e.g. a fake Redis client wrapped in RedisBackend)"""
+        cls._backend = backend
+
+    def _key(self, parts: tuple) -> Optional[str]:
+        try:
+            generation = self.backend().generation(self.namespace)
+        except Exception as e:
+            self._error(e)
+            return None
+        return f"{self.namespace}:{generation}:" + "|".join(str(part) for part in parts)
+
+    def _get(self, key: Optional[str]) -> Any:
+        if key is None:
+            return None
+        try:
+            value = self.backend().get(key)
+        except Exception as e:
+            self._error(e)
+            return None
+        with self._counter_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _set(self, key: Optional[str], value: Any):
+        # None (not found) is not cached so a later create is visible immediately
+        if key is None or value is None:
+            return
+        try:
+            self.backend().set(key, value, self.ttl)
+        except Exception as e:
+            self._error(e)
+
+    def _error(self, e: Exception):
+        # The cache fails open: reads fall through to Mongo
+        with self._counter_lock:
+            self.errors += 1
+        logger.warning("Cache backend error (%s): %s", self.namespace, e)
+
+    def fetch(self, parts: tuple, loader: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return loader()
+        key = self._key(parts)
+        value = self._get(key)
+        if value is None:
+            value = loader()
+            self._set(key, value)
+        return value
+
+    async def fetch_async(self, parts: tuple, loader: Callable[[], Any]) -> Any:
+        """fetch with a coroutine loader"""
+        if not self.enabled:
+            return await loader()
+        key = self._key(parts)
+        value = self._get(key)
+        if value is None:
+            value = await loader()
+            self._set(key, value)
+        return value
+
+    def invalidate(self):
+        if not self.enabled:
+            return
+        with self._counter_lock:
+            self.invalidations += 1
+        try:
+            self.backend().bump(self.namespace)
+        except Exception as e:
+            self._error(e)
+
+    def stats(self) -> dict:
+        with self._counter_lock:
+            hits, misses, invalidations, errors = self.hits, self.misses, self.invalidations, self.errors
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 3) if lookups else None,
+            "invalidations": invalidations,
+            "errors": errors,
+        }
+
+    @classmethod
+    def invalidate_all(cls):
+        for cache in cls.namespaces.values():
+            cache.invalidate()
+        cls.backend().clear()
+
+    @classmethod
+    def report(cls) -> dict:
+        return {
+            "backend": type(cls.backend()).__name__,
+            "ttl": settings.CACHE_TTL,
+            "entries": cls.backend().size(),
+            "namespaces": {name: cache.stats() for name, cache in cls.namespaces.items()},
+        }
+
+
+def cached_read(method):
+    """Serve a service read method through its class's ReadCache, keyed by method name and arguments"""
+    signature = inspect.signature(method)
+
+    def parts(self, args, kwargs) -> tuple:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        return (method.__name__,) + tuple(value for name, value in bound.arguments.items() if name != "self")
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            return await self.cache.fetch_async(parts(self, args, kwargs), lambda: method(self, *args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self.cache.fetch(parts(self, args, kwargs), lambda: method(self, *args, **kwargs))
+    return wrapper
@@ -0,0 +1,47 @@
+"""USD amounts for API writes, from the same daily USD->CRC table the ETL converts with.
+
+The table (TIPOS_DE_CAMBIO.csv, EXCHANGE_RATES_CSV to override) is loaded once per process.
+When it cannot be read, or a fecha predates the first rate, CRC amounts stay None; the ETL
+and `python -m api.jobs.check_orden_totals --fix` fill them in later.
+"""
+import logging
+import threading
+from typing import Optional
+from api.config import settings
+from etl.transformations.normalize_currency import DEFAULT_RATES_PATH, ExchangeRates
+
+logger = logging.getLogger(__name__)
+
+_rates: Optional[ExchangeRates] = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def get_rates() -> Optional[ExchangeRates]:
+    global _rates, _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                path = settings.EXCHANGE_RATES_CSV or DEFAULT_RATES_PATH
+                try:
+                    _rates = ExchangeRates.from_csv(path)
+                except (OSError, ValueError) as e:
+                    logger.warning("Exchange rates unavailable (%s); CRC amounts get no USD value", e)
+                _loaded = True
+    return _rates
+
+
+def to_usd(amount, moneda: Optional[str], fecha) -> Optional[float]:
+    """amount in USD rounded to cents, with the as-of rate of fecha; None when it cannot be converted"""
+    if not isinstance(amount, (int, float)) or isinstance(amount, bool):
+        return None
+    if moneda == "USD":
+        return round(float(amount), 2)
+    rates = get_rates()
+    if rates is None or fecha is None:
+        return None
+    try:
+        usd = rates.to_usd_scalar(amount, moneda, fecha)
+    except ValueError:
+        return None
+    return round(usd, 2) if usd is not None else None
@@ -0,0 +1,80 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from bson import ObjectId
+from api.config import settings
+
+
+def split_ids(raw: str) -> List[str]:
+    """Ids from a comma-separated query value, blanks dropped"""
+    return [value.strip() for value in raw.split(",") if value.strip()]
+
+
+def check_batch_size(ids: Sequence[str]) -> List[str]:
+    """Distinct normalized ids in request order, raising ValueError past MONGO_MAX_BATCH_IDS"""
+    keys = list(dict.fromkeys(BatchLoader.key(value) for value in ids))
+    if not keys:
+        raise ValueError("No ids given")
+    if len(keys) > settings.MONGO_MAX_BATCH_IDS:
+        raise ValueError(f"Too many ids ({len(keys)}), at most {settings.MONGO_MAX_BATCH_IDS} per request")
+    return keys
+
+
+def batch_result(keys: Sequence[str], documents: Sequence[Optional[dict]], helper: Callable[[dict], Any]) -> dict:
+    return {
+        "data": [helper(document) for document in documents if document is not None],
+        "missing": [key for key, document in zip(keys, documents) if document is None],
+    }
+
+
+class BatchLoader:
+    """Dataloader-style batcher: the ids of one load_many are deduplicated and fetched with a
+    single $in, and results are memoized for the loader's lifetime (one service, one request).
+
+    fetch receives a list of ObjectIds and returns (or, for Motor, resolves to) the documents
+    found. Invalid ids and ids with no document load as None without reaching the server.
+    """
+
+    def __init__(self, fetch: Callable[[List[ObjectId]], Iterable[dict]]):
+        self.fetch = fetch
+        self._documents: Dict[str, Optional[dict]] = {}
+        self.fetches = 0
+
+    @staticmethod
+    def key(value: str) -> str:
+        return str(ObjectId(value)) if ObjectId.is_valid(value) else value
+
+    def _missing(self, keys: Sequence[str]) -> List[ObjectId]:
+        missing = []
+        for key in dict.fromkeys(keys):
+            if key in self._documents:
+                continue
+            if ObjectId.is_valid(key):
+                missing.append(ObjectId(key))
+            else:
+                self._documents[key] = None
+        return missing
+
+    def _store(self, missing: List[ObjectId], documents: Iterable[dict]):
+        self.fetches += 1
+        for object_id in missing:
+            self._documents[str(object_id)] = None
+        for document in documents:
+            self._documents[str(document["_id"])] = document
+
+    def prime(self, document: dict):
+        self._documents[str(document["_id"])] = document
+
+    def load_many(self, ids: Sequence[str]) -> List[Optional[dict]]:
+        """Documents in the order of ids (None where there is none)"""
+        keys = [self.key(value) for value in ids]
+        missing = self._missing(keys)
+        if missing:
+            self._store(missing, self.fetch(missing))
+        return [self._documents[key] for key in keys]
+
+    async def load_many_async(self, ids: Sequence[str]) -> List[Optional[dict]]:
+        """load_many with a coroutine fetch"""
+        keys = [self.key(value) for value in ids]
+        missing = self._missing(keys)
+        if missing:
+            self._store(missing, await self.fetch(missing))
+        return [self._documents[key] for key in keys]
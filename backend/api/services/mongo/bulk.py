@@ -0,0 +1,85 @@
+from typing import Any, Callable, List, Sequence, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+IndexedRow = Tuple[int, Any]
+
+
+def new_bulk_result() -> dict:
+    return {"received": 0, "inserted": 0, "upserted": 0, "modified": 0, "errors": []}
+
+
+def merge_bulk_results(total: dict, part: dict) -> dict:
+    for key in ("received", "inserted", "upserted", "modified"):
+        total[key] += part[key]
+    total["errors"].extend(part["errors"])
+    return total
+
+
+def row_error(index: int, error: str) -> dict:
+    return {"index": index, "error": error}
+
+
+def validate_rows(
+    rows: List[IndexedRow],
+    model: Type[BaseModel],
+    build_document: Callable[[BaseModel], dict]
+) -> Tuple[List[Tuple[int, dict]], List[dict]]:
+    """Validate raw rows against a form model, keeping the original row index of each document"""
+    documents, errors = [], []
+    for index, row in rows:
+        try:
+            documents.append((index, build_document(model.model_validate(row))))
+        except ValidationError as e:
+            errors.append(row_error(index, "; ".join(
+                f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()
+            )))
+    return documents, errors
+
+
+def insert_documents(collection, documents: List[Tuple[int, dict]]) -> Tuple[int, List[dict]]:
+    """insert_many(ordered=False) so one bad document does not abort the rest of the chunk"""
+    if not documents:
+        return 0, []
+
+    try:
+        result = collection.insert_many([doc for _, doc in documents], ordered=False)
+        return len(result.inserted_ids), []
+    except BulkWriteError as e:
+        details = e.details
+        errors = [
+            row_error(documents[err["index"]][0], err.get("errmsg", "write error"))
+            for err in details.get("writeErrors", [])
+        ]
+        return details.get("nInserted", 0), errors
+
+
+def upsert_documents(
+    collection,
+    documents: List[Tuple[int, dict]],
+    key: str,
+    insert_only: Sequence[str] = ("creado",)
+) -> Tuple[int, int, List[dict]]:
+    """Upsert on a natural key with bulk_write(ordered=False); returns (upserted, modified, errors)"""
+    if not documents:
+        return 0, 0, []
+
+    operations = []
+    for _, doc in documents:
+        fields = {k: v for k, v in doc.items() if k not in insert_only}
+        update = {"$set": fields}
+        if insert_only:
+            update["$setOnInsert"] = {k: doc[k] for k in insert_only if k in doc}
+        operations.append(UpdateOne({key: doc[key]}, update, upsert=True))
+
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        return result.upserted_count, result.modified_count, []
+    except BulkWriteError as e:
+        details = e.details
+        errors = [
+            row_error(documents[err["index"]][0], err.get("errmsg", "write error"))
+            for err in details.get("writeErrors", [])
+        ]
+        return details.get("nUpserted", 0), details.get("nModified", 0), errors
@@ -1,84 +1,150 @@
 from bson import ObjectId
+from pymongo import ReturnDocument
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from api.schemas.froms import ClienteFormData
+from api.services.mongo.pagination import find_page
+from api.services.mongo.totals_cache import TotalsCache
+from api.services.cache import ReadCache, cached_read
+from api.services.mongo.batch_loader import BatchLoader, batch_result, check_batch_size
+from api.services.mongo.bulk import IndexedRow, insert_documents, new_bulk_result, upsert_documents, validate_rows
 
 
-class ClienteService:
+CLIENTE_PROJECTION = {"nombre": 1, "email": 1, "genero": 1, "pais": 1, "creado": 1, "preferencias": 1}
+
+
+def cliente_helper(cliente) -> dict:
+    """Transform a MongoDB document to ClienteResponse format"""
+    preferencias_array = []
+    
+    if cliente.get("preferencias"):
+        for categoria, valores in cliente["preferencias"].items():
+            if isinstance(valores, list):
+                texto = ",".join(valores)
+            else:
+                texto = str(valores)
+            preferencias_array.append({
+                "categoria": categoria,
+                "texto": texto
+            })
+    
+    return {
+        "id": str(cliente["_id"]),
+        "nombre": cliente["nombre"],
+        "email": cliente["email"],
+        "genero": cliente["genero"],
+        "pais": cliente["pais"],
+        "creado": cliente.get("creado", datetime.now()),
+        "preferencias": preferencias_array
+    }
+
+
+class ClienteServiceBase:
+    """Collection-agnostic half of the clientes services: document builders and the shared caches"""
+    totals = TotalsCache()
+    cache = ReadCache("clientes")
+
     def __init__(self, collection):
         self.collection = collection
+        self.loader = BatchLoader(self._find_by_ids)
     
-    def create_cliente(self, cliente_data: ClienteFormData) -> dict:
+    def _build_cliente_document(self, cliente_data: ClienteFormData) -> dict:
         cliente_dict = cliente_data.model_dump()
         cliente_dict["creado"] = datetime.now()
+        return cliente_dict
+    
+    def _build_cliente_update(self, cliente_update: ClienteFormData) -> dict:
+        update_data = cliente_update.model_dump(exclude_unset=True)
+        if 'creado' in update_data:
+            del update_data['creado']
+        return update_data
 
-        result = self.collection.insert_one(cliente_dict)
-        created_cliente = self.collection.find_one({"_id": result.inserted_id})
-        return self._cliente_helper(created_cliente)
+
+class ClienteService(ClienteServiceBase):
+    """Clientes on a pymongo collection, plus the bulk load"""
     
-    def get_clientes(self, page: int = 1, limit: int = 20) -> dict:
-        clientes = []
-        skip = (page - 1) * limit
-        total = self.collection.count_documents({})
-        
-        for cliente in self.collection.find().skip(skip).limit(limit):
-            clientes.append(self._cliente_helper(cliente))
+    def create_cliente(self, cliente_data: ClienteFormData) -> dict:
+        cliente_dict = self._build_cliente_document(cliente_data)
+
+        self.collection.insert_one(cliente_dict)  # sets cliente_dict["_id"]
+        self.totals.invalidate()
+        self.cache.invalidate()
+        return cliente_helper(cliente_dict)
+    
+    def bulk_create_clientes(self, rows: List[IndexedRow], upsert: bool = False) -> dict:
+        """Validate and write one chunk of raw rows; upsert matches existing clientes by email"""
+        result = new_bulk_result()
+        result["received"] = len(rows)
+        documents, result["errors"] = validate_rows(rows, ClienteFormData, self._build_cliente_document)
+
+        if upsert:
+            result["upserted"], result["modified"], errors = upsert_documents(self.collection, documents, "email")
+        else:
+            result["inserted"], errors = insert_documents(self.collection, documents)
+        result["errors"].extend(errors)
+
+        if result["inserted"] or result["upserted"]:
+            self.totals.invalidate()
+        if result["inserted"] or result["upserted"] or result["modified"]:
+            self.cache.invalidate()
+        return result
+    
+    @cached_read
+    def get_clientes(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> dict:
+        total = self._count({}, include_total)
+        documents, page_cursor = find_page(self.collection, {}, page, limit, cursor, projection=CLIENTE_PROJECTION)
+        clientes = [cliente_helper(cliente) for cliente in documents]
             
-        return {"data": clientes, "total": total}
+        return {"data": clientes, "total": total, "next_cursor": page_cursor}
     
+    @cached_read
     def get_cliente_by_id(self, cliente_id: str) -> Optional[dict]:
         if not ObjectId.is_valid(cliente_id):
             return None
             
-        cliente = self.collection.find_one({"_id": ObjectId(cliente_id)})
-        return self._cliente_helper(cliente) if cliente else None
+        cliente = self.collection.find_one({"_id": ObjectId(cliente_id)}, CLIENTE_PROJECTION)
+        return cliente_helper(cliente) if cliente else None
+    
+    @cached_read
+    def get_clientes_by_ids(self, ids: List[str]) -> dict:
+        """Clientes for a list of ids, in request order; one $in for the ids not loaded yet"""
+        keys = check_batch_size(ids)
+        return batch_result(keys, self.loader.load_many(keys), cliente_helper)
+    
+    def _find_by_ids(self, object_ids: List[ObjectId]) -> List[dict]:
+        return list(self.collection.find({"_id": {"$in": object_ids}}, CLIENTE_PROJECTION))
     
     def update_cliente(self, cliente_id: str, cliente_update: ClienteFormData) -> Optional[dict]:
         if not ObjectId.is_valid(cliente_id):
             return None
             
-        update_data = cliente_update.model_dump(exclude_unset=True)
-        if 'creado' in update_data:
-            del update_data['creado']
+        update_data = self._build_cliente_update(cliente_update)
         
-        result = self.collection.update_one(
+        updated_cliente = self.collection.find_one_and_update(
             {"_id": ObjectId(cliente_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.modified_count == 0:
+        if updated_cliente is None:
             return None
+        self.totals.invalidate()
+        self.cache.invalidate()
             
-        updated_cliente = self.collection.find_one({"_id": ObjectId(cliente_id)})
-        return self._cliente_helper(updated_cliente)
+        return cliente_helper(updated_cliente)
     
     def delete_cliente(self, cliente_id: str) -> bool:
         if not ObjectId.is_valid(cliente_id):
             return False
             
         result = self.collection.delete_one({"_id": ObjectId(cliente_id)})
+        if result.deleted_count > 0:
+            self.totals.invalidate()
+            self.cache.invalidate()
         return result.deleted_count > 0
-    
-    def _cliente_helper(self, cliente) -> dict:
-        preferencias_array = []
-        
-        if cliente.get("preferencias"):
-            for categoria, valores in cliente["preferencias"].items():
-                if isinstance(valores, list):
-                    texto = ",".join(valores)
-                else:
-                    texto = str(valores)
-                preferencias_array.append({
-                    "categoria": categoria,
-                    "texto": texto
-                })
-        
-        return {
-            "id": str(cliente["_id"]),
-            "nombre": cliente["nombre"],
-            "email": cliente["email"],
-            "genero": cliente["genero"],
-            "pais": cliente["pais"],
-            "creado": cliente.get("creado", datetime.now()),
-            "preferencias": preferencias_array
-        }
\ No newline at end of file
+
+    def _count(self, filter_criteria: dict, include_total: bool) -> Optional[int]:
+        """Cached total for filter_criteria, or None when the caller opted out"""
+        if not include_total:
+            return None
+        return self.totals.count(self.collection, filter_criteria)
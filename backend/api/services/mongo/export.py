@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator
+from bson import ObjectId
+
+ORDEN_EXPORT_PROJECTION = {
+    "cliente_id": 1, "fecha": 1, "canal": 1, "moneda": 1, "total": 1, "total_usd": 1,
+    "items.producto_id": 1, "items.cantidad": 1, "items.precio_unit": 1, "items.descuento_pct": 1,
+}
+
+ORDEN_LINE_COLUMNS = [
+    "orden_id", "linea", "cliente_id", "fecha", "canal", "moneda", "total", "total_usd",
+    "producto_id", "cantidad", "precio_unit", "descuento_pct",
+]
+
+
+def _json_default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return "" if value is None else value
+
+
+def iter_ndjson(documents: Iterable[dict], flush_every: int = 1000) -> Iterator[bytes]:
+    """One JSON object per line, flushed in blocks so memory stays bounded by flush_every"""
+    lines = []
+    for document in documents:
+        document["_id"] = str(document["_id"])
+        lines.append(json.dumps(document, default=_json_default, ensure_ascii=False))
+        if len(lines) >= flush_every:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def iter_orden_lines_csv(documents: Iterable[dict], flush_every: int = 1000) -> Iterator[bytes]:
+    """CSV with one row per orden item (the grain of FactVentas), header first"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(ORDEN_LINE_COLUMNS)
+    rows = 0
+
+    for orden in documents:
+        head = [
+            str(orden["_id"]), None, _csv_value(orden.get("cliente_id")), _csv_value(orden.get("fecha")),
+            _csv_value(orden.get("canal")), _csv_value(orden.get("moneda")),
+            _csv_value(orden.get("total")), _csv_value(orden.get("total_usd")),
+        ]
+        for linea, item in enumerate(orden.get("items") or [], 1):
+            head[1] = linea
+            writer.writerow(head + [
+                _csv_value(item.get("producto_id")), _csv_value(item.get("cantidad")),
+                _csv_value(item.get("precio_unit")), _csv_value(item.get("descuento_pct")),
+            ])
+            rows += 1
+
+        if rows >= flush_every:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
@@ -1,45 +1,272 @@
+import logging
 from bson import ObjectId
-from datetime import datetime
-from typing import List, Optional, Dict
+from datetime import date, datetime
+from typing import Iterator, List, Optional, Dict, Sequence
+from pymongo import ReturnDocument, UpdateOne
 from pymongo.collection import Collection
 from api.schemas.froms import OrdenFormData
+from api.services.mongo.pagination import build_page_query, find_page, next_cursor, FECHA_SORT
+from api.services.mongo.totals_cache import TotalsCache, total_pages
+from api.services.mongo.bulk import IndexedRow, insert_documents, new_bulk_result, validate_rows
+from api.services.mongo.export import ORDEN_EXPORT_PROJECTION, iter_ndjson, iter_orden_lines_csv
+from api.services.mongo.ventas_aggregates import VentasAggregates
+from api.metrics import AGG_VENTAS_FOLD_FAILURES
+from api.services.mongo.ordenes_stats import DIMENSIONS, OrdenStats
+from api.services.mongo.clientes_service import CLIENTE_PROJECTION, cliente_helper
+from api.services.mongo.productos_service import PRODUCTO_PROJECTION, producto_helper
+from api.services.exchange_rates import to_usd
 
-class OrdenService:
-    def __init__(self, collection: Collection):
+logger = logging.getLogger(__name__)
+
+# Fields read by the response helper; list and get routes fetch only these
+ORDEN_PROJECTION = {
+    "cliente_id": 1, "fecha": 1, "canal": 1, "moneda": 1, "descripcion": 1, "total": 1, "total_usd": 1,
+    "items.producto_id": 1, "items.cantidad": 1, "items.precio_unit": 1, "items.descuento_pct": 1,
+    "creado": 1, "actualizado": 1,
+}
+
+# Related documents get_ordenes can join in with expand=
+EXPANSIONS = ("cliente", "productos")
+
+# Sort directions of the (fecha, _id) index walked by the date range route and the export
+FECHA_ORDERS = {"asc": 1, "desc": -1}
+
+
+def to_fecha(value) -> Optional[datetime]:
+    """Naive datetime stored as a BSON date; offsets are dropped and the wall-clock time kept,
+    as the ETL does (etl/transformations/format_dates.py). None when value is not a date."""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _is_amount(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _same_amount(stored, expected: Optional[float]) -> bool:
+    """Stored amount equals expected to the cent (both None also matches)"""
+    if expected is None:
+        return stored is None
+    return _is_amount(stored) and abs(stored - expected) < 0.01
+
+
+def _object_id_expr(value: str) -> dict:
+    # References are ObjectIds (seed data) or their hex strings (API writes)
+    return {"$convert": {"input": value, "to": "objectId", "onError": value, "onNull": None}}
+
+
+def expand_pipeline(page: int, limit: int, cursor: Optional[str], expand: Sequence[str]) -> List[dict]:
+    """One page of ordenes with their cliente and/or productos joined by index-backed $lookups"""
+    query, sort, skip = build_page_query({}, page, limit, cursor)
+    pipeline = [{"$match": query}, {"$sort": dict(sort)}]
+    if skip:
+        pipeline.append({"$skip": skip})
+    pipeline.append({"$limit": limit})
+
+    projection = dict(ORDEN_PROJECTION)
+    if "cliente" in expand:
+        pipeline += [
+            {"$addFields": {"_cliente_oid": _object_id_expr("$cliente_id")}},
+            {"$lookup": {"from": "clientes", "localField": "_cliente_oid", "foreignField": "_id", "as": "_cliente"}},
+        ]
+        projection.update({f"_cliente.{field}": 1 for field in ("_id", *CLIENTE_PROJECTION)})
+    if "productos" in expand:
+        pipeline += [
+            {"$addFields": {"_producto_oids": {"$map": {"input": {"$ifNull": ["$items", []]}, "in": _object_id_expr("$$this.producto_id")}}}},
+            {"$lookup": {"from": "productos", "localField": "_producto_oids", "foreignField": "_id", "as": "_productos"}},
+        ]
+        projection.update({f"_productos.{field}": 1 for field in ("_id", *PRODUCTO_PROJECTION)})
+    pipeline.append({"$project": projection})
+    return pipeline
+
+
+class OrdenServiceBase:
+    """Collection-agnostic half of the ordenes services: document builders, response helpers
+    and the totals/stats caches shared by the sync and Motor services"""
+    totals = TotalsCache()
+    stats = OrdenStats()
+    
+    def __init__(self, collection: Collection, aggregates: Optional[VentasAggregates] = None):
         self.collection = collection
+        self.aggregates = aggregates
     
-    def create_orden(self, orden_data: OrdenFormData) -> dict:
-        """Create a new orden"""
+    def _fecha_filter(self, fecha_inicio: Optional[datetime], fecha_fin: Optional[datetime]) -> dict:
+        """Range on the stored BSON dates; bounds are normalized like the written values"""
+        bounds = {}
+        if fecha_inicio:
+            bounds["$gte"] = to_fecha(fecha_inicio)
+        if fecha_fin:
+            bounds["$lte"] = to_fecha(fecha_fin)
+        return {"fecha": bounds} if bounds else {}
+    
+    def _fecha_direction(self, order: str) -> int:
+        if order not in FECHA_ORDERS:
+            raise ValueError(f"Unknown order {order}; expected one of {', '.join(FECHA_ORDERS)}")
+        return FECHA_ORDERS[order]
+    
+    def _stats_dimensions(self, group_by: Sequence[str]) -> List[str]:
+        unknown = [name for name in group_by if name not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown group_by {', '.join(unknown)}; expected any of {', '.join(DIMENSIONS)}")
+        return list(dict.fromkeys(group_by))
+    
+    def _expansions(self, expand: Sequence[str]) -> List[str]:
+        unknown = [name for name in expand if name not in EXPANSIONS]
+        if unknown:
+            raise ValueError(f"Unknown expand {', '.join(unknown)}; expected any of {', '.join(EXPANSIONS)}")
+        return [name for name in EXPANSIONS if name in expand]
+    
+    def _expanded_helper(self, orden: dict, expand: Sequence[str]) -> dict:
+        """_orden_helper plus the joined cliente and a producto on every item (None when missing)"""
+        result = self._orden_helper(orden)
+        if "cliente" in expand:
+            cliente = orden.get("_cliente")
+            result["cliente"] = cliente_helper(cliente[0]) if cliente else None
+        if "productos" in expand:
+            productos = {str(producto["_id"]): producto for producto in orden.get("_productos", [])}
+            items = []
+            for item in result["items"]:
+                producto = productos.get(str(item.get("producto_id")))
+                items.append(dict(item, producto=producto_helper(producto) if producto else None))
+            result["items"] = items
+        return result
+    
+    def _build_orden_document(self, orden_data: OrdenFormData) -> dict:
+        """Build the document stored for a new orden"""
         orden_dict = orden_data.model_dump()
+        orden_dict["fecha"] = to_fecha(orden_dict["fecha"])
         
         # Add timestamps
         now = datetime.now()
         orden_dict["creado"] = now
         orden_dict["actualizado"] = now
         
-        # Calculate total
+        # Calculate total once; reads serve the stored value
         total = self._calculate_total(orden_dict["items"])
         orden_dict["total"] = round(total, 2)
+        orden_dict["total_usd"] = self._total_usd(orden_dict["total"], orden_dict["moneda"], orden_dict["fecha"])
+        return orden_dict
+    
+    def _build_orden_update(self, orden_update: OrdenFormData) -> dict:
+        """Build the $set document for a partial orden update"""
+        # Convert to dict and remove None values for partial update
+        update_data = orden_update.model_dump(exclude_unset=True)
+        if "fecha" in update_data:
+            update_data["fecha"] = to_fecha(update_data["fecha"])
+        
+        # Recalculate total if items are updated
+        if "items" in update_data:
+            total = self._calculate_total(update_data["items"])
+            update_data["total"] = round(total, 2)
+            if "moneda" in update_data and "fecha" in update_data:
+                update_data["total_usd"] = self._total_usd(update_data["total"], update_data["moneda"], update_data["fecha"])
         
-        result = self.collection.insert_one(orden_dict)
-        created_orden = self.collection.find_one({"_id": result.inserted_id})
-        return self._orden_helper(created_orden)
-    
-    def get_ordenes(self, page: int = 1, limit: int = 20) -> dict:
-        """Get paginated list of ordenes"""
-        ordenes = []
-        skip = (page - 1) * limit
-        total = self.collection.count_documents({})
+        # Update timestamp
+        update_data["actualizado"] = datetime.now()
+        
+        # Don't update 'creado' field when patching
+        if 'creado' in update_data:
+            del update_data['creado']
+        return update_data
+    
+    def _fold_failed(self, operation: str, error: Exception):
+        AGG_VENTAS_FOLD_FAILURES.inc(operation)
+        logger.warning("agg_ventas fold failed after %s (%s); python -m api.jobs.rebuild_agg_ventas repairs it", operation, error)
+    
+    def _total_usd(self, total: float, moneda: str, fecha) -> Optional[float]:
+        """total in USD at the as-of rate of fecha; None (null in responses) for CRC ordenes when
+        no rate applies, until check_totals or the ETL fills it in"""
+        return to_usd(total, moneda, fecha)
+    
+    def _calculate_total(self, items: List[Dict]) -> float:
+        """Calculate total from order items"""
+        total = 0
+        for item in items:
+            precio_final = item["precio_unit"]
+            if item.get("descuento_pct"):
+                precio_final = item["precio_unit"] * (1 - item["descuento_pct"] / 100)
+            total += precio_final * item["cantidad"]
+        return total
+    
+    def _orden_helper(self, orden) -> dict:
+        """Helper function to transform MongoDB document to OrdenResponse format"""
+        # The stored total is authoritative; check_totals repairs drift in batch
+        total = orden.get("total")
+        if not _is_amount(total):
+            total = self._calculate_total(orden["items"])
+        
+        return {
+            "id": str(orden["_id"]),
+            "cliente_id": orden["cliente_id"],
+            "fecha": orden["fecha"],
+            "canal": orden["canal"],
+            "moneda": orden["moneda"],
+            "items": orden["items"],
+            "descripcion": orden.get("descripcion"),
+            "total": round(total, 2),
+            "total_usd": orden.get("total_usd"),
+            "creado": orden.get("creado", datetime.now()),
+            "actualizado": orden.get("actualizado", datetime.now())
+        }
+
+
+class OrdenService(OrdenServiceBase):
+    """Ordenes on a pymongo collection, plus the batch jobs (bulk create, export, checks, migration)"""
+    
+    def create_orden(self, orden_data: OrdenFormData) -> dict:
+        """Create a new orden"""
+        orden_dict = self._build_orden_document(orden_data)
         
-        for orden in self.collection.find().skip(skip).limit(limit):
-            ordenes.append(self._orden_helper(orden))
+        self.collection.insert_one(orden_dict)  # sets orden_dict["_id"]
+        self.totals.invalidate()
+        self.stats.apply(after=orden_dict)
+        self._fold("create", after=orden_dict)
+        return self._orden_helper(orden_dict)
+    
+    def bulk_create_ordenes(self, rows: List[IndexedRow]) -> dict:
+        """Validate and insert one chunk of raw rows, reporting per-row errors"""
+        result = new_bulk_result()
+        result["received"] = len(rows)
+        documents, result["errors"] = validate_rows(rows, OrdenFormData, self._build_orden_document)
+
+        result["inserted"], errors = insert_documents(self.collection, documents)
+        result["errors"].extend(errors)
+
+        if result["inserted"]:
+            self.totals.invalidate()
+            failed = {error["index"] for error in errors}
+            inserted = [doc for index, doc in documents if index not in failed]
+            self.stats.apply_many(inserted)
+            self._fold_many(inserted)
+        return result
+    
+    def get_ordenes(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True, expand: Sequence[str] = ()) -> dict:
+        """Get paginated list of ordenes (offset or keyset on _id), optionally with cliente/productos joined in"""
+        expand = self._expansions(expand)
+        total = self._count({}, include_total)
+        if expand:
+            documents = list(self.collection.aggregate(expand_pipeline(page, limit, cursor, expand)))
+            ordenes = [self._expanded_helper(orden, expand) for orden in documents]
+            page_cursor = next_cursor(documents, limit)
+        else:
+            documents, page_cursor = find_page(self.collection, {}, page, limit, cursor, projection=ORDEN_PROJECTION)
+            ordenes = [self._orden_helper(orden) for orden in documents]
             
         return {
             "data": ordenes,
             "total": total,
             "page": page,
             "limit": limit,
-            "pages": (total + limit - 1) // limit
+            "pages": total_pages(total, limit),
+            "next_cursor": page_cursor
         }
     
     def get_orden_by_id(self, orden_id: str) -> Optional[dict]:
@@ -47,7 +274,7 @@ class OrdenService:
         if not ObjectId.is_valid(orden_id):
             return None
             
-        orden = self.collection.find_one({"_id": ObjectId(orden_id)})
+        orden = self.collection.find_one({"_id": ObjectId(orden_id)}, ORDEN_PROJECTION)
         return self._orden_helper(orden) if orden else None
     
     def update_orden(self, orden_id: str, orden_update: OrdenFormData) -> Optional[dict]:
@@ -55,31 +282,22 @@ class OrdenService:
         if not ObjectId.is_valid(orden_id):
             return None
             
-        # Convert to dict and remove None values for partial update
-        update_data = orden_update.model_dump(exclude_unset=True)
-        
-        # Recalculate total if items are updated
-        if "items" in update_data:
-            total = self._calculate_total(update_data["items"])
-            update_data["total"] = round(total, 2)
+        update_data = self._build_orden_update(orden_update)
         
-        # Update timestamp
-        update_data["actualizado"] = datetime.now()
-        
-        # Don't update 'creado' field when patching
-        if 'creado' in update_data:
-            del update_data['creado']
-        
-        result = self.collection.update_one(
+        # Read the previous version in the same round trip; the aggregates need both sides
+        previous = self.collection.find_one_and_update(
             {"_id": ObjectId(orden_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE
         )
         
-        if result.modified_count == 0:
+        if previous is None:
             return None
+        updated_orden = {**previous, **update_data}
+        self.totals.invalidate()
+        self.stats.apply(before=previous, after=updated_orden)
+        self._fold("update", before=previous, after=updated_orden)
             
-        # Return updated document
-        updated_orden = self.collection.find_one({"_id": ObjectId(orden_id)})
         return self._orden_helper(updated_orden)
     
     def delete_orden(self, orden_id: str) -> bool:
@@ -87,44 +305,37 @@ class OrdenService:
         if not ObjectId.is_valid(orden_id):
             return False
             
-        result = self.collection.delete_one({"_id": ObjectId(orden_id)})
-        return result.deleted_count > 0
+        deleted = self.collection.find_one_and_delete({"_id": ObjectId(orden_id)})
+        if deleted is None:
+            return False
+        self.totals.invalidate()
+        self.stats.apply(before=deleted)
+        self._fold("delete", before=deleted)
+        return True
     
-    def get_ordenes_by_cliente(self, cliente_id: str, page: int = 1, limit: int = 20) -> dict:
+    def get_ordenes_by_cliente(self, cliente_id: str, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> dict:
         """Get ordenes by cliente ID"""
-        ordenes = []
-        skip = (page - 1) * limit
-        
         filter_criteria = {"cliente_id": cliente_id}
-        total = self.collection.count_documents(filter_criteria)
-        
-        for orden in self.collection.find(filter_criteria).skip(skip).limit(limit):
-            ordenes.append(self._orden_helper(orden))
+        total = self._count(filter_criteria, include_total)
+        documents, page_cursor = find_page(self.collection, filter_criteria, page, limit, cursor, projection=ORDEN_PROJECTION)
+        ordenes = [self._orden_helper(orden) for orden in documents]
             
         return {
             "data": ordenes,
             "total": total,
             "page": page,
             "limit": limit,
-            "cliente_id": cliente_id
+            "cliente_id": cliente_id,
+            "next_cursor": page_cursor
         }
     
-    def get_ordenes_by_fecha(self, fecha_inicio: datetime, fecha_fin: datetime, page: int = 1, limit: int = 20) -> dict:
-        """Get ordenes by date range"""
-        ordenes = []
-        skip = (page - 1) * limit
-        
-        filter_criteria = {
-            "fecha": {
-                "$gte": fecha_inicio,
-                "$lte": fecha_fin
-            }
-        }
-        
-        total = self.collection.count_documents(filter_criteria)
+    def get_ordenes_by_fecha(self, fecha_inicio: datetime, fecha_fin: datetime, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True, order: str = "asc") -> dict:
+        """Get ordenes by date range, keyset-paginated on (fecha, _id) in either direction"""
+        filter_criteria = self._fecha_filter(fecha_inicio, fecha_fin)
         
-        for orden in self.collection.find(filter_criteria).skip(skip).limit(limit):
-            ordenes.append(self._orden_helper(orden))
+        total = self._count(filter_criteria, include_total)
+        documents, page_cursor = find_page(self.collection, filter_criteria, page, limit, cursor, FECHA_SORT, projection=ORDEN_PROJECTION, direction=self._fecha_direction(order))
+        ordenes = [self._orden_helper(orden) for orden in documents]
             
         return {
             "data": ordenes,
@@ -132,69 +343,121 @@ class OrdenService:
             "page": page,
             "limit": limit,
             "fecha_inicio": fecha_inicio,
-            "fecha_fin": fecha_fin
+            "fecha_fin": fecha_fin,
+            "order": order,
+            "next_cursor": page_cursor
         }
     
-    def get_ordenes_stats(self) -> dict:
-        """Get ordenes statistics"""
-        total_ordenes = self.collection.count_documents({})
+    def export_ordenes(
+        self,
+        format: str = "ndjson",
+        fecha_inicio: Optional[datetime] = None,
+        fecha_fin: Optional[datetime] = None,
+        cliente_id: Optional[str] = None,
+        batch_size: int = 1000,
+        order: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """Stream ordenes through one server-side cursor as NDJSON documents or CSV item lines,
+        in (fecha, _id) order when order is given"""
+        filter_criteria = self._fecha_filter(fecha_inicio, fecha_fin)
+        if cliente_id:
+            filter_criteria["cliente_id"] = cliente_id
         
-        # Get total revenue
-        pipeline = [
-            {
-                "$group": {
-                    "_id": None,
-                    "total_revenue": {"$sum": "$total"},
-                    "avg_order_value": {"$avg": "$total"},
-                    "min_order_value": {"$min": "$total"},
-                    "max_order_value": {"$max": "$total"}
-                }
-            }
-        ]
-        
-        stats = list(self.collection.aggregate(pipeline))
-        
-        if stats:
-            return {
-                "total_ordenes": total_ordenes,
-                "total_revenue": stats[0].get("total_revenue", 0),
-                "avg_order_value": round(stats[0].get("avg_order_value", 0), 2),
-                "min_order_value": stats[0].get("min_order_value", 0),
-                "max_order_value": stats[0].get("max_order_value", 0)
-            }
-        else:
-            return {
-                "total_ordenes": total_ordenes,
-                "total_revenue": 0,
-                "avg_order_value": 0,
-                "min_order_value": 0,
-                "max_order_value": 0
-            }
+        cursor = self.collection.find(filter_criteria, ORDEN_EXPORT_PROJECTION, batch_size=batch_size)
+        if order:
+            direction = self._fecha_direction(order)
+            cursor = cursor.sort([(field, direction) for field in FECHA_SORT])
+        if format == "csv":
+            return iter_orden_lines_csv(cursor, flush_every=batch_size)
+        return iter_ndjson(cursor, flush_every=batch_size)
     
-    def _calculate_total(self, items: List[Dict]) -> float:
-        """Calculate total from order items"""
-        total = 0
-        for item in items:
-            precio_final = item["precio_unit"]
-            if item.get("descuento_pct"):
-                precio_final = item["precio_unit"] * (1 - item["descuento_pct"] / 100)
-            total += precio_final * item["cantidad"]
-        return total
+    def get_ordenes_stats(self, fecha_inicio: Optional[datetime] = None, fecha_fin: Optional[datetime] = None, group_by: Sequence[str] = ()) -> dict:
+        """Get ordenes statistics, optionally for a fecha range and broken down by canal/moneda/dia/mes/anio"""
+        return self.stats.summary(self.collection, fecha_inicio, fecha_fin, self._stats_dimensions(group_by))
     
-    def _orden_helper(self, orden) -> dict:
-        """Helper function to transform MongoDB document to OrdenResponse format"""
-        # Recalculate total to ensure consistency
-        total = self._calculate_total(orden["items"])
-        
-        return {
-            "id": str(orden["_id"]),
-            "cliente_id": orden["cliente_id"],
-            "fecha": orden["fecha"],
-            "canal": orden["canal"],
-            "moneda": orden["moneda"],
-            "items": orden["items"],
-            "descripcion": orden.get("descripcion"),
-            "total": round(total, 2),
-            "creado": orden.get("creado", datetime.now()),
-            "actualizado": orden.get("actualizado", datetime.now())
-        }
\ No newline at end of file
+    def _fold(self, operation: str, before: Optional[dict] = None, after: Optional[dict] = None):
+        """Best-effort agg_ventas fold: the orden write has already committed, so a failure is
+        logged and counted (the rebuild job repairs the buckets), never reported to the client"""
+        if not self.aggregates:
+            return
+        try:
+            self.aggregates.fold(before=before, after=after)
+        except Exception as e:
+            self._fold_failed(operation, e)
+    
+    def _fold_many(self, ordenes: List[dict]):
+        if not self.aggregates:
+            return
+        try:
+            self.aggregates.fold_many(ordenes)
+        except Exception as e:
+            self._fold_failed("bulk_create", e)
+    
+    def _count(self, filter_criteria: dict, include_total: bool) -> Optional[int]:
+        """Cached total for filter_criteria, or None when the caller opted out"""
+        if not include_total:
+            return None
+        return self.totals.count(self.collection, filter_criteria)
+    
+    def check_totals(self, batch_size: int = 1000, fix: bool = False) -> dict:
+        """Batch consistency check of stored totals against their items, optionally repairing them"""
+        projection = {"items.precio_unit": 1, "items.cantidad": 1, "items.descuento_pct": 1, "total": 1, "total_usd": 1, "moneda": 1, "fecha": 1}
+        report = {"checked": 0, "mismatched": 0, "fixed": 0, "sample": []}
+        pending = []
+
+        for orden in self.collection.find({}, projection).batch_size(batch_size):
+            report["checked"] += 1
+            total = round(self._calculate_total(orden.get("items", [])), 2)
+            total_usd = self._total_usd(total, orden.get("moneda"), to_fecha(orden.get("fecha")))
+            if total_usd is None and _is_amount(orden.get("total_usd")):
+                # No rate for this orden here; keep what the ETL stored
+                total_usd = orden.get("total_usd")
+            # A missing or non-numeric stored total is drift like any other
+            if _same_amount(orden.get("total"), total) and _same_amount(orden.get("total_usd"), total_usd):
+                continue
+
+            report["mismatched"] += 1
+            if len(report["sample"]) < 20:
+                report["sample"].append(str(orden["_id"]))
+            if fix:
+                pending.append(UpdateOne({"_id": orden["_id"]}, {"$set": {"total": total, "total_usd": total_usd}}))
+            if len(pending) >= batch_size:
+                report["fixed"] += self.collection.bulk_write(pending, ordered=False).modified_count
+                pending = []
+
+        if pending:
+            report["fixed"] += self.collection.bulk_write(pending, ordered=False).modified_count
+        if report["fixed"]:
+            self.stats.invalidate()
+        return report
+    
+    def migrate_fecha(self, batch_size: int = 1000, dry_run: bool = False) -> dict:
+        """Rewrite fecha values stored as strings into BSON dates, in bulk batches.
+        Values that do not parse are left alone and reported."""
+        report = {"checked": 0, "converted": 0, "unparseable": 0, "sample": []}
+        pending = []
+
+        # $type walks the string range of the ordenes_fecha index, so converted documents drop out of it
+        for orden in self.collection.find({"fecha": {"$type": "string"}}, {"fecha": 1}).batch_size(batch_size):
+            report["checked"] += 1
+            fecha = to_fecha(orden["fecha"])
+            if fecha is None:
+                report["unparseable"] += 1
+                if len(report["sample"]) < 20:
+                    report["sample"].append(str(orden["_id"]))
+                continue
+            if dry_run:
+                continue
+
+            # Match the old value too, so a concurrent write is not overwritten
+            pending.append(UpdateOne({"_id": orden["_id"], "fecha": orden["fecha"]}, {"$set": {"fecha": fecha}}))
+            if len(pending) >= batch_size:
+                report["converted"] += self.collection.bulk_write(pending, ordered=False).modified_count
+                pending = []
+
+        if pending:
+            report["converted"] += self.collection.bulk_write(pending, ordered=False).modified_count
+        if report["converted"]:
+            # Range counts change once the strings become dates; day and month buckets do not
+            self.totals.invalidate()
+        return report
@@ -0,0 +1,237 @@
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from api.config import settings
+
+# (dia, canal, moneda); dia is "YYYY-MM-DD" or None for ordenes without a usable fecha
+StatsKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+DIMENSIONS = ("canal", "moneda", "dia", "mes", "anio")
+
+# fecha is a BSON date (API writes, loaders); documents not yet run through
+# api.jobs.migrate_orden_fecha still hold ISO strings, whose first 10 characters are the day
+_DIA = {"$cond": [
+    {"$eq": [{"$type": "$fecha"}, "date"]},
+    {"$dateToString": {"format": "%Y-%m-%d", "date": "$fecha"}},
+    {"$substrBytes": [{"$ifNull": [{"$toString": "$fecha"}, ""]}, 0, 10]},
+]}
+
+_METRICS = {
+    "ordenes": {"$sum": 1},
+    "revenue": {"$sum": "$total"},
+    "min": {"$min": "$total"},
+    "max": {"$max": "$total"}
+}
+
+
+def orden_dia(fecha) -> Optional[str]:
+    """Day bucket of an orden fecha, computed the same way as the aggregation"""
+    if isinstance(fecha, datetime):
+        return fecha.strftime("%Y-%m-%d")
+    if not fecha:
+        return None
+    return str(fecha)[:10] or None
+
+
+def _dia_bound(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+def _empty() -> dict:
+    return {"ordenes": 0, "revenue": 0.0, "min": None, "max": None}
+
+
+def _merge(target: dict, bucket: dict):
+    target["ordenes"] += bucket["ordenes"]
+    target["revenue"] += bucket["revenue"]
+    for field, pick in (("min", min), ("max", max)):
+        if bucket[field] is not None:
+            target[field] = bucket[field] if target[field] is None else pick(target[field], bucket[field])
+
+
+def _metrics(bucket: dict) -> dict:
+    ordenes = bucket["ordenes"]
+    return {
+        "total_ordenes": ordenes,
+        "total_revenue": round(bucket["revenue"], 2),
+        "avg_order_value": round(bucket["revenue"] / ordenes, 2) if ordenes else 0,
+        "min_order_value": bucket["min"] if bucket["min"] is not None else 0,
+        "max_order_value": bucket["max"] if bucket["max"] is not None else 0
+    }
+
+
+def _dimension(key: StatsKey, name: str) -> Optional[str]:
+    dia, canal, moneda = key
+    if name == "canal":
+        return canal
+    if name == "moneda":
+        return moneda
+    if dia is None:
+        return None
+    return {"dia": dia, "mes": dia[:7], "anio": dia[:4]}[name]
+
+
+class OrdenStats:
+    """Ordenes statistics pre-bucketed by (dia, canal, moneda), filled by one $facet and kept current by writes.
+
+    A fill is cached for ttl seconds; create/update/delete fold their change into the buckets in
+    between. Removing an orden that holds a bucket's min or max cannot be folded, so it drops the
+    cache and the next read refills.
+    """
+
+    def __init__(self, ttl: float = None):
+        self.ttl = settings.MONGO_STATS_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._global: Optional[dict] = None
+        self._buckets: Optional[Dict[StatsKey, dict]] = None
+        self._expires = 0.0
+        self._version = 0
+        self.fills = 0
+
+    @staticmethod
+    def pipeline() -> List[dict]:
+        return [
+            {"$project": {"fecha": 1, "canal": 1, "moneda": 1, "total": 1}},
+            {
+                "$facet": {
+                    "global": [{"$group": {"_id": None, **_METRICS}}],
+                    "buckets": [{"$group": {"_id": {"dia": _DIA, "canal": "$canal", "moneda": "$moneda"}, **_METRICS}}]
+                }
+            }
+        ]
+
+    def summary(self, collection, fecha_inicio=None, fecha_fin=None, group_by: Sequence[str] = ()) -> dict:
+        with self._lock:
+            if self._fresh():
+                return self._query(fecha_inicio, fecha_fin, group_by)
+            version = self._version
+        results = list(collection.aggregate(self.pipeline()))
+        return self._fill(results, version, fecha_inicio, fecha_fin, group_by)
+
+    async def summary_async(self, collection, fecha_inicio=None, fecha_fin=None, group_by: Sequence[str] = ()) -> dict:
+        """summary for Motor collections"""
+        with self._lock:
+            if self._fresh():
+                return self._query(fecha_inicio, fecha_fin, group_by)
+            version = self._version
+        results = await collection.aggregate(self.pipeline()).to_list(length=None)
+        return self._fill(results, version, fecha_inicio, fecha_fin, group_by)
+
+    def apply(self, before: Optional[dict] = None, after: Optional[dict] = None):
+        """Fold one write into the cached buckets (create: before=None, delete: after=None)"""
+        with self._lock:
+            self._version += 1
+            if self._buckets is None:
+                return
+            if before is not None and after is not None and self._key(before) == self._key(after) and before.get("total") == after.get("total"):
+                return
+            if before is not None and not self._remove(before):
+                self._clear()
+                return
+            if after is not None:
+                self._add(after)
+
+    def apply_many(self, ordenes: List[dict]):
+        with self._lock:
+            self._version += 1
+            if self._buckets is None:
+                return
+            for orden in ordenes:
+                self._add(orden)
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._clear()
+
+    def _fresh(self) -> bool:
+        return self._buckets is not None and self._expires >= time.monotonic()
+
+    def _clear(self):
+        self._global = None
+        self._buckets = None
+
+    def _fill(self, results: List[dict], version: int, fecha_inicio, fecha_fin, group_by: Sequence[str]) -> dict:
+        facets = results[0] if results else {}
+        total = _empty()
+        for row in facets.get("global", []):
+            _merge(total, row)
+        buckets: Dict[StatsKey, dict] = {}
+        for row in facets.get("buckets", []):
+            key = (row["_id"].get("dia") or None, row["_id"].get("canal"), row["_id"].get("moneda"))
+            _merge(buckets.setdefault(key, _empty()), row)
+
+        with self._lock:
+            self.fills += 1
+            self._global, self._buckets = total, buckets
+            result = self._query(fecha_inicio, fecha_fin, group_by)
+            if self.ttl > 0 and version == self._version:
+                self._expires = time.monotonic() + self.ttl
+            else:
+                # A write landed while aggregating; serve this result but do not keep it
+                self._clear()
+            return result
+
+    def _add(self, orden: dict):
+        value = orden.get("total")
+        for bucket in (self._global, self._buckets.setdefault(self._key(orden), _empty())):
+            bucket["ordenes"] += 1
+            if value is not None:
+                _merge(bucket, {"ordenes": 0, "revenue": value, "min": value, "max": value})
+
+    def _remove(self, orden: dict) -> bool:
+        """Subtract one orden; False when the buckets can no longer be kept exact"""
+        key = self._key(orden)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return False
+        value = orden.get("total")
+        for target in (self._global, bucket):
+            target["ordenes"] -= 1
+            if value is None:
+                continue
+            target["revenue"] -= value
+            if target["ordenes"] > 0 and (value <= target["min"] or value >= target["max"]):
+                return False
+        if bucket["ordenes"] <= 0:
+            del self._buckets[key]
+        if self._global["ordenes"] <= 0:
+            self._global = _empty()
+        return True
+
+    @staticmethod
+    def _key(orden: dict) -> StatsKey:
+        return orden_dia(orden.get("fecha")), orden.get("canal"), orden.get("moneda")
+
+    def _query(self, fecha_inicio, fecha_fin, group_by: Sequence[str]) -> dict:
+        inicio, fin = _dia_bound(fecha_inicio), _dia_bound(fecha_fin)
+        if inicio is None and fin is None and not group_by:
+            return _metrics(self._global)
+
+        total = _empty()
+        groups: Dict[tuple, dict] = {}
+        for key, bucket in self._buckets.items():
+            dia = key[0]
+            if inicio is not None or fin is not None:
+                if dia is None or (inicio is not None and dia < inicio) or (fin is not None and dia > fin):
+                    continue
+            _merge(total, bucket)
+            if group_by:
+                _merge(groups.setdefault(tuple(_dimension(key, name) for name in group_by), _empty()), bucket)
+
+        result = _metrics(total)
+        if inicio is not None or fin is not None:
+            result["fecha_inicio"] = inicio
+            result["fecha_fin"] = fin
+        if group_by:
+            result["group_by"] = list(group_by)
+            result["breakdown"] = [
+                {**dict(zip(group_by, values)), **_metrics(bucket)}
+                for values, bucket in sorted(groups.items(), key=lambda item: [(value is None, value or "") for value in item[0]])
+            ]
+        return result
@@ -0,0 +1,100 @@
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from bson import json_util
+
+ID_SORT = ("_id",)
+FECHA_SORT = ("fecha", "_id")
+
+
+def encode_cursor(document: dict, fields: Sequence[str], direction: int = 1) -> str:
+    """Build an opaque cursor from the sort key of the last document of a page, recording the
+    sort it belongs to"""
+    payload = {"k": {field: document.get(field) for field in fields}, "s": list(fields), "d": direction}
+    raw = json_util.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, fields: Sequence[str], direction: int = 1) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if it is invalid or was
+    issued for another sort (e.g. an asc page's cursor reused with order=desc)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(payload, dict) or set(payload) != {"k", "s", "d"} or not isinstance(payload["k"], dict):
+        raise ValueError("Invalid cursor")
+    if payload["s"] != list(fields) or payload["d"] != direction or set(payload["k"]) != set(fields):
+        raise ValueError("Cursor does not match this sort order; restart from the first page")
+    return payload["k"]
+
+
+def keyset_filter(filter_criteria: dict, key: Dict[str, Any], fields: Sequence[str], direction: int = 1) -> dict:
+    """Restrict filter_criteria to documents sorted after key on fields (ascending, or descending for -1)"""
+    operator = "$gt" if direction == 1 else "$lt"
+    branches = []
+    for i, field in enumerate(fields):
+        branch = {prev: key[prev] for prev in fields[:i]}
+        branch[field] = {operator: key[field]}
+        branches.append(branch)
+
+    after = branches[0] if len(branches) == 1 else {"$or": branches}
+    if not filter_criteria:
+        return after
+    return {"$and": [filter_criteria, after]}
+
+
+def build_page_query(
+    filter_criteria: dict,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: Sequence[str] = ID_SORT,
+    direction: int = 1
+) -> Tuple[dict, List[Tuple[str, int]], int]:
+    """Return (filter, sort, skip) for either offset or keyset pagination"""
+    sort = [(field, direction) for field in fields]
+    if cursor:
+        key = decode_cursor(cursor, fields, direction)
+        return keyset_filter(filter_criteria, key, fields, direction), sort, 0
+    return filter_criteria, sort, (page - 1) * limit
+
+
+def next_cursor(documents: List[dict], limit: int, fields: Sequence[str] = ID_SORT, direction: int = 1) -> Optional[str]:
+    """Cursor for the page after documents, or None when this was the last page"""
+    if len(documents) < limit:
+        return None
+    return encode_cursor(documents[-1], fields, direction)
+
+
+def find_page(
+    collection,
+    filter_criteria: dict,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: Sequence[str] = ID_SORT,
+    projection: Optional[dict] = None,
+    direction: int = 1
+) -> Tuple[List[dict], Optional[str]]:
+    """Fetch one page of raw documents and the cursor for the next one"""
+    query, sort, skip = build_page_query(filter_criteria, page, limit, cursor, fields, direction)
+    documents = list(collection.find(query, projection).sort(sort).skip(skip).limit(limit))
+    return documents, next_cursor(documents, limit, fields, direction)
+
+
+async def async_find_page(
+    collection,
+    filter_criteria: dict,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: Sequence[str] = ID_SORT,
+    projection: Optional[dict] = None,
+    direction: int = 1
+) -> Tuple[List[dict], Optional[str]]:
+    """find_page for Motor collections"""
+    query, sort, skip = build_page_query(filter_criteria, page, limit, cursor, fields, direction)
+    documents = await collection.find(query, projection).sort(sort).skip(skip).limit(limit).to_list(length=limit)
+    return documents, next_cursor(documents, limit, fields, direction)
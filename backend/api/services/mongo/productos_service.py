@@ -1,16 +1,54 @@
 from bson import ObjectId
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from pymongo import ReturnDocument, UpdateOne
 from pymongo.collection import Collection
 from api.schemas.froms import ProductoFormData
+from api.services.mongo.pagination import find_page
+from api.services.mongo.totals_cache import TotalsCache, total_pages
+from api.services.cache import ReadCache, cached_read
+from api.services.mongo.batch_loader import BatchLoader, batch_result, check_batch_size
+from api.services.mongo.bulk import IndexedRow, insert_documents, new_bulk_result, upsert_documents, validate_rows
+from api.services.mongo.text_search import build_search, normalize_text, search_terms
 
 
-class ProductoService:
+PRODUCTO_PROJECTION = {"codigo": 1, "nombre": 1, "categoria": 1, "equivalencias": 1}
+
+
+def producto_helper(producto) -> dict:
+    """Transform a MongoDB document to ProductoResponse format"""
+    # equivalencias is optional (dropped when empty on write, partial in source data)
+    equivalencias = producto.get("equivalencias") or {}
+    return {
+        "id": str(producto["_id"]),
+        "codigo_mongo": producto.get("codigo", ""),
+        "nombre": producto["nombre"],
+        "categoria": producto["categoria"],
+        "equivalencias": {
+            "sku": equivalencias.get("sku"),
+            "codigo_alt": equivalencias.get("codigo_alt")
+        } if producto["categoria"] else None
+    }
+
+
+class ProductoServiceBase:
+    """Collection-agnostic half of the productos services: document builders and the shared caches"""
+    totals = TotalsCache()
+    cache = ReadCache("productos")
+
     def __init__(self, collection: Collection):
         self.collection = collection
+        self.loader = BatchLoader(self._find_by_ids)
     
-    def create_producto(self, producto_data: ProductoFormData) -> dict:
-        """Create a new producto"""
+    def _search_fields(self, producto: dict) -> dict:
+        """Accent-folded, lowercased copies of nombre/categoria used by the prefix search"""
+        return {
+            "nombre_norm": normalize_text(producto.get("nombre")),
+            "search_terms": search_terms(producto.get("nombre"), producto.get("categoria"))
+        }
+    
+    def _build_producto_document(self, producto_data: ProductoFormData) -> dict:
+        """Build the document stored for a new producto"""
         producto_dict = producto_data.model_dump()
         producto_dict["creado"] = datetime.now()
         
@@ -18,64 +56,98 @@ class ProductoService:
         categorias_adicionales = producto_dict.pop("equivalencias", None)
         if categorias_adicionales:
             producto_dict["equivalencias"] = categorias_adicionales
+        producto_dict.update(self._search_fields(producto_dict))
+        return producto_dict
+    
+    def _build_producto_update(self, producto_update: ProductoFormData) -> dict:
+        """Build the $set document for a partial producto update"""
+        # Convert to dict and remove None values for partial update
+        update_data = producto_update.model_dump(exclude_unset=True)
+        
+        # Don't allow updating created timestamp
+        if 'creado' in update_data:
+            del update_data['creado']
         
-        result = self.collection.insert_one(producto_dict)
-        created_producto = self.collection.find_one({"_id": result.inserted_id})
-        return self._producto_helper(created_producto)
+        if "nombre" in update_data and "categoria" in update_data:
+            update_data.update(self._search_fields(update_data))
+        return update_data
+
+
+class ProductoService(ProductoServiceBase):
+    """Productos on a pymongo collection, plus the bulk load and the search field backfill"""
     
-    def get_productos(self, page: int = 1, limit: int = 20) -> dict:
-        """Get paginated list of productos"""
-        productos = []
-        skip = (page - 1) * limit
-        total = self.collection.count_documents({})
+    def create_producto(self, producto_data: ProductoFormData) -> dict:
+        """Create a new producto"""
+        producto_dict = self._build_producto_document(producto_data)
         
-        for producto in self.collection.find().skip(skip).limit(limit):
-            productos.append(self._producto_helper(producto))
+        self.collection.insert_one(producto_dict)  # sets producto_dict["_id"]
+        self.totals.invalidate()
+        self.cache.invalidate()
+        return producto_helper(producto_dict)
+    
+    def bulk_create_productos(self, rows: List[IndexedRow], upsert: bool = False) -> dict:
+        """Validate and write one chunk of raw rows; upsert matches existing productos by codigo"""
+        result = new_bulk_result()
+        result["received"] = len(rows)
+        documents, result["errors"] = validate_rows(rows, ProductoFormData, self._build_producto_document)
+
+        if upsert:
+            result["upserted"], result["modified"], errors = upsert_documents(self.collection, documents, "codigo")
+        else:
+            result["inserted"], errors = insert_documents(self.collection, documents)
+        result["errors"].extend(errors)
+
+        if result["inserted"] or result["upserted"]:
+            self.totals.invalidate()
+        if result["inserted"] or result["upserted"] or result["modified"]:
+            self.cache.invalidate()
+        return result
+    
+    @cached_read
+    def get_productos(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> dict:
+        """Get paginated list of productos (offset or keyset on _id)"""
+        total = self._count({}, include_total)
+        documents, page_cursor = find_page(self.collection, {}, page, limit, cursor, projection=PRODUCTO_PROJECTION)
+        productos = [producto_helper(producto) for producto in documents]
             
         return {
             "data": productos,
             "total": total,
             "page": page,
             "limit": limit,
-            "pages": (total + limit - 1) // limit  # Calculate total pages
+            "pages": total_pages(total, limit),
+            "next_cursor": page_cursor
         }
     
+    @cached_read
     def get_producto_by_id(self, producto_id: str) -> Optional[dict]:
         """Get a single producto by ID"""
         if not ObjectId.is_valid(producto_id):
             return None
             
-        producto = self.collection.find_one({"_id": ObjectId(producto_id)})
-        return self._producto_helper(producto) if producto else None
+        producto = self.collection.find_one({"_id": ObjectId(producto_id)}, PRODUCTO_PROJECTION)
+        return producto_helper(producto) if producto else None
     
     def update_producto(self, producto_id: str, producto_update: ProductoFormData) -> Optional[dict]:
         """Update a producto partially"""
         if not ObjectId.is_valid(producto_id):
             return None
             
-        # Convert to dict and remove None values for partial update
-        update_data = producto_update.model_dump(exclude_unset=True)
-        
-        # Handle categoriasAdicionales transformation
-        categorias_adicionales = update_data.pop("categoriasAdicionales", None)
-        if categorias_adicionales is not None:  # Include even if empty dict
-            update_data["categorias_adicionales"] = categorias_adicionales
+        update_data = self._build_producto_update(producto_update)
         
-        # Don't allow updating created timestamp
-        if 'creado' in update_data:
-            del update_data['creado']
-        
-        result = self.collection.update_one(
+        # Update and read back the new document in one round trip
+        updated_producto = self.collection.find_one_and_update(
             {"_id": ObjectId(producto_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.modified_count == 0:
+        if updated_producto is None:
             return None
+        self.totals.invalidate()
+        self.cache.invalidate()
             
-        # Return updated document
-        updated_producto = self.collection.find_one({"_id": ObjectId(producto_id)})
-        return self._producto_helper(updated_producto)
+        return producto_helper(updated_producto)
     
     def delete_producto(self, producto_id: str) -> bool:
         """Delete a producto by ID"""
@@ -83,43 +155,64 @@ class ProductoService:
             return False
             
         result = self.collection.delete_one({"_id": ObjectId(producto_id)})
+        if result.deleted_count > 0:
+            self.totals.invalidate()
+            self.cache.invalidate()
         return result.deleted_count > 0
     
-    def search_productos(self, query: str, page: int = 1, limit: int = 20) -> dict:
-        """Search productos by name or category"""
-        productos = []
+    @cached_read
+    def get_productos_by_ids(self, ids: List[str]) -> dict:
+        """Productos for a list of ids, in request order; one $in for the ids not loaded yet"""
+        keys = check_batch_size(ids)
+        return batch_result(keys, self.loader.load_many(keys), producto_helper)
+    
+    def _find_by_ids(self, object_ids: List[ObjectId]) -> List[dict]:
+        return list(self.collection.find({"_id": {"$in": object_ids}}, PRODUCTO_PROJECTION))
+    
+    def search_productos(self, query: str, page: int = 1, limit: int = 20, include_total: bool = True, mode: str = "text") -> dict:
+        """Search productos by name or category (text: ranked, prefix: autocomplete, regex: substring scan)"""
         skip = (page - 1) * limit
         
-        search_filter = {
-            "$or": [
-                {"nombre": {"$regex": query, "$options": "i"}},
-                {"categoria": {"$regex": query, "$options": "i"}}
-            ]
-        }
-        
-        total = self.collection.count_documents(search_filter)
+        search_filter, projection, sort = build_search(query, mode)
+        total = self._count(search_filter, include_total)
         
-        for producto in self.collection.find(search_filter).skip(skip).limit(limit):
-            productos.append(self._producto_helper(producto))
+        cursor = self.collection.find(search_filter, projection).sort(sort).skip(skip).limit(limit)
+        productos = [producto_helper(producto) for producto in cursor]
             
         return {
             "data": productos,
             "total": total,
             "page": page,
             "limit": limit,
-            "query": query
+            "query": query,
+            "mode": mode
         }
     
-    def get_productos_by_categoria(self, categoria: str, page: int = 1, limit: int = 20) -> dict:
+    def backfill_search_fields(self, batch_size: int = 1000) -> int:
+        """Populate nombre_norm/search_terms on productos written before they existed"""
+        updated = 0
+        pending = []
+        missing = {"search_terms": {"$exists": False}}
+        for producto in self.collection.find(missing, {"nombre": 1, "categoria": 1}).batch_size(batch_size):
+            pending.append(UpdateOne({"_id": producto["_id"]}, {"$set": self._search_fields(producto)}))
+            if len(pending) >= batch_size:
+                updated += self.collection.bulk_write(pending, ordered=False).modified_count
+                pending = []
+        if pending:
+            updated += self.collection.bulk_write(pending, ordered=False).modified_count
+        return updated
+    
+    @cached_read
+    def get_productos_by_categoria(self, categoria: str, page: int = 1, limit: int = 20, include_total: bool = True) -> dict:
         """Get productos by category"""
         productos = []
         skip = (page - 1) * limit
         
         filter_criteria = {"categoria": categoria}
-        total = self.collection.count_documents(filter_criteria)
+        total = self._count(filter_criteria, include_total)
         
-        for producto in self.collection.find(filter_criteria).skip(skip).limit(limit):
-            productos.append(self._producto_helper(producto))
+        for producto in self.collection.find(filter_criteria, PRODUCTO_PROJECTION).skip(skip).limit(limit):
+            productos.append(producto_helper(producto))
             
         return {
             "data": productos,
@@ -129,15 +222,8 @@ class ProductoService:
             "categoria": categoria
         }
     
-    def _producto_helper(self, producto) -> dict:
-        """Helper function to transform MongoDB document to ProductoResponse format"""
-        return {
-            "id": str(producto["_id"]),
-            "codigo_mongo": producto.get("codigo", ""),
-            "nombre": producto["nombre"],
-            "categoria": producto["categoria"],
-            "equivalencias": {
-                "sku": producto["equivalencias"].get("sku"),
-                "codigo_alt": producto["equivalencias"].get("codigo_alt")
-            } if producto["categoria"] else None
-        }
\ No newline at end of file
+    def _count(self, filter_criteria: dict, include_total: bool) -> Optional[int]:
+        """Cached total for filter_criteria, or None when the caller opted out"""
+        if not include_total:
+            return None
+        return self.totals.count(self.collection, filter_criteria)
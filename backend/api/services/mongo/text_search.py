@@ -0,0 +1,54 @@
+import re
+import unicodedata
+from typing import List, Optional, Tuple
+
+SEARCH_MODES = ("text", "prefix", "regex")
+
+TEXT_INDEX = [("nombre", "text"), ("categoria", "text")]
+TEXT_INDEX_OPTIONS = {"name": "productos_text", "weights": {"nombre": 10, "categoria": 2}, "default_language": "spanish"}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lowercase and strip accents so 'Café Molido' and 'cafe molido' compare equal"""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(folded.lower().split())
+
+
+def search_terms(*values: Optional[str]) -> List[str]:
+    """Distinct normalized words of the given fields, stored for index-backed prefix search"""
+    terms = set()
+    for value in values:
+        terms.update(_TOKEN.findall(normalize_text(value)))
+    return sorted(terms)
+
+
+def build_search(query: str, mode: str) -> Tuple[dict, Optional[dict], list]:
+    """Return (filter, projection, sort) for a producto search in the given mode"""
+    if mode == "text":
+        score = {"score": {"$meta": "textScore"}}
+        return {"$text": {"$search": query}}, score, [("score", {"$meta": "textScore"}), ("_id", 1)]
+
+    if mode == "prefix":
+        tokens = _TOKEN.findall(normalize_text(query))
+        if not tokens:
+            return {"_id": {"$exists": False}}, None, [("_id", 1)]
+        # Anchored, case-sensitive regexes on normalized terms can use the search_terms index
+        return {
+            "$and": [{"search_terms": {"$regex": "^" + re.escape(token)}} for token in tokens]
+        }, None, [("nombre_norm", 1), ("_id", 1)]
+
+    if mode == "regex":
+        pattern = re.escape(query)
+        return {
+            "$or": [
+                {"nombre": {"$regex": pattern, "$options": "i"}},
+                {"categoria": {"$regex": pattern, "$options": "i"}}
+            ]
+        }, None, [("_id", 1)]
+
+    raise ValueError(f"Unknown search mode '{mode}', expected one of {', '.join(SEARCH_MODES)}")
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from bson import json_util
+from api.config import settings
+
+
+class TotalsCache:
+    """TTL cache of count_documents results, keyed by filter, shared by a service class.
+
+    Filters come from requests (search text, cliente ids, fecha ranges), so the cache is an LRU
+    bounded by maxsize; expired entries are dropped first when it is full.
+    """
+
+    def __init__(self, ttl: float = None, estimated: bool = None, maxsize: int = None):
+        self.ttl = settings.MONGO_TOTALS_TTL if ttl is None else ttl
+        self.estimated = settings.MONGO_ESTIMATED_COUNT if estimated is None else estimated
+        self.maxsize = settings.MONGO_TOTALS_MAXSIZE if maxsize is None else maxsize
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(filter_criteria: dict) -> str:
+        return json_util.dumps(filter_criteria, sort_keys=True)
+
+    def get(self, filter_criteria: dict) -> Optional[int]:
+        key = self.key(filter_criteria)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, total = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return total
+
+    def set(self, filter_criteria: dict, total: int) -> int:
+        if self.ttl > 0 and self.maxsize > 0:
+            key = self.key(filter_criteria)
+            now = time.monotonic()
+            with self._lock:
+                self._entries[key] = (now + self.ttl, total)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    for expired in [k for k, (expires, _) in self._entries.items() if expires < now]:
+                        del self._entries[expired]
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return total
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+
+    def use_estimate(self, filter_criteria: dict) -> bool:
+        """Unfiltered totals may come from collection metadata when opted in"""
+        return self.estimated and not filter_criteria
+
+    def count(self, collection, filter_criteria: dict) -> int:
+        total = self.get(filter_criteria)
+        if total is not None:
+            return total
+
+        if self.use_estimate(filter_criteria):
+            total = collection.estimated_document_count()
+        else:
+            total = collection.count_documents(filter_criteria)
+        return self.set(filter_criteria, total)
+
+    async def count_async(self, collection, filter_criteria: dict) -> int:
+        """count for Motor collections"""
+        total = self.get(filter_criteria)
+        if total is not None:
+            return total
+
+        if self.use_estimate(filter_criteria):
+            total = await collection.estimated_document_count()
+        else:
+            total = await collection.count_documents(filter_criteria)
+        return self.set(filter_criteria, total)
+
+    async def optional_count_async(self, collection, filter_criteria: dict, include_total: bool) -> Optional[int]:
+        """count_async, or None when the caller opted out of the total"""
+        if not include_total:
+            return None
+        return await self.count_async(collection, filter_criteria)
+
+
+def total_pages(total: Optional[int], limit: int) -> Optional[int]:
+    return (total + limit - 1) // limit if total is not None else None
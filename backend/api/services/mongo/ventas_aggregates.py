@@ -0,0 +1,161 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from pymongo import UpdateOne
+from api.database.indexes import INDEXES
+from api.services.exchange_rates import to_usd
+
+logger = logging.getLogger(__name__)
+
+# (anio, mes, item): the AGG_VENTAS_USD grain; montos are converted to USD line by line
+BucketKey = Tuple[int, int, str]
+
+
+def orden_fecha(fecha) -> Optional[datetime]:
+    """Naive datetime of an orden fecha stored as a datetime or an ISO string"""
+    if isinstance(fecha, datetime):
+        return fecha.replace(tzinfo=None)
+    try:
+        return datetime.fromisoformat(str(fecha).strip().replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def bucket_deltas(orden: Optional[dict], sign: int = 1) -> Dict[BucketKey, Dict[str, float]]:
+    """Contribution of one orden to its buckets (negated with sign=-1).
+
+    Lines are converted with the as-of rate of the orden fecha; a line with no USD value (no
+    rate for its fecha, unknown moneda) has no place in the USD grain and is left out.
+    """
+    deltas: Dict[BucketKey, Dict[str, float]] = defaultdict(lambda: {"cantidad": 0, "monto": 0.0, "lineas": 0})
+    if not orden:
+        return deltas
+    fecha = orden_fecha(orden.get("fecha"))
+    if fecha is None:
+        return deltas
+
+    for item in orden.get("items") or []:
+        precio = item["precio_unit"]
+        if item.get("descuento_pct"):
+            precio = precio * (1 - item["descuento_pct"] / 100)
+        monto = to_usd(precio * item["cantidad"], orden.get("moneda"), fecha)
+        if monto is None:
+            continue
+        bucket = deltas[(fecha.year, fecha.month, str(item["producto_id"]))]
+        bucket["cantidad"] += sign * item["cantidad"]
+        bucket["monto"] += sign * monto
+        bucket["lineas"] += sign
+    return deltas
+
+
+def change_deltas(before: Optional[dict], after: Optional[dict]) -> Dict[BucketKey, Dict[str, float]]:
+    """Net bucket change of replacing before with after (either may be None)"""
+    deltas = bucket_deltas(after)
+    for key, removed in bucket_deltas(before, sign=-1).items():
+        bucket = deltas[key]
+        for field, value in removed.items():
+            bucket[field] += value
+    return {key: bucket for key, bucket in deltas.items() if any(bucket.values())}
+
+
+def bucket_id(key: BucketKey) -> dict:
+    anio, mes, item = key
+    return {"anio": anio, "mes": mes, "item": item}
+
+
+class VentasAggregates:
+    """Per-(anio, mes, item) USD sales buckets folded in as ordenes are written"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def _operations(self, deltas: Dict[BucketKey, Dict[str, float]]) -> List[UpdateOne]:
+        return [
+            UpdateOne(
+                {"_id": bucket_id(key)},
+                {"$inc": bucket, "$setOnInsert": bucket_id(key)},
+                upsert=True
+            )
+            for key, bucket in deltas.items()
+        ]
+
+    def fold(self, before: Optional[dict] = None, after: Optional[dict] = None) -> int:
+        """Apply the change from before to after (create: before=None, delete: after=None)"""
+        operations = self._operations(change_deltas(before, after))
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    def fold_many(self, ordenes: List[dict]) -> int:
+        """Add a batch of new ordenes with one bulk write"""
+        deltas: Dict[BucketKey, Dict[str, float]] = {}
+        for orden in ordenes:
+            for key, delta in bucket_deltas(orden).items():
+                bucket = deltas.setdefault(key, {"cantidad": 0, "monto": 0.0, "lineas": 0})
+                for field, value in delta.items():
+                    bucket[field] += value
+        operations = self._operations(deltas)
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    async def fold_async(self, before: Optional[dict] = None, after: Optional[dict] = None) -> int:
+        """fold for Motor collections"""
+        operations = self._operations(change_deltas(before, after))
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+        return len(operations)
+
+    def rebuild(self, ordenes_collection, batch_size: int = 1000) -> dict:
+        """Recompute every bucket from ordenes in one pass (backfill or repair).
+
+        Buckets are built in a side collection that then replaces agg_ventas with one rename, so
+        readers never see it empty. Folds applied while the scan runs go to the replaced
+        collection; ordenes written during a rebuild may need another one.
+        """
+        deltas: Dict[BucketKey, Dict[str, float]] = {}
+        scanned = 0
+        projection = {"fecha": 1, "moneda": 1, "items.producto_id": 1, "items.cantidad": 1, "items.precio_unit": 1, "items.descuento_pct": 1}
+        for orden in ordenes_collection.find({}, projection).batch_size(batch_size):
+            scanned += 1
+            for key, delta in bucket_deltas(orden).items():
+                bucket = deltas.setdefault(key, {"cantidad": 0, "monto": 0.0, "lineas": 0})
+                for field, value in delta.items():
+                    bucket[field] += value
+
+        staging = self.collection.database[f"{self.collection.name}_rebuild"]
+        staging.drop()
+        # Creates the side collection even when there are no buckets, and carries the indexes over
+        staging.create_indexes(INDEXES["agg_ventas"])
+        documents = [{"_id": bucket_id(key), **bucket_id(key), **bucket} for key, bucket in deltas.items()]
+        for start in range(0, len(documents), batch_size):
+            staging.insert_many(documents[start:start + batch_size], ordered=False)
+        staging.rename(self.collection.name, dropTarget=True)
+        logger.info("agg_ventas rebuilt: %d buckets from %d ordenes", len(documents), scanned)
+        return {"ordenes": scanned, "buckets": len(documents)}
+
+    def monthly(self, anio: Optional[int] = None, mes: Optional[int] = None) -> List[dict]:
+        """AGG_VENTAS_USD-shaped months: [{anio, mes, ventas: [{item, cantidad, precio, monto}]}], amounts in USD"""
+        filter_criteria = {"cantidad": {"$gt": 0}}
+        if anio is not None:
+            filter_criteria["anio"] = anio
+        if mes is not None:
+            filter_criteria["mes"] = mes
+
+        months: Dict[tuple, List[dict]] = defaultdict(list)
+        sort = [("anio", 1), ("mes", 1), ("item", 1)]
+        for bucket in self.collection.find(filter_criteria, {"_id": 0}).sort(sort):
+            monto = round(bucket["monto"], 2)
+            months[(bucket["anio"], bucket["mes"])].append({
+                "item": bucket["item"],
+                "cantidad": bucket["cantidad"],
+                # Average net unit price, the precio of AGG_VENTAS_USD
+                "precio": round(monto / bucket["cantidad"], 2),
+                "monto": monto,
+            })
+
+        return [
+            {"anio": anio, "mes": mes, "ventas": ventas}
+            for (anio, mes), ventas in months.items()
+        ]
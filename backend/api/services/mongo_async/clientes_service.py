@@ -0,0 +1,72 @@
+from bson import ObjectId
+from pymongo import ReturnDocument
+from typing import List, Optional
+from api.schemas.froms import ClienteFormData
+from api.services.mongo.clientes_service import CLIENTE_PROJECTION, ClienteServiceBase, cliente_helper
+from api.services.cache import cached_read
+from api.services.mongo.batch_loader import batch_result, check_batch_size
+from api.services.mongo.pagination import async_find_page
+
+
+class AsyncClienteService(ClienteServiceBase):
+    """Clientes on a Motor collection; only the builders and helpers are shared with ClienteService"""
+
+    async def create_cliente(self, cliente_data: ClienteFormData) -> dict:
+        cliente_dict = self._build_cliente_document(cliente_data)
+
+        await self.collection.insert_one(cliente_dict)  # sets cliente_dict["_id"]
+        self.totals.invalidate()
+        self.cache.invalidate()
+        return cliente_helper(cliente_dict)
+
+    @cached_read
+    async def get_clientes(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> dict:
+        total = await self.totals.optional_count_async(self.collection, {}, include_total)
+        documents, page_cursor = await async_find_page(self.collection, {}, page, limit, cursor, projection=CLIENTE_PROJECTION)
+        clientes = [cliente_helper(cliente) for cliente in documents]
+
+        return {"data": clientes, "total": total, "next_cursor": page_cursor}
+
+    @cached_read
+    async def get_cliente_by_id(self, cliente_id: str) -> Optional[dict]:
+        if not ObjectId.is_valid(cliente_id):
+            return None
+
+        cliente = await self.collection.find_one({"_id": ObjectId(cliente_id)}, CLIENTE_PROJECTION)
+        return cliente_helper(cliente) if cliente else None
+
+    @cached_read
+    async def get_clientes_by_ids(self, ids: List[str]) -> dict:
+        """Clientes for a list of ids, in request order; one $in for the ids not loaded yet"""
+        keys = check_batch_size(ids)
+        return batch_result(keys, await self.loader.load_many_async(keys), cliente_helper)
+
+    async def _find_by_ids(self, object_ids: List[ObjectId]) -> List[dict]:
+        return await self.collection.find({"_id": {"$in": object_ids}}, CLIENTE_PROJECTION).to_list(length=None)
+
+    async def update_cliente(self, cliente_id: str, cliente_update: ClienteFormData) -> Optional[dict]:
+        if not ObjectId.is_valid(cliente_id):
+            return None
+
+        updated_cliente = await self.collection.find_one_and_update(
+            {"_id": ObjectId(cliente_id)},
+            {"$set": self._build_cliente_update(cliente_update)},
+            return_document=ReturnDocument.AFTER
+        )
+
+        if updated_cliente is None:
+            return None
+        self.totals.invalidate()
+        self.cache.invalidate()
+
+        return cliente_helper(updated_cliente)
+
+    async def delete_cliente(self, cliente_id: str) -> bool:
+        if not ObjectId.is_valid(cliente_id):
+            return False
+
+        result = await self.collection.delete_one({"_id": ObjectId(cliente_id)})
+        if result.deleted_count > 0:
+            self.totals.invalidate()
+            self.cache.invalidate()
+        return result.deleted_count > 0
@@ -0,0 +1,131 @@
+from bson import ObjectId
+from datetime import datetime
+from typing import Optional, Sequence
+from pymongo import ReturnDocument
+from api.schemas.froms import OrdenFormData
+from api.services.mongo.ordenes_service import ORDEN_PROJECTION, OrdenServiceBase, expand_pipeline
+from api.services.mongo.pagination import async_find_page, next_cursor, FECHA_SORT
+from api.services.mongo.totals_cache import total_pages
+
+
+class AsyncOrdenService(OrdenServiceBase):
+    """Ordenes on a Motor collection; only the builders and helpers are shared with OrdenService"""
+
+    async def create_orden(self, orden_data: OrdenFormData) -> dict:
+        """Create a new orden"""
+        orden_dict = self._build_orden_document(orden_data)
+
+        await self.collection.insert_one(orden_dict)  # sets orden_dict["_id"]
+        self.totals.invalidate()
+        self.stats.apply(after=orden_dict)
+        await self._fold_async("create", after=orden_dict)
+        return self._orden_helper(orden_dict)
+
+    async def get_ordenes(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True, expand: Sequence[str] = ()) -> dict:
+        """Get paginated list of ordenes (offset or keyset on _id), optionally with cliente/productos joined in"""
+        expand = self._expansions(expand)
+        total = await self.totals.optional_count_async(self.collection, {}, include_total)
+        if expand:
+            documents = await self.collection.aggregate(expand_pipeline(page, limit, cursor, expand)).to_list(length=limit)
+            ordenes = [self._expanded_helper(orden, expand) for orden in documents]
+            page_cursor = next_cursor(documents, limit)
+        else:
+            documents, page_cursor = await async_find_page(self.collection, {}, page, limit, cursor, projection=ORDEN_PROJECTION)
+            ordenes = [self._orden_helper(orden) for orden in documents]
+
+        return {
+            "data": ordenes,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "pages": total_pages(total, limit),
+            "next_cursor": page_cursor
+        }
+
+    async def get_orden_by_id(self, orden_id: str) -> Optional[dict]:
+        """Get a single orden by ID"""
+        if not ObjectId.is_valid(orden_id):
+            return None
+
+        orden = await self.collection.find_one({"_id": ObjectId(orden_id)}, ORDEN_PROJECTION)
+        return self._orden_helper(orden) if orden else None
+
+    async def update_orden(self, orden_id: str, orden_update: OrdenFormData) -> Optional[dict]:
+        """Update an orden partially"""
+        if not ObjectId.is_valid(orden_id):
+            return None
+
+        update_data = self._build_orden_update(orden_update)
+        previous = await self.collection.find_one_and_update(
+            {"_id": ObjectId(orden_id)},
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE
+        )
+
+        if previous is None:
+            return None
+        updated_orden = {**previous, **update_data}
+        self.totals.invalidate()
+        self.stats.apply(before=previous, after=updated_orden)
+        await self._fold_async("update", before=previous, after=updated_orden)
+
+        return self._orden_helper(updated_orden)
+
+    async def delete_orden(self, orden_id: str) -> bool:
+        """Delete an orden by ID"""
+        if not ObjectId.is_valid(orden_id):
+            return False
+
+        deleted = await self.collection.find_one_and_delete({"_id": ObjectId(orden_id)})
+        if deleted is None:
+            return False
+        self.totals.invalidate()
+        self.stats.apply(before=deleted)
+        await self._fold_async("delete", before=deleted)
+        return True
+
+    async def get_ordenes_by_cliente(self, cliente_id: str, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> dict:
+        """Get ordenes by cliente ID"""
+        filter_criteria = {"cliente_id": cliente_id}
+        total = await self.totals.optional_count_async(self.collection, filter_criteria, include_total)
+        documents, page_cursor = await async_find_page(self.collection, filter_criteria, page, limit, cursor, projection=ORDEN_PROJECTION)
+
+        return {
+            "data": [self._orden_helper(orden) for orden in documents],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "cliente_id": cliente_id,
+            "next_cursor": page_cursor
+        }
+
+    async def get_ordenes_by_fecha(self, fecha_inicio: datetime, fecha_fin: datetime, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True, order: str = "asc") -> dict:
+        """Get ordenes by date range, keyset-paginated on (fecha, _id) in either direction"""
+        filter_criteria = self._fecha_filter(fecha_inicio, fecha_fin)
+
+        total = await self.totals.optional_count_async(self.collection, filter_criteria, include_total)
+        documents, page_cursor = await async_find_page(self.collection, filter_criteria, page, limit, cursor, FECHA_SORT, projection=ORDEN_PROJECTION, direction=self._fecha_direction(order))
+
+        return {
+            "data": [self._orden_helper(orden) for orden in documents],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+            "order": order,
+            "next_cursor": page_cursor
+        }
+
+    async def get_ordenes_stats(self, fecha_inicio: Optional[datetime] = None, fecha_fin: Optional[datetime] = None, group_by: Sequence[str] = ()) -> dict:
+        """Get ordenes statistics, optionally for a fecha range and broken down by canal/moneda/dia/mes/anio"""
+        return await self.stats.summary_async(self.collection, fecha_inicio, fecha_fin, self._stats_dimensions(group_by))
+
+    async def _fold_async(self, operation: str, before: Optional[dict] = None, after: Optional[dict] = None):
+        """_fold for Motor collections"""
+        if not self.aggregates:
+            return
+        try:
+            await self.aggregates.fold_async(before=before, after=after)
+        except Exception as e:
+            self._fold_failed(operation, e)
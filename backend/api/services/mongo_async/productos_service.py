@@ -0,0 +1,121 @@
+from bson import ObjectId
+from pymongo import ReturnDocument
+from typing import List, Optional
+from api.schemas.froms import ProductoFormData
+from api.services.mongo.productos_service import PRODUCTO_PROJECTION, ProductoServiceBase, producto_helper
+from api.services.mongo.pagination import async_find_page
+from api.services.mongo.totals_cache import total_pages
+from api.services.cache import cached_read
+from api.services.mongo.batch_loader import batch_result, check_batch_size
+from api.services.mongo.text_search import build_search
+
+
+class AsyncProductoService(ProductoServiceBase):
+    """Productos on a Motor collection; only the builders and helpers are shared with ProductoService"""
+
+    async def create_producto(self, producto_data: ProductoFormData) -> dict:
+        """Create a new producto"""
+        producto_dict = self._build_producto_document(producto_data)
+
+        await self.collection.insert_one(producto_dict)  # sets producto_dict["_id"]
+        self.totals.invalidate()
+        self.cache.invalidate()
+        return producto_helper(producto_dict)
+
+    @cached_read
+    async def get_productos(self, page: int = 1, limit: int = 20, cursor: Optional[str] = None, include_total: bool = True) -> dict:
+        """Get paginated list of productos (offset or keyset on _id)"""
+        total = await self.totals.optional_count_async(self.collection, {}, include_total)
+        documents, page_cursor = await async_find_page(self.collection, {}, page, limit, cursor, projection=PRODUCTO_PROJECTION)
+        productos = [producto_helper(producto) for producto in documents]
+
+        return {
+            "data": productos,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "pages": total_pages(total, limit),
+            "next_cursor": page_cursor
+        }
+
+    @cached_read
+    async def get_producto_by_id(self, producto_id: str) -> Optional[dict]:
+        """Get a single producto by ID"""
+        if not ObjectId.is_valid(producto_id):
+            return None
+
+        producto = await self.collection.find_one({"_id": ObjectId(producto_id)}, PRODUCTO_PROJECTION)
+        return producto_helper(producto) if producto else None
+
+    @cached_read
+    async def get_productos_by_ids(self, ids: List[str]) -> dict:
+        """Productos for a list of ids, in request order; one $in for the ids not loaded yet"""
+        keys = check_batch_size(ids)
+        return batch_result(keys, await self.loader.load_many_async(keys), producto_helper)
+
+    async def _find_by_ids(self, object_ids: List[ObjectId]) -> List[dict]:
+        return await self.collection.find({"_id": {"$in": object_ids}}, PRODUCTO_PROJECTION).to_list(length=None)
+
+    async def update_producto(self, producto_id: str, producto_update: ProductoFormData) -> Optional[dict]:
+        """Update a producto partially"""
+        if not ObjectId.is_valid(producto_id):
+            return None
+
+        updated_producto = await self.collection.find_one_and_update(
+            {"_id": ObjectId(producto_id)},
+            {"$set": self._build_producto_update(producto_update)},
+            return_document=ReturnDocument.AFTER
+        )
+
+        if updated_producto is None:
+            return None
+        self.totals.invalidate()
+        self.cache.invalidate()
+
+        return producto_helper(updated_producto)
+
+    async def delete_producto(self, producto_id: str) -> bool:
+        """Delete a producto by ID"""
+        if not ObjectId.is_valid(producto_id):
+            return False
+
+        result = await self.collection.delete_one({"_id": ObjectId(producto_id)})
+        if result.deleted_count > 0:
+            self.totals.invalidate()
+            self.cache.invalidate()
+        return result.deleted_count > 0
+
+    async def search_productos(self, query: str, page: int = 1, limit: int = 20, include_total: bool = True, mode: str = "text") -> dict:
+        """Search productos by name or category (text: ranked, prefix: autocomplete, regex: substring scan)"""
+        skip = (page - 1) * limit
+
+        search_filter, projection, sort = build_search(query, mode)
+        total = await self.totals.optional_count_async(self.collection, search_filter, include_total)
+        cursor = self.collection.find(search_filter, projection).sort(sort).skip(skip).limit(limit)
+        documents = await cursor.to_list(length=limit)
+
+        return {
+            "data": [producto_helper(producto) for producto in documents],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "query": query,
+            "mode": mode
+        }
+
+    @cached_read
+    async def get_productos_by_categoria(self, categoria: str, page: int = 1, limit: int = 20, include_total: bool = True) -> dict:
+        """Get productos by category"""
+        skip = (page - 1) * limit
+
+        filter_criteria = {"categoria": categoria}
+        total = await self.totals.optional_count_async(self.collection, filter_criteria, include_total)
+        documents = await self.collection.find(filter_criteria, PRODUCTO_PROJECTION).skip(skip).limit(limit).to_list(length=limit)
+
+        return {
+            "data": [producto_helper(producto) for producto in documents],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "categoria": categoria
+        }
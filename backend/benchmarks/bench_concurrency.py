@@ -0,0 +1,69 @@
+"""Throughput of the sync (/mongo) and async Motor (/mongo-async) routes under concurrent load.
+
+Usage: python benchmarks/bench_concurrency.py [concurrency] [requests]
+Needs a running API (BENCH_API_URL, default http://localhost:8000) backed by a real mongod;
+the sync routes are bounded by the threadpool, the async ones by MONGO_MAX_POOL_SIZE.
+"""
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+from common import report
+
+ROUTES = [
+    "/clientes/?limit=20&total=false",
+    "/productos/?limit=20&total=false",
+    "/ordenes/?limit=20&total=false",
+]
+
+
+async def drive(client: httpx.AsyncClient, prefix: str, concurrency: int, requests: int) -> dict:
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(ROUTES[i % len(ROUTES)])
+    latencies, errors = [], 0
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            route = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(prefix + route)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "stack": prefix,
+        "req_per_s": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+async def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    base_url = os.getenv("BENCH_API_URL", "http://localhost:8000")
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        rows = []
+        for prefix in ("/mongo", "/mongo-async"):
+            await drive(client, prefix, concurrency, min(requests, 500))  # warm up
+            rows.append(await drive(client, prefix, concurrency, requests))
+
+    report(f"{requests} GETs at concurrency {concurrency}", rows, ["stack", "req_per_s", "p50_ms", "p99_ms", "errors"])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
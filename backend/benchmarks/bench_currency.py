@@ -0,0 +1,71 @@
+"""Vectorized USD conversion of order lines vs converting them one row at a time.
+
+The per-row pass runs on the first per_row_lines lines (default: all of them) and its
+throughput is extrapolated to the full batch when it is smaller.
+
+Usage: python benchmarks/bench_currency.py [lines] [per_row_lines]
+"""
+import sys
+import time
+import numpy as np
+
+from common import report
+from etl.transformations.normalize_currency import ExchangeRates
+
+
+def make_lines(count: int, rates: ExchangeRates, seed: int = 7) -> dict:
+    rng = np.random.default_rng(seed)
+    span = int((rates.last_date - rates.first_date).astype(np.int64)) + 30
+    return {
+        "cantidad": rng.integers(1, 10, count).astype(np.float64),
+        "precio_unit": rng.integers(1000, 500000, count).astype(np.float64),
+        "descuento_pct": np.where(rng.random(count) < 0.3, rng.integers(5, 30, count), np.nan),
+        "moneda": np.where(rng.random(count) < 0.7, "CRC", "USD"),
+        # Includes dates past the end of the file to exercise the forward fill
+        "fecha": rates.first_date + rng.integers(0, span, count).astype("timedelta64[D]"),
+    }
+
+
+def per_row(rates: ExchangeRates, lines: dict, count: int) -> list:
+    totals = []
+    fechas = lines["fecha"][:count].astype(str).tolist()
+    columns = zip(
+        lines["cantidad"][:count].tolist(), lines["precio_unit"][:count].tolist(),
+        lines["descuento_pct"][:count].tolist(), lines["moneda"][:count].tolist(), fechas
+    )
+    for cantidad, precio_unit, descuento_pct, moneda, fecha in columns:
+        precio_usd = rates.to_usd_scalar(precio_unit, moneda, fecha)
+        descuento = 0 if descuento_pct != descuento_pct else descuento_pct
+        totals.append(round(precio_usd * (1 - descuento / 100) * cantidad, 2))
+    return totals
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    per_row_count = min(int(sys.argv[2]), count) if len(sys.argv) > 2 else count
+    rates = ExchangeRates.from_csv()
+    lines = make_lines(count, rates)
+
+    start = time.perf_counter()
+    _, vector_totals = rates.convert_lines(
+        lines["cantidad"], lines["precio_unit"], lines["descuento_pct"], lines["moneda"], lines["fecha"]
+    )
+    vector_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    row_totals = per_row(rates, lines, per_row_count)
+    row_elapsed = (time.perf_counter() - start) * count / per_row_count
+
+    mismatches = int(np.count_nonzero(np.abs(vector_totals[:per_row_count] - np.array(row_totals)) > 0.011))
+    rows = [
+        {"approach": "per_row", "lines_per_s": count / row_elapsed, "seconds": row_elapsed},
+        {"approach": "vectorized", "lines_per_s": count / vector_elapsed, "seconds": vector_elapsed},
+    ]
+    report(f"USD conversion of {count} lines ({per_row_count} converted per row)", rows, ["approach", "lines_per_s", "seconds"])
+    print(f"speedup: {row_elapsed / vector_elapsed:.1f}x, mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
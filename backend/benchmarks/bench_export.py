@@ -0,0 +1,74 @@
+"""Peak memory of the ordenes export while streaming up to a million ordenes.
+
+Usage: python benchmarks/bench_export.py [max_ordenes] [batch_size]
+The collection is a lazy stub so only the export path itself is measured; peak
+traced memory should stay flat as the number of exported ordenes grows.
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from bson import ObjectId
+
+from common import report
+from api.services.mongo.ordenes_service import OrdenService
+
+
+class LazyOrdenes:
+    """Stands in for a server-side cursor: yields one fresh document at a time"""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def find(self, filter_criteria=None, projection=None, batch_size=None):
+        base = datetime(2024, 1, 1)
+        for i in range(self.count):
+            yield {
+                "_id": ObjectId(),
+                "cliente_id": str(ObjectId()),
+                "fecha": base + timedelta(seconds=i),
+                "canal": "WEB",
+                "moneda": "CRC",
+                "total": 3000,
+                "items": [
+                    {"producto_id": str(ObjectId()), "cantidad": 1, "precio_unit": 1000},
+                    {"producto_id": str(ObjectId()), "cantidad": 2, "precio_unit": 1000, "descuento_pct": 5},
+                ],
+            }
+
+
+def measure(count: int, fmt: str, batch_size: int) -> dict:
+    service = OrdenService(LazyOrdenes(count))
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = 0
+    for chunk in service.export_ordenes(format=fmt, batch_size=batch_size):
+        size += len(chunk)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "format": fmt,
+        "ordenes": count,
+        "peak_mb": peak / 1e6,
+        "output_mb": size / 1e6,
+        "ordenes_per_s": count / elapsed,
+    }
+
+
+def main():
+    max_ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    counts = [c for c in (10_000, 100_000, 1_000_000) if c <= max_ordenes]
+
+    rows = [measure(count, fmt, batch_size) for fmt in ("ndjson", "csv") for count in counts]
+    report(f"Ordenes export memory (batch_size={batch_size})", rows, ["format", "ordenes", "peak_mb", "output_mb", "ordenes_per_s"])
+
+    for fmt in ("ndjson", "csv"):
+        peaks = [row["peak_mb"] for row in rows if row["format"] == fmt]
+        if max(peaks) > 2 * min(peaks) + 1:
+            sys.exit(f"{fmt} export memory grows with the number of ordenes: {peaks}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""FactVentas load throughput into the SQLite DW stand-in: columnar executemany batches at
+several batch sizes vs one INSERT (and commit) per orden, plus an idempotent re-run.
+
+Usage: python benchmarks/bench_fact_loader.py [rows] [batch_sizes, e.g. 500,5000,20000]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from common import report
+from etl.loaders.facts import FACT_COLUMNS, ROW_FIELDS, FactVentasLoader
+from etl.loaders.sqlite_dw import connect_sqlite_dw
+
+LINES_PER_ORDEN = 3
+
+
+def make_rows(count: int, seed: int = 5) -> list:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        cantidad = rng.randrange(1, 10)
+        precio = round(rng.uniform(1, 200), 2)
+        rows.append({
+            "TiempoID": 20240101 + rng.randrange(28), "ClienteID": rng.randrange(1, 5000),
+            "ProductoID": rng.randrange(1, 500), "CanalID": rng.randrange(1, 4),
+            "orden_id": str(i // LINES_PER_ORDEN), "fuente": rng.choice(["MongoDB", "MySQL", "SQL Server"]),
+            "moneda": "USD", "cantidad": cantidad, "precio_unit_usd": precio,
+            "total_usd": round(cantidad * precio, 2), "descuento_pct": None,
+        })
+    # All lines of an orden share one source
+    for row in rows:
+        row["fuente"] = rows[int(row["orden_id"]) * LINES_PER_ORDEN]["fuente"]
+    return rows
+
+
+def per_row(connection, rows: list) -> None:
+    insert = f"INSERT INTO dwh.FactVentas ({', '.join(FACT_COLUMNS)}) VALUES ({', '.join('?' for _ in FACT_COLUMNS)})"
+    current = None
+    for row in rows:
+        if row["orden_id"] != current:
+            connection.commit()
+            current = row["orden_id"]
+            connection.execute("DELETE FROM dwh.FactVentas WHERE OrdenID_Natural = ? AND FuenteOrigen = ?", (row["orden_id"], row["fuente"]))
+        connection.execute(insert, [row[ROW_FIELDS[column]] for column in FACT_COLUMNS])
+    connection.commit()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    batch_sizes = [int(size) for size in sys.argv[2].split(",")] if len(sys.argv) > 2 else [500, 5000, 20000]
+    rows = make_rows(count)
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        def fresh_dw(name: str):
+            path = os.path.join(directory, name)
+            os.makedirs(path)
+            return connect_sqlite_dw(path)
+
+        connection = fresh_dw("per_row")
+        start = time.perf_counter()
+        per_row(connection, rows)
+        elapsed = time.perf_counter() - start
+        results.append({"loader": "insert_per_row", "batch_size": 1, "rows_per_s": count / elapsed, "seconds": elapsed})
+        connection.close()
+
+        for batch_size in batch_sizes:
+            connection = fresh_dw(f"batch_{batch_size}")
+            loader = FactVentasLoader(connection, batch_size=batch_size)
+            start = time.perf_counter()
+            loader.add(rows)
+            loader.close()
+            elapsed = time.perf_counter() - start
+            results.append({"loader": "columnar", "batch_size": batch_size, "rows_per_s": count / elapsed, "seconds": elapsed})
+
+            if batch_size == batch_sizes[-1]:
+                # Re-run: every orden is replaced, the table does not grow
+                rerun = FactVentasLoader(connection, batch_size=batch_size)
+                start = time.perf_counter()
+                rerun.add(rows)
+                rerun.close()
+                elapsed = time.perf_counter() - start
+                results.append({"loader": "columnar_rerun", "batch_size": batch_size, "rows_per_s": count / elapsed, "seconds": elapsed})
+                total = connection.execute("SELECT COUNT(*) FROM dwh.FactVentas").fetchone()[0]
+                if total != count:
+                    print(f"re-run is not idempotent: {total} facts for {count} rows")
+                    sys.exit(1)
+            connection.close()
+
+    report(f"FactVentas load of {count} rows (SQLite)", results, ["loader", "batch_size", "rows_per_s", "seconds"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Date range queries over a year of ordenes, before and after the fecha migration.
+
+Usage: python benchmarks/bench_fecha_range.py [ordenes] [limit]
+Ordenes are seeded across 2024 with fecha as ISO strings (the old write path), queried
+with datetime bounds (which match none of them), then migrated to BSON dates with
+OrdenService.migrate_fecha. Per window it times the count, the first page in both
+directions, the page after it through the cursor, and the sorted NDJSON export.
+Set BENCH_MONGO_URI to run against a local mongod: the plan column then shows whether
+the range was answered from ordenes_fecha. mongomock scans every query and its bulk_write
+rejects pymongo's UpdateOne, so there the migration is skipped and the data reseeded as dates.
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+
+from common import get_database, report
+from api.database.indexes import _plan_stages, ensure_indexes
+from api.services.mongo.ordenes_service import OrdenService
+from api.services.mongo.pagination import FECHA_SORT
+
+START = datetime(2024, 1, 1)
+WINDOWS = [("day", 1), ("week", 7), ("month", 30), ("quarter", 91), ("year", 366)]
+
+
+def seed(collection, ordenes: int, as_string: bool, seed_value: int = 0):
+    rng = random.Random(seed_value)
+    collection.drop()
+    batch = []
+    for _ in range(ordenes):
+        fecha = START + timedelta(seconds=rng.randrange(366 * 86400))
+        batch.append({
+            "_id": ObjectId(),
+            "cliente_id": str(ObjectId()),
+            "fecha": fecha.isoformat() if as_string else fecha,
+            "canal": "WEB",
+            "moneda": "USD",
+            "items": [{"producto_id": str(ObjectId()), "cantidad": 1, "precio_unit": 10.0}],
+            "total": 10.0,
+            "total_usd": 10.0,
+            "creado": START,
+            "actualizado": START,
+        })
+        if len(batch) == 10000:
+            collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        collection.insert_many(batch, ordered=False)
+
+
+def plan(collection, fecha_inicio: datetime, fecha_fin: datetime) -> str:
+    try:
+        explained = collection.find({"fecha": {"$gte": fecha_inicio, "$lte": fecha_fin}}).sort(
+            [(field, 1) for field in FECHA_SORT]
+        ).limit(20).explain()
+    except Exception:
+        return "-"
+    stages = _plan_stages(explained.get("queryPlanner", {}).get("winningPlan", {}))
+    return ">".join(stages) or "-"
+
+
+def measure(service: OrdenService, name: str, days: int, limit: int) -> dict:
+    fecha_inicio = START + timedelta(days=120)
+    fecha_fin = fecha_inicio + timedelta(days=days) - timedelta(microseconds=1)
+    if days >= 366:
+        fecha_inicio, fecha_fin = START, START + timedelta(days=366)
+    row = {"window": name}
+
+    service.totals.invalidate()
+    start = time.perf_counter()
+    first = service.get_ordenes_by_fecha(fecha_inicio, fecha_fin, limit=limit)
+    row["count_page_ms"] = (time.perf_counter() - start) * 1000
+    row["rows"] = first["total"]
+
+    for order in ("asc", "desc"):
+        start = time.perf_counter()
+        page = service.get_ordenes_by_fecha(fecha_inicio, fecha_fin, limit=limit, include_total=False, order=order)
+        row[f"{order}_ms"] = (time.perf_counter() - start) * 1000
+        if order == "asc":
+            cursor = page["next_cursor"]
+
+    start = time.perf_counter()
+    if cursor:
+        service.get_ordenes_by_fecha(fecha_inicio, fecha_fin, limit=limit, cursor=cursor, include_total=False)
+    row["cursor_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    size = sum(len(chunk) for chunk in service.export_ordenes(fecha_inicio=fecha_inicio, fecha_fin=fecha_fin, order="asc"))
+    elapsed = time.perf_counter() - start
+    row["stream_ms"] = elapsed * 1000
+    row["stream_per_s"] = first["total"] / elapsed if elapsed else 0.0
+    row["stream_mb"] = size / 1e6
+    row["plan"] = plan(service.collection, fecha_inicio, fecha_fin)
+    return row
+
+
+def main():
+    ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    db = get_database()
+    collection = db.ordenes
+    service = OrdenService(collection)
+
+    seed(collection, ordenes, as_string=True)
+    ensure_indexes(db)
+    month = START + timedelta(days=120)
+    service.totals.invalidate()
+    legacy = service.get_ordenes_by_fecha(month, month + timedelta(days=30), limit=limit)
+    print(f"string fecha: {legacy['total']} of {ordenes} ordenes matched a 30 day datetime range")
+
+    start = time.perf_counter()
+    try:
+        migrated = service.migrate_fecha(batch_size=1000)
+        elapsed = time.perf_counter() - start
+        print(f"migrate_fecha: {migrated['converted']} converted in {elapsed:.2f}s ({migrated['converted'] / elapsed:,.0f} docs/s)")
+    except TypeError as e:
+        print(f"migrate_fecha skipped ({e}); reseeding with BSON dates")
+        seed(collection, ordenes, as_string=False)
+
+    rows = [measure(service, name, days, limit) for name, days in WINDOWS]
+    report(
+        f"get_ordenes_by_fecha and sorted export over a year ({ordenes} ordenes, limit={limit})", rows,
+        ["window", "rows", "count_page_ms", "asc_ms", "desc_ms", "cursor_ms", "stream_ms", "stream_per_s", "stream_mb", "plan"]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""MapProducto resolution: in-memory ProductMap batches vs one indexed SQL lookup per line.
+
+SQLite stands in for the DW; the per-line pass is what an ETL without the resolver would do.
+
+Usage: python benchmarks/bench_map_producto.py [lookups] [mapped_codes]
+"""
+import random
+import sqlite3
+import sys
+import time
+
+from common import report
+from etl.transformations.map_products import ProductMap
+
+FUENTES = ["SQL Server", "MySQL", "MongoDB", "Supabase", "Neo4j"]
+
+
+def build_dw(mapped: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("ATTACH DATABASE ':memory:' AS staging")
+    connection.execute(
+        "CREATE TABLE staging.MapProducto (MapID INTEGER PRIMARY KEY, FuenteOrigen TEXT NOT NULL,"
+        " CodigoFuente TEXT NOT NULL, SKU_Oficial TEXT NOT NULL, UNIQUE (FuenteOrigen, CodigoFuente))"
+    )
+    connection.executemany(
+        "INSERT INTO staging.MapProducto (FuenteOrigen, CodigoFuente, SKU_Oficial) VALUES (?, ?, ?)",
+        ((FUENTES[i % 5], f"C{i:08d}", f"SKU-{i // 5:07d}") for i in range(mapped))
+    )
+    connection.commit()
+    return connection
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    mapped = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    connection = build_dw(mapped)
+
+    random.seed(11)
+    # ~5% of codes are unmapped so misses are exercised too
+    codes = [random.randrange(int(mapped * 1.05)) for _ in range(lookups)]
+    batches = {}
+    for i in codes:
+        batches.setdefault(FUENTES[i % 5], []).append(f"C{i:08d}")
+
+    rows = []
+    start = time.perf_counter()
+    product_map = ProductMap()
+    product_map.refresh(connection)
+    load_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolved = sum(sum(1 for sku in product_map.resolve(fuente, batch) if sku) for fuente, batch in batches.items())
+    elapsed = time.perf_counter() - start
+    rows.append({"approach": "product_map", "lookups_per_s": lookups / elapsed, "seconds": elapsed, "resolved": resolved})
+
+    query = "SELECT SKU_Oficial FROM staging.MapProducto WHERE FuenteOrigen = ? AND CodigoFuente = ?"
+    start = time.perf_counter()
+    resolved = 0
+    for fuente, batch in batches.items():
+        for codigo in batch:
+            if connection.execute(query, (fuente, codigo)).fetchone():
+                resolved += 1
+    elapsed = time.perf_counter() - start
+    rows.append({"approach": "sql_per_line", "lookups_per_s": lookups / elapsed, "seconds": elapsed, "resolved": resolved})
+
+    report(f"{lookups} lookups over {mapped} mapped codes", rows, ["approach", "lookups_per_s", "seconds", "resolved"])
+    stats = product_map.stats()
+    print(f"index load: {load_elapsed:.3f}s, distinct misses: {stats['distinct_misses']}")
+
+    # Incremental refresh only reads rows past the last MapID
+    connection.execute(
+        "INSERT INTO staging.MapProducto (FuenteOrigen, CodigoFuente, SKU_Oficial) VALUES ('MongoDB', 'NUEVO-1', 'SKU-0000001')"
+    )
+    start = time.perf_counter()
+    added = product_map.refresh(connection)
+    print(f"incremental refresh: {added} row(s) in {time.perf_counter() - start:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""_orden_helper throughput with stored totals vs recomputing them on every read.
+
+Usage: python benchmarks/bench_orden_helper.py [ordenes] [items_per_orden]
+"""
+import sys
+import time
+from datetime import datetime
+from bson import ObjectId
+
+from common import report
+from api.services.mongo.ordenes_service import OrdenService
+
+
+def make_orden(items_per_orden: int) -> dict:
+    items = [
+        {"producto_id": str(ObjectId()), "cantidad": 1 + i % 5, "precio_unit": 1000 + i, "descuento_pct": 10 if i % 3 == 0 else None}
+        for i in range(items_per_orden)
+    ]
+    orden = {
+        "_id": ObjectId(),
+        "cliente_id": str(ObjectId()),
+        "fecha": "2024-01-01",
+        "canal": "WEB",
+        "moneda": "CRC",
+        "items": items,
+        "descripcion": None,
+        "creado": datetime.now(),
+        "actualizado": datetime.now(),
+    }
+    orden["total"] = round(OrdenService(None)._calculate_total(items), 2)
+    return orden
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    items_per_orden = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    service = OrdenService(None)
+    ordenes = [make_orden(items_per_orden) for _ in range(count)]
+    recomputed = [{k: v for k, v in orden.items() if k != "total"} for orden in ordenes]
+
+    rows = []
+    for label, docs in (("recompute", recomputed), ("stored", ordenes)):
+        start = time.perf_counter()
+        for orden in docs:
+            service._orden_helper(orden)
+        elapsed = time.perf_counter() - start
+        rows.append({"total": label, "ordenes_per_s": count / elapsed, "us_per_orden": elapsed * 1e6 / count})
+
+    report(f"_orden_helper on {count} ordenes x {items_per_orden} items", rows, ["total", "ordenes_per_s", "us_per_orden"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Page-N latency of offset (skip/limit) vs keyset (cursor) pagination on ordenes.
+
+Usage: python benchmarks/bench_pagination.py [total_ordenes] [limit]
+Set BENCH_MONGO_URI to run against a local mongod instead of mongomock. Only the page
+fetch is timed (count_documents is excluded). mongomock evaluates every filter with a
+scan, so the flat keyset curve only shows up against a real mongod using the _id index.
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+
+from common import get_database, report
+from api.services.mongo.pagination import find_page
+
+
+def seed(collection, total: int):
+    collection.drop()
+    base = datetime(2024, 1, 1)
+    batch = []
+    for i in range(total):
+        batch.append({
+            "_id": ObjectId(),
+            "cliente_id": str(ObjectId()),
+            "fecha": base + timedelta(minutes=i),
+            "canal": "WEB",
+            "moneda": "CRC",
+            "items": [{"producto_id": str(ObjectId()), "cantidad": 1, "precio_unit": 1000}],
+            "total": 1000,
+            "creado": base,
+            "actualizado": base,
+        })
+        if len(batch) == 5000:
+            collection.insert_many(batch)
+            batch = []
+    if batch:
+        collection.insert_many(batch)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    collection = get_database().ordenes
+    seed(collection, total)
+
+    last_page = total // limit
+    checkpoints = sorted({1, last_page // 4, last_page // 2, (3 * last_page) // 4, last_page} - {0})
+    rows = []
+
+    # Walk the collection with cursors once, remembering the cursor that leads to each checkpoint page
+    cursors = {1: None}
+    cursor = None
+    for page in range(1, last_page):
+        _, cursor = find_page(collection, {}, page, limit, cursor)
+        cursors[page + 1] = cursor
+
+    for page in checkpoints:
+        start = time.perf_counter()
+        find_page(collection, {}, page, limit)
+        offset_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        find_page(collection, {}, page, limit, cursors[page])
+        keyset_s = time.perf_counter() - start
+
+        rows.append({"page": page, "offset_ms": offset_s * 1000, "keyset_ms": keyset_s * 1000})
+
+    report(f"get_ordenes page latency ({total} ordenes, limit={limit})", rows, ["page", "offset_ms", "keyset_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Serialization of a 100-row ordenes page: FastAPI response_model path vs one-pass orjson.
+
+The response_model rows reproduce what FastAPI does for a returned dict: pydantic validation,
+then either a JSON-mode dump + json.dumps (JSONResponse) or, on recent FastAPI, pydantic's
+dump_json. "OrdenResponse rows" validates every row as the single-item routes do. "orjson" is
+the BSONJSONResponse body. Every approach starts from the _orden_helper output.
+
+Usage: python benchmarks/bench_serialization.py [rows] [iterations] [items_per_orden]
+"""
+import json
+import sys
+import time
+from typing import List
+from pydantic import TypeAdapter
+
+from common import report
+from bench_orden_helper import make_orden
+from api.routers.json_response import dumps
+from api.schemas.mongo import OrdenResponse
+from api.services.mongo.ordenes_service import OrdenService
+
+
+def json_response_body(content) -> bytes:
+    # starlette JSONResponse.render
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    items_per_orden = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    service = OrdenService(None)
+    page = {
+        "data": [service._orden_helper(make_orden(items_per_orden)) for _ in range(rows)],
+        "total": rows, "page": 1, "limit": rows, "pages": 1, "next_cursor": None,
+    }
+
+    dict_adapter = TypeAdapter(dict)
+    rows_adapter = TypeAdapter(List[OrdenResponse])
+    approaches = {
+        "dict + json.dumps": lambda: json_response_body(dict_adapter.dump_python(dict_adapter.validate_python(page), mode="json")),
+        "dict + dump_json": lambda: dict_adapter.dump_json(dict_adapter.validate_python(page)),
+        "OrdenResponse rows": lambda: rows_adapter.dump_json(rows_adapter.validate_python(page["data"])),
+        "orjson": lambda: dumps(page),
+    }
+
+    results = []
+    for label, serialize in approaches.items():
+        serialize()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            serialize()
+        elapsed = time.perf_counter() - start
+        results.append({"approach": label, "pages_per_s": iterations / elapsed, "us_per_page": elapsed * 1e6 / iterations})
+
+    report(f"{rows}-row ordenes page x {items_per_orden} items, {iterations} iterations", results, ["approach", "pages_per_s", "us_per_page"])
+    baseline = results[0]["us_per_page"]
+    for row in results[1:]:
+        print(f"{row['approach']}: {baseline / row['us_per_page']:.1f}x vs dict + json.dumps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Round trips and latency per write request, read-after-write vs single round trip.
+
+Usage: python benchmarks/bench_writes.py [requests]
+Set BENCH_MONGO_URI to run against a local mongod instead of mongomock. Round trips are
+exact on both; mongomock's find_one_and_update is a Python scan, so only the mongod
+latency column is meaningful for updates.
+"""
+import sys
+import time
+from datetime import datetime
+
+from common import get_database, report
+from api.schemas.froms import ClienteFormData
+from api.services.mongo.clientes_service import ClienteService
+
+IO_METHODS = {"insert_one", "find_one", "update_one", "find_one_and_update", "count_documents", "find"}
+
+
+class CountingCollection:
+    """Proxy that counts every call which reaches the server"""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.round_trips = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name in IO_METHODS:
+            def counted(*args, **kwargs):
+                self.round_trips += 1
+                return attr(*args, **kwargs)
+            return counted
+        return attr
+
+
+def legacy_create(collection, data: ClienteFormData):
+    cliente = data.model_dump()
+    cliente["creado"] = datetime.now()
+    result = collection.insert_one(cliente)
+    return collection.find_one({"_id": result.inserted_id})
+
+
+def legacy_update(collection, cliente_id, data: ClienteFormData):
+    result = collection.update_one({"_id": cliente_id}, {"$set": data.model_dump(exclude_unset=True)})
+    if result.modified_count == 0:
+        return None
+    return collection.find_one({"_id": cliente_id})
+
+
+def run(label, collection, create, update, requests):
+    rows = []
+    for op, fn in (("create", create), ("update", update)):
+        collection.round_trips = 0
+        start = time.perf_counter()
+        for i in range(requests):
+            fn(i)
+        elapsed = time.perf_counter() - start
+        rows.append({
+            "path": label,
+            "op": op,
+            "trips_per_req": collection.round_trips / requests,
+            "ms_per_req": elapsed * 1000 / requests,
+        })
+    return rows
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    db = get_database()
+    db.clientes.drop()
+    collection = CountingCollection(db.clientes)
+    service = ClienteService(collection)
+
+    def form(i):
+        return ClienteFormData(nombre=f"Cliente {i}", email=f"cliente{i}@example.com", genero="Otro", pais="CR")
+
+    legacy_ids = []
+    rows = run(
+        "before", collection,
+        lambda i: legacy_ids.append(legacy_create(collection, form(i))["_id"]),
+        lambda i: legacy_update(collection, legacy_ids[i], form(i + requests)),
+        requests,
+    )
+
+    new_ids = []
+    rows += run(
+        "after", collection,
+        lambda i: new_ids.append(service.create_cliente(form(i))["id"]),
+        lambda i: service.update_cliente(new_ids[i], form(i + requests)),
+        requests,
+    )
+
+    report(f"Cliente writes ({requests} requests each)", rows, ["path", "op", "trips_per_req", "ms_per_req"])
+
+
+if __name__ == "__main__":
+    main()
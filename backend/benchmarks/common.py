@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Allow `python benchmarks/<script>.py` from the backend directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_database(name: str = "bench_sales_mongo"):
+    """Local mongod when BENCH_MONGO_URI is set, otherwise an in-process mongomock database"""
+    uri = os.getenv("BENCH_MONGO_URI")
+    if uri:
+        import pymongo
+        return pymongo.MongoClient(uri)[name]
+
+    import mongomock
+    return mongomock.MongoClient()[name]
+
+
+@contextmanager
+def timer(results: dict, key: str):
+    start = time.perf_counter()
+    yield
+    results[key] = time.perf_counter() - start
+
+
+def report(title: str, rows: list, columns: list):
+    print(f"\n{title}")
+    print(" | ".join(f"{c:>14}" for c in columns))
+    for row in rows:
+        print(" | ".join(f"{row[c]:>14.4f}" if isinstance(row[c], float) else f"{row[c]:>14}" for c in columns))
@@ -0,0 +1,48 @@
+"""Side by side comparison of two load_test.py result files.
+
+Usage: python benchmarks/compare_results.py baseline.json candidate.json
+Ratios are candidate / baseline: below 1 is faster for the latency columns, above 1 is
+better for throughput. Routes missing from either run are skipped.
+"""
+import json
+import sys
+
+from common import report
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    baseline, candidate = load(sys.argv[1]), load(sys.argv[2])
+    before = {row["route"]: row for row in baseline["results"]}
+
+    rows = []
+    for row in candidate["results"]:
+        old = before.get(row["route"])
+        if old is None:
+            continue
+        rows.append({
+            "route": row["route"],
+            "p50_ms": row["p50_ms"],
+            "p50_ratio": row["p50_ms"] / old["p50_ms"] if old["p50_ms"] else 0.0,
+            "p99_ms": row["p99_ms"],
+            "p99_ratio": row["p99_ms"] / old["p99_ms"] if old["p99_ms"] else 0.0,
+            "req_per_s": row["req_per_s"],
+            "rps_ratio": row["req_per_s"] / old["req_per_s"] if old["req_per_s"] else 0.0,
+            "errors": f"{old['errors']}->{row['errors']}",
+        })
+
+    for label, run in (("baseline", baseline), ("candidate", candidate)):
+        meta = run["meta"]
+        print(f"{label}: {meta['started']} {meta['revision']} {meta['target']}, {meta['ordenes']} ordenes, concurrency {meta['concurrency']}")
+    report("candidate vs baseline", rows, ["route", "p50_ms", "p50_ratio", "p99_ms", "p99_ratio", "req_per_s", "rps_ratio", "errors"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""p50/p95/p99 latency and throughput of every /mongo route under concurrent load.
+
+Usage: python benchmarks/load_test.py [ordenes] [concurrency] [requests_per_route] [output.json]
+Seeds the database with benchmarks/seed.py at the given scale (0 reuses what is there), then
+runs each route in turn with `concurrency` workers and writes the results as JSON; compare
+two runs with benchmarks/compare_results.py.
+
+Targets: with BENCH_API_URL set, a running API is driven over HTTP (start it with
+MONGO_DB=bench_sales_mongo against the BENCH_MONGO_URI mongod). Otherwise the app runs
+in-process through httpx's ASGI transport on a local mongod (BENCH_MONGO_URI) or mongomock.
+Creates feed the PATCH and DELETE phases, so seeded documents are only read.
+
+mongomock is not thread-safe, so on it sync handlers run one at a time and the numbers track
+per-request cost rather than contention. Its bulk_write rejects the UpdateOne the agg_ventas
+fold sends and it has no $substrBytes or $convert, so orden writes, /ordenes/stats and
+expand= count as errors there.
+"""
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import anyio
+import httpx
+
+from common import get_database, report
+from seed import CANALES, CATEGORIAS, MONEDAS, make_items, seed
+
+DATABASE = "bench_sales_mongo"
+SAMPLE = 1000
+BULK_ROWS = 100
+
+
+def _producto(ids: dict, rng: random.Random) -> dict:
+    n = next(ids["counter"])
+    return {
+        "nombre": f"Load {n}",
+        "categoria": rng.choice(CATEGORIAS),
+        "codigo": f"LOAD-{ids['run']}-{n}",
+        "equivalencias": {"sku": f"SKU-L{n}", "codigo_alt": f"ALT-L{n}"},
+    }
+
+
+def _cliente(ids: dict, rng: random.Random) -> dict:
+    n = next(ids["counter"])
+    return {"nombre": f"Load {n}", "email": f"load-{ids['run']}-{n}@example.com", "genero": "Otro", "pais": "CR"}
+
+
+def _orden(ids: dict, rng: random.Random) -> dict:
+    return {
+        "cliente_id": str(rng.choice(ids["clientes"])),
+        "fecha": datetime(2025, rng.randint(1, 12), rng.randint(1, 28)).isoformat(),
+        "canal": rng.choice(CANALES),
+        "moneda": rng.choice(MONEDAS),
+        "items": make_items(rng, ids["productos"]),
+    }
+
+
+def _created(ids: dict, pool: str, rng: random.Random, pop: bool = False) -> str:
+    created = ids[pool]
+    if not created:
+        return "000000000000000000000000"
+    return created.pop() if pop else rng.choice(created)
+
+
+# (name, method, request builder returning (path, httpx kwargs), pool that collects created ids)
+ROUTES = [
+    ("productos list", "GET", lambda ids, rng: (f"/mongo/productos/?page={rng.randint(1, 10)}&limit=20", {}), None),
+    ("productos list no total", "GET", lambda ids, rng: ("/mongo/productos/?limit=20&total=false", {}), None),
+    ("productos search", "GET", lambda ids, rng: (f"/mongo/productos/search?query={rng.choice(ids['terms'])}&mode=prefix&total=false", {}), None),
+    ("productos categoria", "GET", lambda ids, rng: (f"/mongo/productos/categoria/{rng.choice(ids['categorias'])}", {}), None),
+    ("productos by ids", "GET", lambda ids, rng: ("/mongo/productos/?ids=" + ",".join(str(i) for i in rng.sample(ids["productos"], min(50, len(ids["productos"])))), {}), None),
+    ("productos get", "GET", lambda ids, rng: (f"/mongo/productos/{rng.choice(ids['productos'])}", {}), None),
+    ("productos create", "POST", lambda ids, rng: ("/mongo/productos/", {"json": _producto(ids, rng)}), "new_productos"),
+    ("productos bulk", "POST", lambda ids, rng: ("/mongo/productos/bulk", {"json": [_producto(ids, rng) for _ in range(BULK_ROWS)]}), None),
+    ("productos patch", "PATCH", lambda ids, rng: (f"/mongo/productos/{_created(ids, 'new_productos', rng)}", {"json": _producto(ids, rng)}), None),
+    ("productos delete", "DELETE", lambda ids, rng: (f"/mongo/productos/{_created(ids, 'new_productos', rng, pop=True)}", {}), None),
+    ("clientes list", "GET", lambda ids, rng: (f"/mongo/clientes/?page={rng.randint(1, 10)}&limit=20", {}), None),
+    ("clientes by ids", "GET", lambda ids, rng: ("/mongo/clientes/?ids=" + ",".join(str(i) for i in rng.sample(ids["clientes"], min(50, len(ids["clientes"])))), {}), None),
+    ("clientes get", "GET", lambda ids, rng: (f"/mongo/clientes/{rng.choice(ids['clientes'])}", {}), None),
+    ("clientes create", "POST", lambda ids, rng: ("/mongo/clientes/", {"json": _cliente(ids, rng)}), "new_clientes"),
+    ("clientes bulk", "POST", lambda ids, rng: ("/mongo/clientes/bulk", {"json": [_cliente(ids, rng) for _ in range(BULK_ROWS)]}), None),
+    ("clientes patch", "PATCH", lambda ids, rng: (f"/mongo/clientes/{_created(ids, 'new_clientes', rng)}", {"json": _cliente(ids, rng)}), None),
+    ("clientes delete", "DELETE", lambda ids, rng: (f"/mongo/clientes/{_created(ids, 'new_clientes', rng, pop=True)}", {}), None),
+    ("ordenes list", "GET", lambda ids, rng: (f"/mongo/ordenes/?page={rng.randint(1, 10)}&limit=20", {}), None),
+    ("ordenes list no total", "GET", lambda ids, rng: ("/mongo/ordenes/?limit=20&total=false", {}), None),
+    ("ordenes list expanded", "GET", lambda ids, rng: (f"/mongo/ordenes/?page={rng.randint(1, 10)}&limit=20&total=false&expand=cliente,productos", {}), None),
+    ("ordenes by cliente", "GET", lambda ids, rng: (f"/mongo/ordenes/cliente/{rng.choice(ids['orden_clientes'])}", {}), None),
+    ("ordenes by fecha", "GET", lambda ids, rng: (f"/mongo/ordenes/fecha?fecha_inicio=2024-0{rng.randint(1, 9)}-01&fecha_fin=2024-0{rng.randint(1, 9)}-28&total=false", {}), None),
+    ("ordenes by fecha desc", "GET", lambda ids, rng: (f"/mongo/ordenes/fecha?fecha_inicio=2024-0{rng.randint(1, 4)}-01&fecha_fin=2024-0{rng.randint(5, 9)}-28&total=false&order=desc", {}), None),
+    ("ordenes export", "GET", lambda ids, rng: (f"/mongo/ordenes/export?cliente_id={rng.choice(ids['orden_clientes'])}", {}), None),
+    ("ordenes stats", "GET", lambda ids, rng: ("/mongo/ordenes/stats", {}), None),
+    ("ordenes stats grouped", "GET", lambda ids, rng: ("/mongo/ordenes/stats?group_by=canal,moneda,mes", {}), None),
+    ("ordenes get", "GET", lambda ids, rng: (f"/mongo/ordenes/{rng.choice(ids['ordenes'])}", {}), None),
+    ("ordenes create", "POST", lambda ids, rng: ("/mongo/ordenes/", {"json": _orden(ids, rng)}), "new_ordenes"),
+    ("ordenes bulk", "POST", lambda ids, rng: ("/mongo/ordenes/bulk", {"json": [_orden(ids, rng) for _ in range(BULK_ROWS)]}), None),
+    ("ordenes patch", "PATCH", lambda ids, rng: (f"/mongo/ordenes/{_created(ids, 'new_ordenes', rng)}", {"json": _orden(ids, rng)}), None),
+    ("ordenes delete", "DELETE", lambda ids, rng: (f"/mongo/ordenes/{_created(ids, 'new_ordenes', rng, pop=True)}", {}), None),
+    ("ventas agregados", "GET", lambda ids, rng: (f"/mongo/ventas/agregados?anio={rng.choice([2024, 2025])}", {}), None),
+]
+
+
+def percentile(ordered: list, p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    return ordered[max(math.ceil(p * len(ordered)) - 1, 0)]
+
+
+def sample_ids(db) -> dict:
+    """Ids and values the request builders draw from"""
+    productos = list(db.productos.find({}, {"nombre": 1}).limit(SAMPLE))
+    return {
+        "productos": [doc["_id"] for doc in productos],
+        "terms": sorted({doc["nombre"].split()[0].lower()[:4] for doc in productos}),
+        "categorias": sorted(db.productos.distinct("categoria")),
+        "clientes": [doc["_id"] for doc in db.clientes.find({}, {"_id": 1}).limit(SAMPLE)],
+        "ordenes": [doc["_id"] for doc in db.ordenes.find({}, {"_id": 1}).limit(SAMPLE)],
+        "orden_clientes": sorted({doc["cliente_id"] for doc in db.ordenes.find({}, {"cliente_id": 1}).limit(SAMPLE)}),
+        "new_productos": [], "new_clientes": [], "new_ordenes": [],
+        "run": int(time.time()),
+        "counter": itertools.count(),
+    }
+
+
+async def drive(client: httpx.AsyncClient, route: tuple, ids: dict, concurrency: int, requests: int, seed_value: int) -> dict:
+    name, method, build, collect = route
+    rng = random.Random(f"{seed_value}:{name}")
+    remaining = iter(range(requests))
+    latencies, statuses = [], {}
+
+    async def worker():
+        for _ in remaining:
+            path, kwargs = build(ids, rng)
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if collect and response.status_code == 200:
+                ids[collect].append(response.json()["id"])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "route": name,
+        "method": method,
+        "requests": requests,
+        "errors": sum(count for code, count in statuses.items() if code >= 400),
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "req_per_s": requests / elapsed,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def in_process_transport(db) -> httpx.ASGITransport:
+    """The app itself, reading and writing `db` (mongomock or a local mongod)"""
+    os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+    from api.database.mongo_connection import MongoDBConnection
+    from api.main import app
+
+    MongoDBConnection._client = db.client
+    MongoDBConnection._db = db
+    return httpx.ASGITransport(app=app)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return ""
+
+
+async def main():
+    ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    requests = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+    output = sys.argv[4] if len(sys.argv) > 4 else None
+    seed_value = int(os.getenv("BENCH_SEED", "0"))
+    base_url = os.getenv("BENCH_API_URL")
+    started = datetime.now()
+    output = output or f"load_test_{started:%Y%m%d_%H%M%S}.json"
+
+    db = get_database(DATABASE)
+    seeded = seed(db, ordenes, seed_value) if ordenes else None
+    ids = sample_ids(db)
+
+    if base_url:
+        target, transport = base_url, None
+    else:
+        target = "in-process " + ("mongod" if os.getenv("BENCH_MONGO_URI") else "mongomock")
+        transport = in_process_transport(db)
+        if not os.getenv("BENCH_MONGO_URI"):
+            anyio.to_thread.current_default_thread_limiter().total_tokens = 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    rows = []
+    async with httpx.AsyncClient(base_url=base_url or "http://bench", transport=transport, limits=limits, timeout=120) as client:
+        for route in ROUTES:
+            rows.append(await drive(client, route, ids, concurrency, requests, seed_value))
+
+    report(
+        f"{requests} requests per route at concurrency {concurrency} ({target}, {ordenes or 'existing'} ordenes)",
+        rows, ["route", "req_per_s", "p50_ms", "p95_ms", "p99_ms", "errors"]
+    )
+    result = {
+        "meta": {
+            "started": started.isoformat(timespec="seconds"),
+            "target": target,
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "ordenes": ordenes,
+            "seed": seed_value,
+            "seeded": seeded,
+            "concurrency": concurrency,
+            "requests_per_route": requests,
+        },
+        "results": rows,
+    }
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
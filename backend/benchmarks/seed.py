@@ -0,0 +1,159 @@
+"""Seed clientes, productos and ordenes at a configurable scale for the load test.
+
+Usage: python benchmarks/seed.py [ordenes] [seed] [database]
+Scale follows the ordenes count (10k to 10M): one cliente per 10 ordenes and one producto
+per 100 (at least 100 of each). Documents have the shape the API writes (search fields on
+productos, stored totals and BSON date fecha on ordenes) and go in with unordered insert_many batches.
+Set BENCH_MONGO_URI to seed a local mongod; start the API with MONGO_DB=<database> to load
+test it (default database: bench_sales_mongo), and restart it (or POST /admin/cache/clear with the
+admin routes enabled) after a reseed.
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from bson import ObjectId
+
+from common import get_database
+from api.database.indexes import ensure_indexes
+from api.services.mongo.text_search import normalize_text, search_terms
+from api.services.mongo.ventas_aggregates import VentasAggregates
+
+BATCH_SIZE = 10000
+CATEGORIAS = ["Electronica", "Hogar", "Deportes", "Juguetes", "Oficina", "Ropa", "Libros", "Jardin"]
+NOMBRES = ["Teclado", "Monitor", "Silla", "Lampara", "Balon", "Camisa", "Cuaderno", "Taladro", "Audifonos", "Mochila"]
+CANALES = ["WEB", "APP", "TIENDA", "PARTNER"]
+MONEDAS = ["USD", "CRC"]
+PAISES = ["CR", "PA", "NI", "MX", "CO"]
+GENEROS = ["M", "F", "Otro"]
+START = datetime(2024, 1, 1)
+DAYS = 730
+
+
+def scale(ordenes: int) -> dict:
+    return {"clientes": max(ordenes // 10, 100), "productos": max(ordenes // 100, 100), "ordenes": ordenes}
+
+
+def _insert(collection, documents) -> int:
+    inserted = 0
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) == BATCH_SIZE:
+            inserted += len(collection.insert_many(batch, ordered=False).inserted_ids)
+            batch = []
+    if batch:
+        inserted += len(collection.insert_many(batch, ordered=False).inserted_ids)
+    return inserted
+
+
+def _productos(rng: random.Random, count: int, ids: list):
+    for i in range(count):
+        nombre = f"{rng.choice(NOMBRES)} {i}"
+        categoria = rng.choice(CATEGORIAS)
+        producto = {
+            "_id": ObjectId(),
+            "nombre": nombre,
+            "categoria": categoria,
+            "codigo": f"P-{i:07d}",
+            "equivalencias": {"sku": f"SKU-{i:07d}", "codigo_alt": f"ALT-{rng.randrange(10**6):06d}"},
+            "creado": START,
+            "nombre_norm": normalize_text(nombre),
+            "search_terms": search_terms(nombre, categoria),
+        }
+        ids.append(producto["_id"])
+        yield producto
+
+
+def _clientes(rng: random.Random, count: int, ids: list):
+    for i in range(count):
+        cliente = {
+            "_id": ObjectId(),
+            "nombre": f"Cliente {i}",
+            "email": f"cliente{i}@example.com",
+            "genero": rng.choice(GENEROS),
+            "pais": rng.choice(PAISES),
+            "preferencias": {"categoria": rng.choice(CATEGORIAS)},
+            "creado": START,
+        }
+        ids.append(cliente["_id"])
+        yield cliente
+
+
+def make_items(rng: random.Random, producto_ids: list) -> list:
+    items = []
+    for producto_id in rng.sample(producto_ids, rng.randint(1, 5)):
+        item = {"producto_id": str(producto_id), "cantidad": rng.randint(1, 10), "precio_unit": rng.randint(100, 50000) / 100}
+        if rng.random() < 0.2:
+            item["descuento_pct"] = rng.choice([5, 10, 15, 25])
+        items.append(item)
+    return items
+
+
+def _ordenes(rng: random.Random, count: int, cliente_ids: list, producto_ids: list):
+    now = datetime.now()
+    for _ in range(count):
+        items = make_items(rng, producto_ids)
+        moneda = rng.choice(MONEDAS)
+        total = round(sum(
+            item["precio_unit"] * (1 - item.get("descuento_pct", 0) / 100) * item["cantidad"] for item in items
+        ), 2)
+        yield {
+            "cliente_id": str(rng.choice(cliente_ids)),
+            "fecha": START + timedelta(days=rng.randrange(DAYS), seconds=rng.randrange(86400)),
+            "canal": rng.choice(CANALES),
+            "moneda": moneda,
+            "items": items,
+            "descripcion": None,
+            "creado": now,
+            "actualizado": now,
+            "total": total,
+            "total_usd": total if moneda == "USD" else None,
+        }
+
+
+def seed(db, ordenes: int, seed: int = 0) -> dict:
+    """Drop and refill the three collections; returns the counts and seconds per collection"""
+    rng = random.Random(seed)
+    counts = scale(ordenes)
+    result = {"counts": counts, "seconds": {}}
+    for name in ("clientes", "productos", "ordenes", "agg_ventas"):
+        db[name].drop()
+    ensure_indexes(db)
+
+    producto_ids, cliente_ids = [], []
+    start = time.perf_counter()
+    _insert(db.productos, _productos(rng, counts["productos"], producto_ids))
+    result["seconds"]["productos"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _insert(db.clientes, _clientes(rng, counts["clientes"], cliente_ids))
+    result["seconds"]["clientes"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _insert(db.ordenes, _ordenes(rng, ordenes, cliente_ids, producto_ids))
+    result["seconds"]["ordenes"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        VentasAggregates(db.agg_ventas).rebuild(db.ordenes)
+    except Exception as e:
+        # Without the buckets /mongo/ventas/agregados answers an empty list; the rest still runs
+        print(f"agg_ventas rebuild skipped: {e}")
+    result["seconds"]["agg_ventas"] = time.perf_counter() - start
+    return result
+
+
+def main():
+    ordenes = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    seed_value = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    database = sys.argv[3] if len(sys.argv) > 3 else "bench_sales_mongo"
+    result = seed(get_database(database), ordenes, seed_value)
+    for name, seconds in result["seconds"].items():
+        count = result["counts"].get(name)
+        rate = f" ({count / seconds:,.0f} docs/s)" if count and seconds else ""
+        print(f"{name}: {count if count is not None else '-'} in {seconds:.2f}s{rate}")
+
+
+if __name__ == "__main__":
+    main()
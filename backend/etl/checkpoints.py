@@ -0,0 +1,38 @@
+import sqlite3
+from datetime import datetime
+from typing import Any, Optional
+from bson import json_util
+
+
+class CheckpointStore:
+    """Extractor checkpoints (high-water marks, resume tokens) persisted in a local SQLite file"""
+
+    def __init__(self, path: str = "etl_state.db"):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS etl_checkpoints ("
+            " name TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " updated_at TEXT NOT NULL)"
+        )
+        self.connection.commit()
+
+    def load(self, name: str) -> Optional[Any]:
+        row = self.connection.execute("SELECT value FROM etl_checkpoints WHERE name = ?", (name,)).fetchone()
+        return json_util.loads(row[0]) if row else None
+
+    def save(self, name: str, value: Any):
+        # json_util keeps ObjectId/datetime/resume-token types intact across runs
+        self.connection.execute(
+            "INSERT INTO etl_checkpoints (name, value, updated_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (name, json_util.dumps(value), datetime.now().isoformat())
+        )
+        self.connection.commit()
+
+    def reset(self, name: str):
+        self.connection.execute("DELETE FROM etl_checkpoints WHERE name = ?", (name,))
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
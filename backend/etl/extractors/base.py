@@ -0,0 +1,97 @@
+"""Source adapters for the multi-source pipeline (etl/pipeline.py).
+
+A source splits its ordenes into partitions that workers extract independently; extract()
+yields canonical rows (etl.rows.CANONICAL_COLUMNS) in orden order, so the pipeline can cut
+batches on orden boundaries.
+"""
+from typing import Any, Callable, Iterator, List, Optional
+
+# Opaque to the pipeline; most sources use (lower, upper) bounds on their orden key
+Partition = Any
+
+
+class Source:
+    """Base adapter: name is the FuenteOrigen value written to the DW"""
+
+    name = ""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
+
+    def partitions(self) -> List[Partition]:
+        raise NotImplementedError
+
+    def extract(self, partition: Partition) -> Iterator[dict]:
+        raise NotImplementedError
+
+
+def number_lines(rows: Iterator[dict]) -> Iterator[dict]:
+    """Set linea (1-based within each orden) on rows already sorted by orden"""
+    current, linea = None, 0
+    for row in rows:
+        if row["orden_id"] != current:
+            current, linea = row["orden_id"], 0
+        linea += 1
+        row["linea"] = linea
+        yield row
+
+
+def fetch_records(cursor, size: int = 1000) -> Iterator[dict]:
+    columns = [column[0] for column in cursor.description]
+    while True:
+        records = cursor.fetchmany(size)
+        if not records:
+            return
+        for record in records:
+            yield dict(zip(columns, record))
+
+
+def integer_ranges(low: Optional[int], high: Optional[int], size: int) -> List[Partition]:
+    if low is None or high is None:
+        return []
+    return [(start, min(start + size, high + 1)) for start in range(low, high + 1, size)]
+
+
+class SqlSource(Source):
+    """Relational source read through a DB-API connection factory (one connection per worker).
+
+    Subclasses provide RANGE_QUERY (qmark placeholders for the partition bounds), BOUNDS_QUERY
+    and normalize(record).
+    """
+
+    RANGE_QUERY = ""
+    BOUNDS_QUERY = ""
+
+    def __init__(self, connect: Callable[[], Any], partition_size: int = 5000, paramstyle: str = "qmark", workers: Optional[int] = None):
+        super().__init__(workers)
+        self.connect = connect
+        self.partition_size = partition_size
+        self.paramstyle = paramstyle
+
+    def sql(self, query: str) -> str:
+        # pymysql/psycopg2 use %s, pyodbc/sqlite3 use ?
+        return query.replace("?", "%s") if self.paramstyle in ("format", "pyformat") else query
+
+    def partitions(self) -> List[Partition]:
+        connection = self.connect()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.sql(self.BOUNDS_QUERY))
+            low, high = cursor.fetchone()
+            cursor.close()
+        finally:
+            connection.close()
+        return integer_ranges(low, high, self.partition_size)
+
+    def extract(self, partition: Partition) -> Iterator[dict]:
+        connection = self.connect()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.sql(self.RANGE_QUERY), partition)
+            yield from number_lines(self.normalize(record) for record in fetch_records(cursor))
+            cursor.close()
+        finally:
+            connection.close()
+
+    def normalize(self, record: dict) -> dict:
+        raise NotImplementedError
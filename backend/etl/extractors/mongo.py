@@ -0,0 +1,92 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+from bson import ObjectId
+from pymongo.database import Database
+from etl.extractors.base import Partition, Source
+from etl.rows import canonical_row
+from etl.transformations.format_dates import to_date_str, to_datetime
+from etl.transformations.unify_gender import unify_gender
+
+ORDEN_PROJECTION = {"cliente_id": 1, "fecha": 1, "canal": 1, "moneda": 1, "total": 1, "items": 1}
+
+
+class MongoSource(Source):
+    """sales_mongo: CRC integers, nested items, equivalencias on productos, genero 'Otro'"""
+
+    name = "MongoDB"
+
+    def __init__(self, db: Database, partition_size: int = 5000, lookup_batch: int = 500, workers: Optional[int] = None):
+        super().__init__(workers)
+        self.db = db
+        self.partition_size = partition_size
+        self.lookup_batch = lookup_batch
+
+    def partitions(self) -> List[Partition]:
+        """_id ranges of partition_size ordenes each"""
+        # Keyset walk on the _id index: each step skips at most partition_size entries
+        bounds = []
+        filter_criteria, skip = {}, 0
+        while True:
+            boundary = list(
+                self.db.ordenes.find(filter_criteria, {"_id": 1}).sort("_id", 1).skip(skip).limit(1)
+            )
+            if not boundary:
+                break
+            bounds.append(boundary[0]["_id"])
+            filter_criteria, skip = {"_id": {"$gt": bounds[-1]}}, self.partition_size - 1
+        return [(lower, bounds[i + 1] if i + 1 < len(bounds) else None) for i, lower in enumerate(bounds)]
+
+    def extract(self, partition: Partition) -> Iterator[dict]:
+        lower, upper = partition
+        id_range = {"$gte": lower}
+        if upper is not None:
+            id_range["$lt"] = upper
+
+        chunk = []
+        for orden in self.db.ordenes.find({"_id": id_range}, ORDEN_PROJECTION).sort("_id", 1).batch_size(self.lookup_batch):
+            chunk.append(orden)
+            if len(chunk) >= self.lookup_batch:
+                yield from self._lines(chunk)
+                chunk = []
+        if chunk:
+            yield from self._lines(chunk)
+
+    def _lines(self, ordenes: List[dict]) -> Iterator[dict]:
+        # One $in per collection per chunk instead of a lookup per line
+        clientes = self._by_id(self.db.clientes, (orden.get("cliente_id") for orden in ordenes))
+        productos = self._by_id(
+            self.db.productos, (item.get("producto_id") for orden in ordenes for item in orden.get("items") or [])
+        )
+
+        for orden in ordenes:
+            cliente = clientes.get(str(orden.get("cliente_id")), {})
+            for linea, item in enumerate(orden.get("items") or [], 1):
+                producto = productos.get(str(item.get("producto_id")), {})
+                yield canonical_row(
+                    fuente=self.name,
+                    orden_id=str(orden["_id"]),
+                    linea=linea,
+                    cliente_id=str(orden.get("cliente_id")),
+                    producto_id=str(item.get("producto_id")),
+                    producto_codigo=producto.get("codigo_mongo") or producto.get("codigo"),
+                    fecha=to_datetime(orden.get("fecha")),
+                    canal=(orden.get("canal") or "").strip().upper(),
+                    moneda=(orden.get("moneda") or "").strip().upper(),
+                    cantidad=int(item["cantidad"]),
+                    precio_unit=float(item["precio_unit"]),
+                    descuento_pct=item.get("descuento_pct"),
+                    total_orden=orden.get("total"),
+                    producto_nombre=producto.get("nombre"),
+                    producto_categoria=producto.get("categoria"),
+                    cliente_nombre=cliente.get("nombre"),
+                    cliente_email=cliente.get("email"),
+                    cliente_genero=unify_gender(cliente.get("genero")),
+                    cliente_pais=cliente.get("pais"),
+                    cliente_fecha_registro=to_date_str(cliente.get("creado")),
+                )
+
+    def _by_id(self, collection, ids: Iterable) -> Dict[str, dict]:
+        # References may be stored as ObjectId (seed data) or as strings (API writes)
+        wanted = {ObjectId(i) if isinstance(i, str) and ObjectId.is_valid(i) else i for i in ids if i is not None}
+        if not wanted:
+            return {}
+        return {str(doc["_id"]): doc for doc in collection.find({"_id": {"$in": list(wanted)}})}
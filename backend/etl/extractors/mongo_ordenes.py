@@ -0,0 +1,187 @@
+"""Incremental extraction of Mongo ordenes into DW staging line rows.
+
+Polling mode walks ordenes past a persisted (actualizado, _id) high-water mark; change-stream
+mode (replica sets only) resumes from a persisted resume token and also sees deletes.
+Ordenes without `actualizado` (written outside the API) are not picked up by polling.
+
+`actualizado` is stamped by each API process's clock before its write commits, so a write can
+land behind a mark already saved (commit order, clock skew between hosts). Every poll therefore
+re-reads a trailing window of --lag-seconds (default 300) before the mark; the sink replaces
+per orden, so the overlap is re-staged, not duplicated. Set the lag above the worst expected
+skew plus write latency; 0 restores the strict keyset.
+
+Usage (from backend/):
+    python -m etl.extractors.mongo_ordenes [--state etl_state.db] [--staging staging.db]
+                                           [--batch-size N] [--max-batches N] [--lag-seconds S]
+                                           [--watch] [--reset]
+"""
+import argparse
+import json
+import time
+from datetime import timedelta
+from typing import Iterator, List, Optional, Tuple
+from pymongo.collection import Collection
+from pymongo.errors import PyMongoError
+from api.services.mongo.pagination import keyset_filter
+from etl.checkpoints import CheckpointStore
+from etl.rows import mongo_orden_lines
+
+HIGH_WATER_FIELDS = ("actualizado", "_id")
+EXTRACT_PROJECTION = {
+    "cliente_id": 1, "fecha": 1, "canal": 1, "moneda": 1, "total": 1, "actualizado": 1,
+    "items.producto_id": 1, "items.cantidad": 1, "items.precio_unit": 1, "items.descuento_pct": 1,
+}
+
+
+def _key(watermark: dict) -> tuple:
+    # Saved marks come back from json_util as aware UTC; Mongo returns naive UTC
+    return watermark["actualizado"].replace(tzinfo=None), watermark["_id"]
+
+
+class MongoOrdenesExtractor:
+    """Emits only new or changed ordenes, checkpointing after the sink accepts each batch"""
+
+    def __init__(self, collection: Collection, checkpoints: CheckpointStore, batch_size: int = 1000, name: str = "mongo.ordenes", lag_seconds: float = 300):
+        self.collection = collection
+        self.checkpoints = checkpoints
+        self.batch_size = batch_size
+        self.name = name
+        self.lag = timedelta(seconds=lag_seconds)
+
+    @property
+    def watermark_name(self) -> str:
+        return f"{self.name}.watermark"
+
+    @property
+    def resume_token_name(self) -> str:
+        return f"{self.name}.resume_token"
+
+    def iter_batches(self) -> Iterator[Tuple[List[dict], dict]]:
+        """Yield (ordenes, watermark) batches sorted on (actualizado, _id), starting lag before the
+        saved watermark; the yielded watermark never moves back past the saved one"""
+        saved = self.checkpoints.load(self.watermark_name)
+        sort = [(field, 1) for field in HIGH_WATER_FIELDS]
+        position = None
+        while True:
+            filter_criteria = {"actualizado": {"$exists": True}}
+            if position:
+                # Within one poll the walk continues with the strict keyset
+                filter_criteria = keyset_filter(filter_criteria, position, HIGH_WATER_FIELDS)
+            elif saved:
+                filter_criteria = {"actualizado": {"$gte": saved["actualizado"] - self.lag}}
+            ordenes = list(
+                self.collection.find(filter_criteria, EXTRACT_PROJECTION).sort(sort).limit(self.batch_size)
+            )
+            if not ordenes:
+                return
+            position = {field: ordenes[-1][field] for field in HIGH_WATER_FIELDS}
+            watermark = position if not saved or _key(position) > _key(saved) else saved
+            yield ordenes, watermark
+            if len(ordenes) < self.batch_size:
+                return
+
+    def run(self, sink, max_batches: Optional[int] = None) -> dict:
+        """Poll once up to the current end of the collection; safe to re-run after a crash"""
+        report = {"batches": 0, "ordenes": 0, "lines": 0, "watermark": None}
+        for ordenes, watermark in self.iter_batches():
+            rows = [row for orden in ordenes for row in mongo_orden_lines(orden)]
+            sink.replace([str(orden["_id"]) for orden in ordenes], rows)
+            # Only advance once the batch is staged, so a failed load is re-extracted next run
+            self.checkpoints.save(self.watermark_name, watermark)
+
+            report["batches"] += 1
+            report["ordenes"] += len(ordenes)
+            report["lines"] += len(rows)
+            report["watermark"] = watermark
+            if max_batches and report["batches"] >= max_batches:
+                break
+        return report
+
+    def watch(self, sink, max_batches: Optional[int] = None, max_wait_ms: int = 1000) -> dict:
+        """Tail the change stream, staging changes in batches and persisting the resume token"""
+        report = {"batches": 0, "ordenes": 0, "lines": 0, "deleted": 0}
+        resume_token = self.checkpoints.load(self.resume_token_name)
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+
+        with self.collection.watch(
+            pipeline,
+            full_document="updateLookup",
+            resume_after=resume_token,
+            batch_size=self.batch_size,
+            max_await_time_ms=max_wait_ms
+        ) as stream:
+            changed, deleted = {}, set()
+            while stream.alive:
+                change = stream.try_next()
+                if change is not None:
+                    orden_id = change["documentKey"]["_id"]
+                    if change["operationType"] == "delete" or change.get("fullDocument") is None:
+                        changed.pop(orden_id, None)
+                        deleted.add(orden_id)
+                    else:
+                        deleted.discard(orden_id)
+                        changed[orden_id] = change["fullDocument"]
+                    if len(changed) + len(deleted) < self.batch_size:
+                        continue
+                elif not changed and not deleted:
+                    continue
+
+                self._flush_changes(sink, changed, deleted, report)
+                self.checkpoints.save(self.resume_token_name, stream.resume_token)
+                changed, deleted = {}, set()
+                if max_batches and report["batches"] >= max_batches:
+                    break
+        return report
+
+    def _flush_changes(self, sink, changed: dict, deleted: set, report: dict):
+        rows = [row for orden in changed.values() for row in mongo_orden_lines(orden)]
+        if deleted:
+            sink.delete([str(orden_id) for orden_id in deleted])
+        sink.replace([str(orden_id) for orden_id in changed], rows)
+
+        report["batches"] += 1
+        report["ordenes"] += len(changed)
+        report["lines"] += len(rows)
+        report["deleted"] += len(deleted)
+
+
+def main():
+    from api.database.mongo_connection import get_ordenes_collection
+    from etl.staging import SQLiteStagingSink
+
+    parser = argparse.ArgumentParser(description="Extract new/changed Mongo ordenes into staging line rows")
+    parser.add_argument("--state", default="etl_state.db", help="SQLite file holding the checkpoints")
+    parser.add_argument("--staging", default="staging.db", help="SQLite staging database (local stand-in)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Ordenes per batch")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after N batches")
+    parser.add_argument("--lag-seconds", type=float, default=300, help="Trailing window re-read before the saved watermark")
+    parser.add_argument("--watch", action="store_true", help="Follow the change stream (replica set required)")
+    parser.add_argument("--reset", action="store_true", help="Forget the saved checkpoints and start over")
+    args = parser.parse_args()
+
+    checkpoints = CheckpointStore(args.state)
+    sink = SQLiteStagingSink(args.staging)
+    extractor = MongoOrdenesExtractor(get_ordenes_collection(), checkpoints, batch_size=args.batch_size, lag_seconds=args.lag_seconds)
+    if args.reset:
+        checkpoints.reset(extractor.watermark_name)
+        checkpoints.reset(extractor.resume_token_name)
+
+    start = time.perf_counter()
+    try:
+        if args.watch:
+            report = extractor.watch(sink, max_batches=args.max_batches)
+        else:
+            report = extractor.run(sink, max_batches=args.max_batches)
+    except PyMongoError as e:
+        print(f"Extraction failed: {e}")
+        raise SystemExit(1)
+    finally:
+        checkpoints.close()
+        sink.close()
+
+    report["seconds"] = round(time.perf_counter() - start, 3)
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
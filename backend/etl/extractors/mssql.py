@@ -0,0 +1,47 @@
+from etl.extractors.base import SqlSource
+from etl.rows import canonical_row
+from etl.transformations.format_dates import to_date_str, to_datetime
+from etl.transformations.unify_gender import unify_gender
+
+
+class SqlServerSource(SqlSource):
+    """sales_ms: USD only, full-word genero, official SKUs"""
+
+    name = "SQL Server"
+
+    BOUNDS_QUERY = "SELECT MIN(OrdenId), MAX(OrdenId) FROM sales_ms.Orden"
+    RANGE_QUERY = """
+        SELECT o.OrdenId, o.ClienteId, o.Fecha, o.Canal, o.Moneda, o.Total,
+               d.Cantidad, d.PrecioUnit, d.DescuentoPct,
+               p.ProductoId, p.SKU, p.Nombre AS ProductoNombre, p.Categoria,
+               c.Nombre AS ClienteNombre, c.Email, c.Genero, c.Pais, c.FechaRegistro
+        FROM sales_ms.Orden o
+        JOIN sales_ms.OrdenDetalle d ON d.OrdenId = o.OrdenId
+        JOIN sales_ms.Producto p ON p.ProductoId = d.ProductoId
+        JOIN sales_ms.Cliente c ON c.ClienteId = o.ClienteId
+        WHERE o.OrdenId >= ? AND o.OrdenId < ?
+        ORDER BY o.OrdenId, d.OrdenDetalleId
+    """
+
+    def normalize(self, record: dict) -> dict:
+        return canonical_row(
+            fuente=self.name,
+            orden_id=str(record["OrdenId"]),
+            cliente_id=str(record["ClienteId"]),
+            producto_id=str(record["ProductoId"]),
+            producto_codigo=record["SKU"],
+            fecha=to_datetime(record["Fecha"]),
+            canal=(record["Canal"] or "").strip().upper(),
+            moneda=(record["Moneda"] or "USD").strip().upper(),
+            cantidad=int(record["Cantidad"]),
+            precio_unit=float(record["PrecioUnit"]),
+            descuento_pct=float(record["DescuentoPct"]) if record["DescuentoPct"] is not None else None,
+            total_orden=float(record["Total"]),
+            producto_nombre=record["ProductoNombre"],
+            producto_categoria=record["Categoria"],
+            cliente_nombre=record["ClienteNombre"],
+            cliente_email=record["Email"],
+            cliente_genero=unify_gender(record["Genero"]),
+            cliente_pais=record["Pais"],
+            cliente_fecha_registro=to_date_str(record["FechaRegistro"]),
+        )
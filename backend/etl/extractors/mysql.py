@@ -0,0 +1,48 @@
+from etl.extractors.base import SqlSource
+from etl.rows import canonical_row
+from etl.transformations.format_dates import to_date_str, to_datetime
+from etl.transformations.normalize_currency import parse_amount
+from etl.transformations.unify_gender import unify_gender
+
+
+class MySQLSource(SqlSource):
+    """sales_mysql: codigo_alt instead of SKU, dates and amounts as text, genero M/F/X, USD/CRC"""
+
+    name = "MySQL"
+
+    BOUNDS_QUERY = "SELECT MIN(id), MAX(id) FROM Orden"
+    RANGE_QUERY = """
+        SELECT o.id AS orden_id, o.cliente_id, o.fecha, o.canal, o.moneda, o.total,
+               d.cantidad, d.precio_unit,
+               p.id AS producto_id, p.codigo_alt, p.nombre AS producto_nombre, p.categoria,
+               c.nombre AS cliente_nombre, c.correo, c.genero, c.pais, c.created_at
+        FROM Orden o
+        JOIN OrdenDetalle d ON d.orden_id = o.id
+        JOIN Producto p ON p.id = d.producto_id
+        JOIN Cliente c ON c.id = o.cliente_id
+        WHERE o.id >= ? AND o.id < ?
+        ORDER BY o.id, d.id
+    """
+
+    def normalize(self, record: dict) -> dict:
+        return canonical_row(
+            fuente=self.name,
+            orden_id=str(record["orden_id"]),
+            cliente_id=str(record["cliente_id"]),
+            producto_id=str(record["producto_id"]),
+            producto_codigo=record["codigo_alt"],
+            fecha=to_datetime(record["fecha"]),
+            # canal is free text in this source
+            canal=(record["canal"] or "").strip().upper(),
+            moneda=(record["moneda"] or "").strip().upper(),
+            cantidad=int(record["cantidad"]),
+            precio_unit=parse_amount(record["precio_unit"]),
+            total_orden=parse_amount(record["total"]),
+            producto_nombre=record["producto_nombre"],
+            producto_categoria=record["categoria"],
+            cliente_nombre=record["cliente_nombre"],
+            cliente_email=record["correo"],
+            cliente_genero=unify_gender(record["genero"]),
+            cliente_pais=record["pais"],
+            cliente_fecha_registro=to_date_str(record["created_at"]),
+        )
@@ -0,0 +1,80 @@
+from typing import Any, Dict, Iterator, List, Optional
+from etl.extractors.base import Partition, Source, number_lines
+from etl.rows import canonical_row
+from etl.transformations.format_dates import to_date_str, to_datetime
+from etl.transformations.unify_gender import unify_gender
+
+ORDEN_IDS_QUERY = "MATCH (o:Orden) RETURN o.id AS id ORDER BY id"
+ORDEN_LINES_QUERY = """
+    MATCH (c:Cliente)-[:REALIZO]->(o:Orden)-[r:CONTIENE]->(p:Producto)
+    WHERE o.id IN $ids
+    RETURN o.id AS orden_id, o.fecha AS fecha, o.canal AS canal, o.total AS total,
+           coalesce(r.moneda, o.moneda) AS moneda, r.cantidad AS cantidad, r.precio_unit AS precio_unit,
+           r.descuento_pct AS descuento_pct,
+           p.id AS producto_id, coalesce(p.sku, p.codigo_alt, p.codigo_mongo, p.id) AS producto_codigo,
+           p.nombre AS producto_nombre, p.categoria AS producto_categoria,
+           c.id AS cliente_id, c.nombre AS cliente_nombre, c.email AS cliente_email,
+           c.genero AS cliente_genero, c.pais AS cliente_pais, c.fecha_registro AS cliente_fecha_registro
+    ORDER BY orden_id, producto_id
+"""
+
+
+class Neo4jGraph:
+    """Read access to the sales graph through the official driver"""
+
+    def __init__(self, driver, database: Optional[str] = None):
+        self.driver = driver
+        self.database = database
+
+    def orden_ids(self) -> List[Any]:
+        with self.driver.session(database=self.database) as session:
+            return [record["id"] for record in session.run(ORDEN_IDS_QUERY)]
+
+    def orden_lines(self, ids: List[Any]) -> List[Dict[str, Any]]:
+        with self.driver.session(database=self.database) as session:
+            return [record.data() for record in session.run(ORDEN_LINES_QUERY, ids=ids)]
+
+
+class Neo4jSource(Source):
+    """Graph source: several codes per producto, currency per line, mixed genero formats.
+
+    graph is anything with orden_ids()/orden_lines(ids), e.g. Neo4jGraph or an in-memory stand-in.
+    """
+
+    name = "Neo4j"
+
+    def __init__(self, graph, partition_size: int = 1000, workers: Optional[int] = None):
+        super().__init__(workers)
+        self.graph = graph
+        self.partition_size = partition_size
+
+    def partitions(self) -> List[Partition]:
+        """Explicit orden id lists: graph ids are not guaranteed to be range-friendly"""
+        ids = self.graph.orden_ids()
+        return [ids[start:start + self.partition_size] for start in range(0, len(ids), self.partition_size)]
+
+    def extract(self, partition: Partition) -> Iterator[dict]:
+        yield from number_lines(self.normalize(record) for record in self.graph.orden_lines(list(partition)))
+
+    def normalize(self, record: dict) -> dict:
+        return canonical_row(
+            fuente=self.name,
+            orden_id=str(record["orden_id"]),
+            cliente_id=str(record["cliente_id"]),
+            producto_id=str(record["producto_id"]),
+            producto_codigo=record["producto_codigo"],
+            fecha=to_datetime(record["fecha"]),
+            canal=(record.get("canal") or "").strip().upper(),
+            moneda=(record.get("moneda") or "").strip().upper(),
+            cantidad=int(record["cantidad"]),
+            precio_unit=float(record["precio_unit"]),
+            descuento_pct=record.get("descuento_pct"),
+            total_orden=record.get("total"),
+            producto_nombre=record.get("producto_nombre"),
+            producto_categoria=record.get("producto_categoria"),
+            cliente_nombre=record.get("cliente_nombre"),
+            cliente_email=record.get("cliente_email"),
+            cliente_genero=unify_gender(record.get("cliente_genero")),
+            cliente_pais=record.get("cliente_pais"),
+            cliente_fecha_registro=to_date_str(record.get("cliente_fecha_registro")),
+        )
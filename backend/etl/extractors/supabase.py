@@ -0,0 +1,55 @@
+from typing import List
+from etl.extractors.base import Partition, SqlSource
+from etl.rows import canonical_row
+from etl.transformations.format_dates import to_date_str, to_datetime
+from etl.transformations.unify_gender import unify_gender
+
+
+class SupabaseSource(SqlSource):
+    """Supabase/Postgres: UUID keys, canal PARTNER, productos that may lack a SKU"""
+
+    name = "Supabase"
+
+    RANGE_QUERY = """
+        SELECT o.orden_id, o.cliente_id, o.fecha, o.canal, o.moneda, o.total,
+               d.cantidad, d.precio_unit,
+               p.producto_id, p.sku, p.nombre AS producto_nombre, p.categoria,
+               c.nombre AS cliente_nombre, c.email, c.genero, c.pais, c.fecha_registro
+        FROM orden o
+        JOIN orden_detalle d ON d.orden_id = o.orden_id
+        JOIN producto p ON p.producto_id = d.producto_id
+        JOIN cliente c ON c.cliente_id = o.cliente_id
+        WHERE o.orden_id BETWEEN ? AND ?
+        ORDER BY o.orden_id, d.orden_detalle_id
+    """
+
+    def partitions(self) -> List[Partition]:
+        # UUIDs have no useful MIN/MAX ranges; split on the leading hex digit instead
+        return [
+            (f"{digit}0000000-0000-0000-0000-000000000000", f"{digit}fffffff-ffff-ffff-ffff-ffffffffffff")
+            for digit in "0123456789abcdef"
+        ]
+
+    def normalize(self, record: dict) -> dict:
+        producto_id = str(record["producto_id"])
+        return canonical_row(
+            fuente=self.name,
+            orden_id=str(record["orden_id"]),
+            cliente_id=str(record["cliente_id"]),
+            producto_id=producto_id,
+            # Productos without a SKU are mapped by their UUID in MapProducto
+            producto_codigo=record["sku"] or producto_id,
+            fecha=to_datetime(record["fecha"]),
+            canal=(record["canal"] or "").strip().upper(),
+            moneda=(record["moneda"] or "").strip().upper(),
+            cantidad=int(record["cantidad"]),
+            precio_unit=float(record["precio_unit"]),
+            total_orden=float(record["total"]),
+            producto_nombre=record["producto_nombre"],
+            producto_categoria=record["categoria"],
+            cliente_nombre=record["cliente_nombre"],
+            cliente_email=record["email"],
+            cliente_genero=unify_gender(record["genero"]),
+            cliente_pais=record["pais"],
+            cliente_fecha_registro=to_date_str(record["fecha_registro"]),
+        )
@@ -0,0 +1,305 @@
+"""Surrogate keys for FactVentas lines: DimCliente, DimProducto, DimCanal and DimTiempo.
+
+Each dimension keeps a natural key -> surrogate key cache (complete preload, or LRU when
+maxsize is set). A batch only goes to the database for keys the cache has not seen: one
+chunked SELECT, one executemany INSERT for members that do not exist yet, and one SELECT to
+read back the new identities. TiempoID is YYYYMMDD arithmetic and never needs a lookup.
+
+Rows without a cliente_id or with a missing/unparseable fecha get no keys at all (a NULL
+natural key would be inserted but never found again by `= ?`); FactVentasLoader rejects them.
+
+SQL uses qmark parameters and dwh.<Tabla> names, so it runs on pyodbc/SQL Server and on the
+SQLite stand-in from etl.loaders.sqlite_dw.
+"""
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from etl.transformations.normalize_currency import DateLike, to_datetime64
+
+# SQL Server caps a statement at 2100 parameters
+MAX_PARAMS = 2000
+
+MESES = [
+    "Enero", "Febrero", "Marzo", "Abril", "Mayo", "Junio",
+    "Julio", "Agosto", "Septiembre", "Octubre", "Noviembre", "Diciembre",
+]
+DIAS = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+
+
+class SurrogateKeyCache:
+    """Natural key -> surrogate key map; unbounded when maxsize is None, LRU otherwise"""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[Hashable, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, natural_key: Hashable) -> Optional[int]:
+        key = self._keys.get(natural_key)
+        if key is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.maxsize is not None:
+            self._keys.move_to_end(natural_key)
+        return key
+
+    def put(self, natural_key: Hashable, key: int):
+        self._keys[natural_key] = key
+        if self.maxsize is not None:
+            self._keys.move_to_end(natural_key)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"size": len(self._keys), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+class Dimension:
+    """One identity-keyed dimension table looked up by its natural key columns"""
+
+    table = ""
+    key_column = ""
+    natural_columns: Tuple[str, ...] = ()
+    value_columns: Tuple[str, ...] = ()
+
+    def __init__(self, connection, maxsize: Optional[int] = None, preload: bool = None):
+        self.connection = connection
+        self.cache = SurrogateKeyCache(maxsize)
+        self.inserted = 0
+        # A complete preload only makes sense when the cache can hold the whole table
+        if preload is None:
+            preload = maxsize is None
+        if preload:
+            self.preload()
+
+    def natural_key(self, member: dict) -> tuple:
+        return tuple(member[column] for column in self.natural_columns)
+
+    def preload(self) -> int:
+        columns = ", ".join((self.key_column,) + self.natural_columns)
+        cursor = self.connection.cursor()
+        cursor.execute(f"SELECT {columns} FROM {self.table}")
+        loaded = 0
+        for row in cursor.fetchall():
+            self.cache.put(tuple(row[1:]), row[0])
+            loaded += 1
+        cursor.close()
+        return loaded
+
+    def keys(self, members: Sequence[dict]) -> List[int]:
+        """Surrogate key of every member, inserting the ones the dimension does not have yet"""
+        natural_keys = [self.natural_key(member) for member in members]
+        resolved: Dict[tuple, int] = {}
+        pending: Dict[tuple, dict] = {}
+        for natural_key, member in zip(natural_keys, members):
+            if natural_key in resolved or natural_key in pending:
+                continue
+            key = self.cache.get(natural_key)
+            if key is None:
+                pending[natural_key] = member
+            else:
+                resolved[natural_key] = key
+
+        if pending:
+            found = self._select(list(pending))
+            missing = [natural_key for natural_key in pending if natural_key not in found]
+            if missing:
+                self._insert([pending[natural_key] for natural_key in missing])
+                found.update(self._select(missing))
+            for natural_key, key in found.items():
+                self.cache.put(natural_key, key)
+            resolved.update(found)
+
+        return [resolved[natural_key] for natural_key in natural_keys]
+
+    def _select(self, natural_keys: List[tuple]) -> Dict[tuple, int]:
+        found = {}
+        width = len(self.natural_columns)
+        match = "(" + " AND ".join(f"{column} = ?" for column in self.natural_columns) + ")"
+        columns = ", ".join((self.key_column,) + self.natural_columns)
+        cursor = self.connection.cursor()
+        for start in range(0, len(natural_keys), MAX_PARAMS // width):
+            chunk = natural_keys[start:start + MAX_PARAMS // width]
+            where = " OR ".join([match] * len(chunk))
+            cursor.execute(f"SELECT {columns} FROM {self.table} WHERE {where}", [v for key in chunk for v in key])
+            for row in cursor.fetchall():
+                found[tuple(row[1:])] = row[0]
+        cursor.close()
+        return found
+
+    def _insert(self, members: List[dict]):
+        columns = self.natural_columns + tuple(c for c in self.value_columns if c not in self.natural_columns)
+        placeholders = ", ".join("?" for _ in columns)
+        cursor = self.connection.cursor()
+        cursor.executemany(
+            f"INSERT INTO {self.table} ({', '.join(columns)}) VALUES ({placeholders})",
+            [tuple(member.get(column) for column in columns) for member in members]
+        )
+        cursor.close()
+        self.connection.commit()
+        self.inserted += len(members)
+
+
+class DimCliente(Dimension):
+    table = "dwh.DimCliente"
+    key_column = "ClienteID"
+    natural_columns = ("ClienteID_Natural", "FuenteOrigen")
+    value_columns = ("Nombre", "Email", "Genero", "Pais", "FechaRegistro")
+
+
+class DimProducto(Dimension):
+    table = "dwh.DimProducto"
+    key_column = "ProductoID"
+    natural_columns = ("SKU_Oficial",)
+    value_columns = ("Nombre", "Categoria", "FuenteOrigen")
+
+
+class DimCanal(Dimension):
+    table = "dwh.DimCanal"
+    key_column = "CanalID"
+    natural_columns = ("NombreCanal",)
+    value_columns = ("Descripcion",)
+
+
+def _days(fechas: Sequence[DateLike]) -> np.ndarray:
+    """datetime64[D] per fecha, NaT where it is missing or does not parse"""
+    try:
+        return to_datetime64(fechas)
+    except ValueError:
+        # One bad string fails the whole array; only then fall back to one value at a time
+        days = []
+        for fecha in fechas:
+            try:
+                days.append(to_datetime64([fecha])[0])
+            except ValueError:
+                days.append(np.datetime64("NaT"))
+        return np.array(days, dtype="datetime64[D]")
+
+
+def tiempo_ids(fechas: Iterable[DateLike]) -> np.ndarray:
+    """YYYYMMDD keys for a batch of dates, computed with array arithmetic (garbage where NaT)"""
+    days = to_datetime64(fechas)
+    years = days.astype("datetime64[Y]")
+    months = days.astype("datetime64[M]")
+    year = years.astype(np.int64) + 1970
+    month = (months - years).astype(np.int64) + 1
+    day = (days - months).astype(np.int64) + 1
+    return year * 10000 + month * 100 + day
+
+
+class DimTiempo:
+    """Calendar dimension: keys are arithmetic, rows are only written for unseen days"""
+
+    table = "dwh.DimTiempo"
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.inserted = 0
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT TiempoID FROM {self.table}")
+        self.known = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+
+    def keys(self, fechas: Sequence[DateLike]) -> List[Optional[int]]:
+        """TiempoID per fecha; None where the fecha is missing or unparseable"""
+        days = _days(fechas)
+        unknown = np.isnat(days)
+        ids = [None if nat else tiempo_id for tiempo_id, nat in zip(tiempo_ids(days).tolist(), unknown.tolist())]
+        missing = {tiempo_id for tiempo_id in ids if tiempo_id is not None} - self.known
+        if missing:
+            self._insert(sorted(missing))
+        return ids
+
+    def _insert(self, ids: List[int]):
+        cursor = self.connection.cursor()
+        cursor.executemany(
+            f'INSERT INTO {self.table} (TiempoID, FechaCompleta, Dia, Mes, Trimestre, "Año", NombreMes,'
+            f' NombreDiaSemana, DiaSemana, EsFinDeSemana, "MesAño") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [tiempo_row(tiempo_id) for tiempo_id in ids]
+        )
+        cursor.close()
+        self.connection.commit()
+        self.known.update(ids)
+        self.inserted += len(ids)
+
+
+def tiempo_row(tiempo_id: int) -> tuple:
+    """DimTiempo attributes of a YYYYMMDD key (DiaSemana: 1 = lunes ... 7 = domingo)"""
+    day = date(tiempo_id // 10000, tiempo_id // 100 % 100, tiempo_id % 100)
+    weekday = day.isoweekday()
+    return (
+        tiempo_id, day.isoformat(), day.day, day.month, (day.month - 1) // 3 + 1, day.year,
+        MESES[day.month - 1], DIAS[weekday - 1], weekday, int(weekday >= 6), f"{day.year:04d}-{day.month:02d}",
+    )
+
+
+class DimensionStage:
+    """Surrogate keys for whole batches of normalized line rows"""
+
+    def __init__(self, connection, maxsize: Optional[int] = None):
+        self.clientes = DimCliente(connection, maxsize)
+        self.productos = DimProducto(connection, maxsize)
+        self.canales = DimCanal(connection)
+        self.tiempo = DimTiempo(connection)
+
+    def assign_keys(self, rows: List[dict]) -> List[dict]:
+        """Set TiempoID/ClienteID/ProductoID/CanalID on each row in place.
+
+        Rows carry the member attributes under the DW column names (Nombre/Email/... for the
+        cliente, producto_nombre/categoria for the producto) so unseen members can be inserted.
+        Rows without a cliente_id or a usable fecha keep None keys and are rejected at load.
+        """
+        if not rows:
+            return rows
+        tiempo = self.tiempo.keys([row.get("fecha") for row in rows])
+        keyed = []
+        for row, tiempo_id in zip(rows, tiempo):
+            row["TiempoID"] = tiempo_id
+            if tiempo_id is None or row.get("cliente_id") in (None, ""):
+                row["ClienteID"] = row["ProductoID"] = row["CanalID"] = None
+            else:
+                keyed.append(row)
+        if not keyed:
+            return rows
+        clientes = self.clientes.keys([
+            {
+                "ClienteID_Natural": row["cliente_id"],
+                "FuenteOrigen": row["fuente"],
+                "Nombre": row.get("cliente_nombre") or row["cliente_id"],
+                "Email": row.get("cliente_email"),
+                "Genero": row.get("cliente_genero") or "No Especificado",
+                "Pais": row.get("cliente_pais") or "Desconocido",
+                "FechaRegistro": str(row.get("cliente_fecha_registro") or row["fecha"])[:10],
+            }
+            for row in keyed
+        ])
+        productos = self.productos.keys([
+            {
+                "SKU_Oficial": row["sku_oficial"],
+                "Nombre": row.get("producto_nombre") or row["sku_oficial"],
+                "Categoria": row.get("producto_categoria") or "Sin Categoria",
+                "FuenteOrigen": row["fuente"],
+            }
+            for row in keyed
+        ])
+        canales = self.canales.keys([{"NombreCanal": row.get("canal") or "DESCONOCIDO"} for row in keyed])
+
+        for row, cliente_id, producto_id, canal_id in zip(keyed, clientes, productos, canales):
+            row["ClienteID"] = cliente_id
+            row["ProductoID"] = producto_id
+            row["CanalID"] = canal_id
+        return rows
+
+    def stats(self) -> dict:
+        return {
+            "DimCliente": {**self.clientes.cache.stats(), "inserted": self.clientes.inserted},
+            "DimProducto": {**self.productos.cache.stats(), "inserted": self.productos.inserted},
+            "DimCanal": {**self.canales.cache.stats(), "inserted": self.canales.inserted},
+            "DimTiempo": {"size": len(self.tiempo.known), "inserted": self.tiempo.inserted},
+        }
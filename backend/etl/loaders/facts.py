@@ -0,0 +1,152 @@
+"""dwh.FactVentas loader: columnar batches written with one executemany per batch.
+
+Lines accumulate as one list per FactVentas column and are flushed at the first orden
+boundary past batch_size rows.
+pyodbc cursors get fast_executemany, which binds each column as a parameter array (one round
+trip per batch, the same effect as the BULK INSERT staging step in fullSetup.sql without a
+file the server has to see).
+
+Re-runs are idempotent on (OrdenID_Natural, FuenteOrigen): each flush deletes the existing
+facts of its ordenes in the same transaction that inserts the new lines. Rows arrive in orden
+order (lines of an orden contiguous, as the extractors yield them) and batches are only cut
+between ordenes, so every orden is written by exactly one flush and no state outlives it.
+"""
+from typing import Dict, List, Optional
+
+FACT_COLUMNS = (
+    "TiempoID", "ClienteID", "ProductoID", "CanalID", "OrdenID_Natural", "MonedaOrigen",
+    "TotalVentaUSD", "Cantidad", "PrecioUnitUSD", "DescuentoPct", "FuenteOrigen",
+)
+
+# Canonical row field -> FactVentas column
+ROW_FIELDS = {
+    "TiempoID": "TiempoID",
+    "ClienteID": "ClienteID",
+    "ProductoID": "ProductoID",
+    "CanalID": "CanalID",
+    "OrdenID_Natural": "orden_id",
+    "MonedaOrigen": "moneda",
+    "TotalVentaUSD": "total_usd",
+    "Cantidad": "cantidad",
+    "PrecioUnitUSD": "precio_unit_usd",
+    "DescuentoPct": "descuento_pct",
+    "FuenteOrigen": "fuente",
+}
+
+# Surrogate key -> the row field it is resolved from (DimensionStage leaves the key None when unusable)
+KEY_SOURCES = {"TiempoID": "fecha", "ClienteID": "cliente_id", "ProductoID": "sku_oficial", "CanalID": "canal"}
+
+
+def fact_problem(row: dict) -> Optional[str]:
+    """Why a line cannot satisfy the FactVentas constraints, or None"""
+    if row.get("moneda") not in ("USD", "CRC"):
+        return f"moneda {row.get('moneda')!r} not supported"
+    if row.get("total_usd") is None or row.get("precio_unit_usd") is None:
+        return "no USD conversion"
+    if not row.get("cantidad") or row["cantidad"] <= 0:
+        return "cantidad must be > 0"
+    descuento = row.get("descuento_pct")
+    if descuento is not None and not 0 <= descuento <= 100:
+        return "descuento_pct out of range"
+    for column, field in KEY_SOURCES.items():
+        if row.get(column) is None:
+            return f"missing {column} (no usable {field}: {row.get(field)!r})"
+    return None
+
+
+class FactVentasLoader:
+    def __init__(self, connection, batch_size: int = 5000, table: str = "dwh.FactVentas"):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.table = table
+        self.columns: Dict[str, list] = {column: [] for column in FACT_COLUMNS}
+        self.rejected: List[dict] = []
+        self.inserted = 0
+        self.deleted = 0
+        self.flushes = 0
+
+        placeholders = ", ".join("?" for _ in FACT_COLUMNS)
+        self._insert = f"INSERT INTO {table} ({', '.join(FACT_COLUMNS)}) VALUES ({placeholders})"
+        self._delete = f"DELETE FROM {table} WHERE OrdenID_Natural = ? AND FuenteOrigen = ?"
+
+    def __len__(self) -> int:
+        return len(self.columns["OrdenID_Natural"])
+
+    def add(self, rows: List[dict]):
+        """Buffer converted, keyed line rows; flushes at the first orden boundary past batch_size"""
+        columns = self.columns
+        for row in rows:
+            problem = fact_problem(row)
+            if problem:
+                self.rejected.append({"fuente": row.get("fuente"), "orden_id": row.get("orden_id"), "linea": row.get("linea"), "error": problem})
+                continue
+            if len(self) >= self.batch_size and (row.get("orden_id"), row.get("fuente")) != (
+                columns["OrdenID_Natural"][-1], columns["FuenteOrigen"][-1]
+            ):
+                self.flush()
+            for column, field in ROW_FIELDS.items():
+                columns[column].append(row.get(field))
+
+    def flush(self) -> int:
+        """Write the buffered columns in one transaction; returns rows inserted"""
+        count = len(self)
+        if not count:
+            return 0
+
+        keys = set(zip(self.columns["OrdenID_Natural"], self.columns["FuenteOrigen"]))
+        cursor = self.connection.cursor()
+        if hasattr(cursor, "fast_executemany"):
+            cursor.fast_executemany = True
+        try:
+            if keys:
+                cursor.executemany(self._delete, sorted(keys))
+                # sqlite3 reports the summed rowcount of an executemany; pyodbc may report -1
+                self.deleted += max(cursor.rowcount, 0)
+            cursor.executemany(self._insert, list(zip(*(self.columns[column] for column in FACT_COLUMNS))))
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        self.inserted += count
+        self.flushes += 1
+        for values in self.columns.values():
+            values.clear()
+        return count
+
+    def close(self) -> dict:
+        self.flush()
+        return self.stats()
+
+    def stats(self) -> dict:
+        return {
+            "inserted": self.inserted,
+            "deleted": self.deleted,
+            "flushes": self.flushes,
+            "rejected": len(self.rejected),
+            "buffered": len(self),
+        }
+
+
+class FactStage:
+    """Pipeline loader (fuente, rows): homologate productos, convert to USD, assign keys, load"""
+
+    def __init__(self, product_map, rates, dimensions, loader: FactVentasLoader):
+        self.product_map = product_map
+        self.rates = rates
+        self.dimensions = dimensions
+        self.loader = loader
+
+    def __call__(self, fuente: str, rows: List[dict]):
+        self.product_map.resolve_rows(rows, code_field="producto_codigo")
+        mapped = []
+        for row in rows:
+            if row["sku_oficial"] is None:
+                self.loader.rejected.append({"fuente": fuente, "orden_id": row["orden_id"], "linea": row.get("linea"), "error": f"unmapped producto {row['producto_codigo']!r}"})
+            else:
+                mapped.append(row)
+        self.rates.convert_rows(mapped)
+        self.dimensions.assign_keys(mapped)
+        self.loader.add(mapped)
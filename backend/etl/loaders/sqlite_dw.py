@@ -0,0 +1,90 @@
+"""SQLite stand-in for the SQL Server DW (scripts/dw/dw_tables.sql).
+
+The dwh and staging schemas are attached databases, so loader SQL written against
+dwh.<Tabla>/staging.<Tabla> runs unchanged on both engines.
+"""
+import os
+import sqlite3
+from typing import Optional
+
+DW_TABLES = [
+    """CREATE TABLE IF NOT EXISTS dwh.DimCliente (
+        ClienteID INTEGER PRIMARY KEY AUTOINCREMENT,
+        ClienteID_Natural TEXT NOT NULL,
+        Nombre TEXT NOT NULL,
+        Email TEXT NULL,
+        Genero TEXT NOT NULL CHECK (Genero IN ('Masculino', 'Femenino', 'No Especificado')),
+        Pais TEXT NOT NULL,
+        FechaRegistro TEXT NOT NULL,
+        FuenteOrigen TEXT NOT NULL CHECK (FuenteOrigen IN ('SQL Server', 'MySQL', 'MongoDB', 'Supabase', 'Neo4j')),
+        FechaCreacion TEXT DEFAULT CURRENT_TIMESTAMP,
+        FechaActualizacion TEXT DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (ClienteID_Natural, FuenteOrigen)
+    )""",
+    """CREATE TABLE IF NOT EXISTS dwh.DimProducto (
+        ProductoID INTEGER PRIMARY KEY AUTOINCREMENT,
+        SKU_Oficial TEXT NOT NULL UNIQUE,
+        Nombre TEXT NOT NULL,
+        Categoria TEXT NOT NULL,
+        FuenteOrigen TEXT NOT NULL,
+        FechaCreacion TEXT DEFAULT CURRENT_TIMESTAMP,
+        FechaActualizacion TEXT DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE IF NOT EXISTS dwh.DimTiempo (
+        TiempoID INTEGER PRIMARY KEY,
+        FechaCompleta TEXT NOT NULL UNIQUE,
+        Dia INTEGER NOT NULL CHECK (Dia BETWEEN 1 AND 31),
+        Mes INTEGER NOT NULL CHECK (Mes BETWEEN 1 AND 12),
+        Trimestre INTEGER NOT NULL CHECK (Trimestre BETWEEN 1 AND 4),
+        "Año" INTEGER NOT NULL,
+        NombreMes TEXT NOT NULL,
+        NombreDiaSemana TEXT NOT NULL,
+        DiaSemana INTEGER NOT NULL CHECK (DiaSemana BETWEEN 1 AND 7),
+        EsFinDeSemana INTEGER NOT NULL,
+        "MesAño" TEXT NOT NULL,
+        FechaCreacion TEXT DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE IF NOT EXISTS dwh.DimCanal (
+        CanalID INTEGER PRIMARY KEY AUTOINCREMENT,
+        NombreCanal TEXT NOT NULL UNIQUE,
+        Descripcion TEXT NULL,
+        FechaCreacion TEXT DEFAULT CURRENT_TIMESTAMP
+    )""",
+    """CREATE TABLE IF NOT EXISTS dwh.FactVentas (
+        VentaID INTEGER PRIMARY KEY AUTOINCREMENT,
+        TiempoID INTEGER NOT NULL REFERENCES DimTiempo(TiempoID),
+        ClienteID INTEGER NOT NULL REFERENCES DimCliente(ClienteID),
+        ProductoID INTEGER NOT NULL REFERENCES DimProducto(ProductoID),
+        CanalID INTEGER NOT NULL REFERENCES DimCanal(CanalID),
+        OrdenID_Natural TEXT NOT NULL,
+        MonedaOrigen TEXT NOT NULL CHECK (MonedaOrigen IN ('USD', 'CRC')),
+        TotalVentaUSD REAL NOT NULL,
+        Cantidad INTEGER NOT NULL CHECK (Cantidad > 0),
+        PrecioUnitUSD REAL NOT NULL,
+        DescuentoPct REAL NULL CHECK (DescuentoPct BETWEEN 0 AND 100),
+        FuenteOrigen TEXT NOT NULL,
+        FechaCreacion TEXT DEFAULT CURRENT_TIMESTAMP
+    )""",
+    # Natural key of an orden's facts, used by the idempotent reload in etl/loaders/facts.py
+    "CREATE INDEX IF NOT EXISTS dwh.IX_FactVentas_Orden ON FactVentas(OrdenID_Natural, FuenteOrigen)",
+    """CREATE TABLE IF NOT EXISTS staging.MapProducto (
+        MapID INTEGER PRIMARY KEY AUTOINCREMENT,
+        FuenteOrigen TEXT NOT NULL,
+        CodigoFuente TEXT NOT NULL,
+        SKU_Oficial TEXT NOT NULL,
+        FechaCreacion TEXT DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (FuenteOrigen, CodigoFuente)
+    )""",
+]
+
+
+def connect_sqlite_dw(directory: Optional[str] = None) -> sqlite3.Connection:
+    """Open the stand-in DW: in memory, or dwh.db/staging.db files under directory"""
+    connection = sqlite3.connect(":memory:")
+    for schema in ("dwh", "staging"):
+        path = os.path.join(directory, f"{schema}.db") if directory else ":memory:"
+        connection.execute(f"ATTACH DATABASE ? AS {schema}", (path,))
+    for ddl in DW_TABLES:
+        connection.execute(ddl)
+    connection.commit()
+    return connection
@@ -0,0 +1,120 @@
+"""Run the multi-source ETL extraction into a staging table.
+
+Usage (from backend/):
+    python -m etl.main [--standins DIR] [--sample N] [--seed N] [--live mongo,mysql]
+                       [--workers N] [--max-pending N] [--batch-size N]
+                       [--target staging|dw] [--staging staging.db] [--dw DIR] [--fact-batch-size N]
+
+Without --live every source reads its local stand-in (etl/standins.py); --sample seeds them
+first (etl/synthetic.py). --live switches Mongo/MySQL to the databases configured in api.config. --target dw
+loads dwh.FactVentas in the SQLite DW stand-in instead of the staging table.
+"""
+import argparse
+import json
+import os
+from etl.extractors.mongo import MongoSource
+from etl.extractors.mssql import SqlServerSource
+from etl.extractors.mysql import MySQLSource
+from etl.extractors.neo4j import Neo4jSource
+from etl.extractors.supabase import SupabaseSource
+from etl.loaders.dimensions import DimensionStage
+from etl.loaders.facts import FactStage, FactVentasLoader
+from etl.loaders.sqlite_dw import connect_sqlite_dw
+from etl.pipeline import Pipeline
+from etl.rows import CANONICAL_COLUMNS
+from etl.staging import SQLiteStagingSink
+from etl.standins import InMemoryGraph, SqliteStandins
+from etl.synthetic import default_productos, map_producto_rows, seed_standins
+from etl.transformations.map_products import ProductMap
+from etl.transformations.normalize_currency import ExchangeRates
+
+
+def staging_loader(sink: SQLiteStagingSink):
+    def load(fuente: str, rows):
+        sink.replace(sorted({row["orden_id"] for row in rows}), rows, fuente)
+    return load
+
+
+def build_sources(args) -> list:
+    import mongomock
+
+    live = set(filter(None, args.live.split(",")))
+    standins = SqliteStandins(args.standins)
+    mongo_db = mongomock.MongoClient()["sales_mongo"]
+    graph = InMemoryGraph()
+    if args.sample:
+        seed_standins(standins, mongo_db, graph, ordenes=args.sample, seed=args.seed, workers=args.sample_workers)
+
+    mysql_source = MySQLSource(standins.mysql, partition_size=args.partition_size)
+    if "mysql" in live:
+        from api.database.mysql_connection import MySQLConnection
+        mysql_source = MySQLSource(lambda: MySQLConnection.get_engine().raw_connection(), args.partition_size, paramstyle="format")
+    if "mongo" in live:
+        from api.database.mongo_connection import MongoDBConnection
+        mongo_db = MongoDBConnection.get_db()
+
+    return [
+        SqlServerSource(standins.mssql, partition_size=args.partition_size),
+        mysql_source,
+        SupabaseSource(standins.supabase),
+        MongoSource(mongo_db, partition_size=args.partition_size),
+        Neo4jSource(graph, partition_size=args.partition_size),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract all sources concurrently into staging")
+    parser.add_argument("--standins", default="etl_standins", help="Directory of the SQLite stand-in sources")
+    parser.add_argument("--sample", type=int, default=0, help="Seed N sample ordenes per stand-in source first")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed of the --sample data")
+    parser.add_argument("--sample-workers", type=int, default=None, help="Processes generating the --sample data (default: CPU count)")
+    parser.add_argument("--live", default="", help="Comma-separated sources read from real databases (mongo,mysql)")
+    parser.add_argument("--workers", type=int, default=2, help="Extraction threads per source")
+    parser.add_argument("--max-pending", type=int, default=4, help="Batches in flight per source before it blocks")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per batch handed to the loader")
+    parser.add_argument("--partition-size", type=int, default=5000, help="Ordenes per extraction task")
+    parser.add_argument("--target", choices=["staging", "dw"], default="staging", help="Where extracted lines are loaded")
+    parser.add_argument("--staging", default=os.path.join("etl_standins", "staging.db"), help="SQLite staging database")
+    parser.add_argument("--dw", default=os.path.join("etl_standins", "dw"), help="Directory of the SQLite DW stand-in")
+    parser.add_argument("--fact-batch-size", type=int, default=5000, help="FactVentas rows per executemany")
+    args = parser.parse_args()
+
+    sources = build_sources(args)
+    if args.target == "dw":
+        report = run_dw(args, sources)
+    else:
+        sink = SQLiteStagingSink(args.staging, table="stg_lineas", columns=CANONICAL_COLUMNS)
+        try:
+            report = Pipeline(sources, staging_loader(sink), args.workers, args.max_pending, args.batch_size).run()
+        finally:
+            sink.close()
+    print(json.dumps(report, indent=2))
+
+
+def run_dw(args, sources) -> dict:
+    os.makedirs(args.dw, exist_ok=True)
+    connection = connect_sqlite_dw(args.dw)
+    if args.sample:
+        connection.executemany(
+            "INSERT OR IGNORE INTO staging.MapProducto (FuenteOrigen, CodigoFuente, SKU_Oficial) VALUES (?, ?, ?)",
+            map_producto_rows(default_productos(args.sample))
+        )
+        connection.commit()
+
+    product_map = ProductMap()
+    product_map.refresh(connection)
+    facts = FactVentasLoader(connection, batch_size=args.fact_batch_size)
+    stage = FactStage(product_map, ExchangeRates.from_csv(), DimensionStage(connection), facts)
+    try:
+        report = Pipeline(sources, stage, args.workers, args.max_pending, args.batch_size).run()
+        report["facts"] = facts.close()
+        report["dimensions"] = stage.dimensions.stats()
+        report["unmapped_productos"] = product_map.miss_report(limit=20)
+        report["rejected_sample"] = facts.rejected[:20]
+    finally:
+        connection.close()
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Concurrent extraction from every source into one loader.
+
+Each source gets its own thread pool (one partition per task) and a budget of max_pending
+batches in flight: a worker must take a credit before queueing a batch and the loader returns
+it once the batch is loaded, so a fast source blocks on its own backlog instead of flooding
+memory or starving the others. The loader runs on the calling thread and receives
+(fuente, rows) batches that never split an orden.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Sequence
+from etl.extractors.base import Source
+
+Loader = Callable[[str, List[dict]], None]
+
+_BATCH = "batch"
+_DONE = "done"
+
+
+class PipelineCancelled(Exception):
+    pass
+
+
+class SourceStats:
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.partitions = 0
+        self.partitions_done = 0
+        self.batches = 0
+        self.ordenes = 0
+        self.rows = 0
+        self.backpressure_wait = 0.0
+        self.errors: List[str] = []
+        self.started = time.perf_counter()
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def add_wait(self, seconds: float):
+        with self._lock:
+            self.backpressure_wait += seconds
+
+    def report(self) -> dict:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return {
+            "workers": self.workers,
+            "partitions": self.partitions,
+            "batches": self.batches,
+            "ordenes": self.ordenes,
+            "rows": self.rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_s": round(self.rows / elapsed, 1) if elapsed > 0 else None,
+            "backpressure_wait_s": round(self.backpressure_wait, 3),
+            "errors": self.errors,
+        }
+
+
+class Pipeline:
+    def __init__(
+        self,
+        sources: Sequence[Source],
+        loader: Loader,
+        workers: int = 2,
+        max_pending: int = 4,
+        batch_size: int = 1000
+    ):
+        self.sources = list(sources)
+        self.loader = loader
+        self.workers = workers
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+
+    def run(self) -> dict:
+        """Extract every source concurrently and load their batches; returns per-source stats"""
+        events: "queue.Queue" = queue.Queue()
+        stop = threading.Event()
+        stats: Dict[str, SourceStats] = {}
+        credits: Dict[str, threading.BoundedSemaphore] = {}
+        executors = []
+        pending_tasks = 0
+        start = time.perf_counter()
+
+        try:
+            for source in self.sources:
+                source_stats = stats[source.name] = SourceStats(source.name, source.workers or self.workers)
+                credits[source.name] = threading.BoundedSemaphore(self.max_pending)
+                try:
+                    partitions = source.partitions()
+                except Exception as e:
+                    source_stats.errors.append(f"partitions: {e}")
+                    source_stats.finished = time.perf_counter()
+                    continue
+
+                source_stats.partitions = len(partitions)
+                if not partitions:
+                    source_stats.finished = time.perf_counter()
+                    continue
+                executor = ThreadPoolExecutor(max_workers=source_stats.workers, thread_name_prefix=f"etl-{source.name}")
+                executors.append(executor)
+                for partition in partitions:
+                    executor.submit(self._extract, source, partition, events, credits[source.name], stats[source.name], stop)
+                    pending_tasks += 1
+
+            while pending_tasks:
+                kind, name, payload = events.get()
+                source_stats = stats[name]
+                if kind == _BATCH:
+                    try:
+                        self.loader(name, payload)
+                    finally:
+                        credits[name].release()
+                    source_stats.batches += 1
+                    source_stats.rows += len(payload)
+                    source_stats.ordenes += len({row["orden_id"] for row in payload})
+                else:
+                    pending_tasks -= 1
+                    source_stats.partitions_done += 1
+                    if payload:
+                        source_stats.errors.append(payload)
+                    if source_stats.partitions_done == source_stats.partitions:
+                        source_stats.finished = time.perf_counter()
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        elapsed = time.perf_counter() - start
+        total_rows = sum(source_stats.rows for source_stats in stats.values())
+        return {
+            "sources": {name: source_stats.report() for name, source_stats in stats.items()},
+            "rows": total_rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_s": round(total_rows / elapsed, 1) if elapsed > 0 else None,
+        }
+
+    def _extract(self, source: Source, partition, events: "queue.Queue", credit, source_stats: SourceStats, stop: threading.Event):
+        error = None
+        try:
+            for batch in orden_batches(source.extract(partition), self.batch_size):
+                waited = time.perf_counter()
+                while not credit.acquire(timeout=0.1):
+                    if stop.is_set():
+                        raise PipelineCancelled()
+                source_stats.add_wait(time.perf_counter() - waited)
+                events.put((_BATCH, source.name, batch))
+        except PipelineCancelled:
+            pass
+        except Exception as e:
+            error = f"partition {partition!r:.80}: {e}"
+            print(f"Extraction error in {source.name}: {error}")
+        finally:
+            events.put((_DONE, source.name, error))
+
+
+def orden_batches(rows: Iterator[dict], batch_size: int) -> Iterator[List[dict]]:
+    """Group rows into batches of about batch_size, cutting only between ordenes"""
+    batch = []
+    for row in rows:
+        if len(batch) >= batch_size and row["orden_id"] != batch[-1]["orden_id"]:
+            yield batch
+            batch = []
+        batch.append(row)
+    if batch:
+        yield batch
@@ -0,0 +1,41 @@
+from typing import Iterator
+
+# One row per order line: the grain of dwh.FactVentas, before surrogate keys and USD conversion
+LINE_COLUMNS = [
+    "fuente", "orden_id", "linea", "cliente_id", "producto_id", "fecha", "canal", "moneda",
+    "cantidad", "precio_unit", "descuento_pct", "total_orden",
+]
+
+# Line rows plus the member attributes the dimension loader needs, shared by every source
+CANONICAL_COLUMNS = LINE_COLUMNS + [
+    "producto_codigo", "producto_nombre", "producto_categoria",
+    "cliente_nombre", "cliente_email", "cliente_genero", "cliente_pais", "cliente_fecha_registro",
+]
+
+
+def canonical_row(**fields) -> dict:
+    """Row with every canonical column, missing ones set to None"""
+    row = dict.fromkeys(CANONICAL_COLUMNS)
+    row.update(fields)
+    return row
+
+
+def mongo_orden_lines(orden: dict, fuente: str = "MongoDB") -> Iterator[dict]:
+    """Flatten a Mongo orden document into line rows"""
+    orden_id = str(orden["_id"])
+    cliente_id = str(orden.get("cliente_id")) if orden.get("cliente_id") is not None else None
+    for linea, item in enumerate(orden.get("items") or [], 1):
+        yield {
+            "fuente": fuente,
+            "orden_id": orden_id,
+            "linea": linea,
+            "cliente_id": cliente_id,
+            "producto_id": str(item.get("producto_id")),
+            "fecha": orden.get("fecha"),
+            "canal": orden.get("canal"),
+            "moneda": orden.get("moneda"),
+            "cantidad": item.get("cantidad"),
+            "precio_unit": item.get("precio_unit"),
+            "descuento_pct": item.get("descuento_pct"),
+            "total_orden": orden.get("total"),
+        }
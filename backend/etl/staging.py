@@ -0,0 +1,51 @@
+import sqlite3
+from typing import List, Optional, Sequence
+from etl.rows import LINE_COLUMNS
+
+
+class SQLiteStagingSink:
+    """Local stand-in for the DW staging area, one row per (fuente, orden_id, linea)"""
+
+    def __init__(
+        self,
+        path: str = "staging.db",
+        table: str = "stg_orden_lineas",
+        fuente: str = "MongoDB",
+        columns: Sequence[str] = LINE_COLUMNS
+    ):
+        self.table = table
+        self.fuente = fuente
+        self.columns = list(columns)
+        self.connection = sqlite3.connect(path)
+        columns = ", ".join(self.columns)
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ({columns}, PRIMARY KEY (fuente, orden_id, linea))"
+        )
+        placeholders = ", ".join("?" for _ in self.columns)
+        self._insert = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        self._delete = f"DELETE FROM {table} WHERE fuente = ? AND orden_id = ?"
+
+    def replace(self, orden_ids: List[str], rows: List[dict], fuente: Optional[str] = None):
+        """Swap the lines of changed ordenes in one transaction (items may have been added or removed)"""
+        fuente = fuente or self.fuente
+        with self.connection:
+            self.connection.executemany(self._delete, ((fuente, orden_id) for orden_id in orden_ids))
+            self.connection.executemany(
+                self._insert,
+                ([_sqlite_value(row[column]) for column in self.columns] for row in rows)
+            )
+
+    def delete(self, orden_ids: List[str], fuente: Optional[str] = None):
+        fuente = fuente or self.fuente
+        with self.connection:
+            self.connection.executemany(self._delete, ((fuente, orden_id) for orden_id in orden_ids))
+
+    def count(self) -> int:
+        return self.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+
+def _sqlite_value(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
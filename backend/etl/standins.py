@@ -0,0 +1,137 @@
+"""Local stand-ins for the five source databases, for running the pipeline without servers.
+
+SQL Server, MySQL and Supabase become SQLite files with the table layout of scripts/*
+(so the same extractor SQL runs), Mongo is mongomock and Neo4j is InMemoryGraph, which
+answers the two reads Neo4jSource needs. etl/synthetic.py fills them.
+"""
+import os
+import sqlite3
+from typing import Any, Callable, Dict, List
+
+MSSQL_TABLES = [
+    """CREATE TABLE IF NOT EXISTS sales_ms.Cliente (
+        ClienteId INTEGER PRIMARY KEY, Nombre TEXT NOT NULL, Email TEXT UNIQUE,
+        Genero TEXT CHECK (Genero IN ('Masculino','Femenino')), Pais TEXT NOT NULL, FechaRegistro TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS sales_ms.Producto (
+        ProductoId INTEGER PRIMARY KEY, SKU TEXT UNIQUE NOT NULL, Nombre TEXT NOT NULL, Categoria TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS sales_ms.Orden (
+        OrdenId INTEGER PRIMARY KEY, ClienteId INTEGER NOT NULL, Fecha TEXT NOT NULL,
+        Canal TEXT NOT NULL CHECK (Canal IN ('WEB','TIENDA','APP')), Moneda TEXT NOT NULL DEFAULT 'USD', Total REAL NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS sales_ms.OrdenDetalle (
+        OrdenDetalleId INTEGER PRIMARY KEY, OrdenId INTEGER NOT NULL, ProductoId INTEGER NOT NULL,
+        Cantidad INTEGER NOT NULL CHECK (Cantidad > 0), PrecioUnit REAL NOT NULL, DescuentoPct REAL NULL)""",
+    "CREATE INDEX IF NOT EXISTS sales_ms.IX_Detalle_Orden ON OrdenDetalle(OrdenId)",
+]
+
+MYSQL_TABLES = [
+    """CREATE TABLE IF NOT EXISTS Cliente (
+        id INTEGER PRIMARY KEY, nombre TEXT NOT NULL, correo TEXT,
+        genero TEXT CHECK (genero IN ('M','F','X')) DEFAULT 'M', pais TEXT NOT NULL, created_at TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS Producto (
+        id INTEGER PRIMARY KEY, codigo_alt TEXT UNIQUE NOT NULL, nombre TEXT NOT NULL, categoria TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS Orden (
+        id INTEGER PRIMARY KEY, cliente_id INTEGER NOT NULL, fecha TEXT NOT NULL,
+        canal TEXT NOT NULL, moneda TEXT NOT NULL, total TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS OrdenDetalle (
+        id INTEGER PRIMARY KEY, orden_id INTEGER NOT NULL, producto_id INTEGER NOT NULL,
+        cantidad INTEGER NOT NULL, precio_unit TEXT NOT NULL)""",
+    "CREATE INDEX IF NOT EXISTS IX_Detalle_orden ON OrdenDetalle(orden_id)",
+]
+
+SUPABASE_TABLES = [
+    """CREATE TABLE IF NOT EXISTS cliente (
+        cliente_id TEXT PRIMARY KEY, nombre TEXT NOT NULL, email TEXT UNIQUE,
+        genero TEXT NOT NULL CHECK (genero IN ('M','F')), pais TEXT NOT NULL, fecha_registro TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS producto (
+        producto_id TEXT PRIMARY KEY, sku TEXT UNIQUE, nombre TEXT NOT NULL, categoria TEXT NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS orden (
+        orden_id TEXT PRIMARY KEY, cliente_id TEXT NOT NULL, fecha TEXT NOT NULL,
+        canal TEXT NOT NULL CHECK (canal IN ('WEB','APP','PARTNER')), moneda TEXT NOT NULL, total REAL NOT NULL)""",
+    """CREATE TABLE IF NOT EXISTS orden_detalle (
+        orden_detalle_id TEXT PRIMARY KEY, orden_id TEXT NOT NULL, producto_id TEXT NOT NULL,
+        cantidad INTEGER NOT NULL CHECK (cantidad > 0), precio_unit REAL NOT NULL)""",
+    "CREATE INDEX IF NOT EXISTS ix_detalle_orden ON orden_detalle(orden_id)",
+]
+
+
+def sqlite_factory(path: str, schema: str = None, tables: List[str] = ()) -> Callable[[], sqlite3.Connection]:
+    """Connection factory for a stand-in file; creates its tables on first use"""
+    def connect() -> sqlite3.Connection:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        if schema:
+            # Same file attached under the schema name so sales_ms.<Tabla> resolves
+            connection.execute(f"ATTACH DATABASE ? AS {schema}", (path,))
+        return connection
+
+    connection = connect()
+    for ddl in tables:
+        connection.execute(ddl)
+    connection.commit()
+    connection.close()
+    return connect
+
+
+class SqliteStandins:
+    """SQLite files for the three relational sources under one directory"""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.mssql = sqlite_factory(os.path.join(directory, "sales_ms.db"), "sales_ms", MSSQL_TABLES)
+        self.mysql = sqlite_factory(os.path.join(directory, "sales_mysql.db"), tables=MYSQL_TABLES)
+        self.supabase = sqlite_factory(os.path.join(directory, "sales_supabase.db"), tables=SUPABASE_TABLES)
+
+
+class InMemoryGraph:
+    """Neo4j stand-in: (:Cliente)-[:REALIZO]->(:Orden)-[:CONTIENE]->(:Producto) held in dicts"""
+
+    def __init__(self):
+        self.clientes: Dict[Any, dict] = {}
+        self.productos: Dict[Any, dict] = {}
+        self.ordenes: Dict[Any, dict] = {}
+        self.realizo: Dict[Any, Any] = {}        # orden id -> cliente id
+        self.contiene: Dict[Any, List[dict]] = {}  # orden id -> [{producto_id, cantidad, precio_unit, ...}]
+
+    def add_orden(self, cliente: dict, orden: dict, items: List[dict]):
+        self.clientes.setdefault(cliente["id"], cliente)
+        self.ordenes[orden["id"]] = orden
+        self.realizo[orden["id"]] = cliente["id"]
+        lines = []
+        for item in items:
+            producto = item["producto"]
+            self.productos.setdefault(producto["id"], producto)
+            lines.append({k: v for k, v in item.items() if k != "producto"} | {"producto_id": producto["id"]})
+        self.contiene[orden["id"]] = lines
+
+    def orden_ids(self) -> List[Any]:
+        return sorted(self.ordenes)
+
+    def orden_lines(self, ids: List[Any]) -> List[dict]:
+        records = []
+        for orden_id in sorted(ids):
+            orden = self.ordenes.get(orden_id)
+            if orden is None:
+                continue
+            cliente = self.clientes[self.realizo[orden_id]]
+            for line in sorted(self.contiene[orden_id], key=lambda line: line["producto_id"]):
+                producto = self.productos[line["producto_id"]]
+                records.append({
+                    "orden_id": orden_id,
+                    "fecha": orden.get("fecha"),
+                    "canal": orden.get("canal"),
+                    "total": orden.get("total"),
+                    "moneda": line.get("moneda") or orden.get("moneda"),
+                    "cantidad": line["cantidad"],
+                    "precio_unit": line["precio_unit"],
+                    "descuento_pct": line.get("descuento_pct"),
+                    "producto_id": producto["id"],
+                    "producto_codigo": producto.get("sku") or producto.get("codigo_alt") or producto.get("codigo_mongo") or producto["id"],
+                    "producto_nombre": producto.get("nombre"),
+                    "producto_categoria": producto.get("categoria"),
+                    "cliente_id": cliente["id"],
+                    "cliente_nombre": cliente.get("nombre"),
+                    "cliente_email": cliente.get("email"),
+                    "cliente_genero": cliente.get("genero"),
+                    "cliente_pais": cliente.get("pais"),
+                    "cliente_fecha_registro": cliente.get("fecha_registro"),
+                })
+        return records
@@ -0,0 +1,561 @@
+"""Synthetic sales data for the five sources, with the heterogeneities planned in scripts/*.
+
+Usage (from backend/):
+    python -m etl.synthetic --ordenes N [--clientes N] [--productos N] [--seed N]
+                            [--sources mssql,mysql,supabase,mongo,neo4j] [--workers N]
+                            [--chunk-size N] [--format standins|ndjson|csv] [--out DIR]
+
+Work is split into chunks of clientes, productos or ordenes per source and generated in a
+process pool. Every chunk draws from its own Random(seed, source, kind, start) and ids and
+reference attributes are pure functions of (seed, number), so the output depends on the seed
+and --chunk-size only, not on --workers or scheduling. Chunks are consumed in order and streamed to a sink:
+
+    standins  SQLite stand-ins (etl/standins.py) for the relational sources; mongo and neo4j
+              go to NDJSON next to them (in-process callers pass a mongomock db and graph)
+    ndjson    one file per source table, mongo documents in relaxed extended JSON
+    csv       one file per relational table; mongo and neo4j documents stay NDJSON
+
+Heterogeneities per source:
+    mssql     USD only, Genero 'Masculino'/'Femenino', official SKUs, optional DescuentoPct
+    mysql     codigo_alt, text dates and amounts ('1200.50' or '1,200.50'), M/F/X, free-text
+              canal, USD/CRC
+    supabase  UUID keys, canal PARTNER, productos without SKU, USD/CRC
+    mongo     CRC integer amounts, nested items, incomplete equivalencias, genero 'Otro'
+    neo4j     several codes per producto, a currency per line, genero in mixed formats
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from bson import ObjectId, json_util
+
+SOURCES = ("mssql", "mysql", "supabase", "mongo", "neo4j")
+KINDS = ("productos", "clientes", "ordenes")
+
+START = datetime(2024, 1, 1)
+DAYS = 365
+CATEGORIAS = ["Frutas", "Lacteos", "Granos", "Bebidas", "Limpieza", "Panaderia", "Carnes", "Snacks"]
+PAISES = ["Costa Rica", "Panama", "Nicaragua", "Mexico", "Colombia"]
+CRC_PER_USD = 510
+
+# Relational tables per source: (stand-in table, output name, columns)
+TABLES: Dict[str, Dict[str, Tuple[str, str, Tuple[str, ...]]]] = {
+    "mssql": {
+        "productos": ("sales_ms.Producto", "Producto", ("ProductoId", "SKU", "Nombre", "Categoria")),
+        "clientes": ("sales_ms.Cliente", "Cliente", ("ClienteId", "Nombre", "Email", "Genero", "Pais", "FechaRegistro")),
+        "ordenes": ("sales_ms.Orden", "Orden", ("OrdenId", "ClienteId", "Fecha", "Canal", "Moneda", "Total")),
+        "detalle": ("sales_ms.OrdenDetalle", "OrdenDetalle", ("OrdenDetalleId", "OrdenId", "ProductoId", "Cantidad", "PrecioUnit", "DescuentoPct")),
+    },
+    "mysql": {
+        "productos": ("Producto", "Producto", ("id", "codigo_alt", "nombre", "categoria")),
+        "clientes": ("Cliente", "Cliente", ("id", "nombre", "correo", "genero", "pais", "created_at")),
+        "ordenes": ("Orden", "Orden", ("id", "cliente_id", "fecha", "canal", "moneda", "total")),
+        "detalle": ("OrdenDetalle", "OrdenDetalle", ("id", "orden_id", "producto_id", "cantidad", "precio_unit")),
+    },
+    "supabase": {
+        "productos": ("producto", "producto", ("producto_id", "sku", "nombre", "categoria")),
+        "clientes": ("cliente", "cliente", ("cliente_id", "nombre", "email", "genero", "pais", "fecha_registro")),
+        "ordenes": ("orden", "orden", ("orden_id", "cliente_id", "fecha", "canal", "moneda", "total")),
+        "detalle": ("orden_detalle", "orden_detalle", ("orden_detalle_id", "orden_id", "producto_id", "cantidad", "precio_unit")),
+    },
+}
+# Document sources: kind -> collection (mongo) or record stream (neo4j)
+DOCUMENTS = {
+    "mongo": {"productos": "productos", "clientes": "clientes", "ordenes": "ordenes"},
+    "neo4j": {"ordenes": "ordenes"},
+}
+
+# A line id leaves room for this many lines per orden
+MAX_LINES = 10
+
+
+def default_clientes(ordenes: int) -> int:
+    return max(ordenes // 5, 1)
+
+
+def default_productos(ordenes: int) -> int:
+    return max(ordenes // 500, 20)
+
+
+def sku(i: int) -> str:
+    return f"SKU-{i:04d}"
+
+
+def codigo_alt(i: int) -> str:
+    return f"ALT-{i:04d}"
+
+
+def codigo_mongo(i: int) -> str:
+    return f"MN-{i:04d}"
+
+
+def map_producto_rows(productos: int) -> List[tuple]:
+    """staging.MapProducto rows (FuenteOrigen, CodigoFuente, SKU_Oficial) for the generated codes"""
+    rows = []
+    for i in range(1, productos + 1):
+        rows += [
+            ("SQL Server", sku(i), sku(i)), ("Supabase", sku(i), sku(i)), ("MySQL", codigo_alt(i), sku(i)),
+            ("MongoDB", codigo_mongo(i), sku(i)), ("Neo4j", codigo_alt(i), sku(i)),
+            # Graph productos carry whichever codes they have
+            ("Neo4j", sku(i), sku(i)), ("Neo4j", codigo_mongo(i), sku(i)),
+        ]
+    return rows
+
+
+def _hash(seed: int, number: int, salt: int) -> int:
+    """Cheap deterministic mix (splitmix64) so any chunk can derive a cliente/producto attribute"""
+    x = (seed * 0x9E3779B97F4A7C15 + number * 0xBF58476D1CE4E5B9 + salt) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+
+def _pick(options: Sequence, seed: int, number: int, salt: int):
+    return options[_hash(seed, number, salt) % len(options)]
+
+
+def _fecha_registro(seed: int, number: int) -> str:
+    return (datetime(2022, 1, 1) + timedelta(days=_hash(seed, number, 7) % 730)).strftime("%Y-%m-%d")
+
+
+def _object_id(seed: int, kind: int, number: int) -> ObjectId:
+    # Sorted by (kind, seed, number): MongoSource's _id partitions follow the orden numbers
+    return ObjectId(bytes([kind]) + (seed & 0xFFFFFF).to_bytes(3, "big") + number.to_bytes(8, "big"))
+
+
+def _uuid(seed: int, kind: int, number: int) -> str:
+    return str(uuid.UUID(int=(kind << 124) | ((seed & 0xFFFFFFFFFFFF) << 76) | number))
+
+
+def _mysql_amount(value: float, rng: random.Random) -> str:
+    return f"{value:,.2f}" if rng.random() < 0.5 else f"{value:.2f}"
+
+
+class _Chunk:
+    """Parameters of one unit of work; plain attributes so it pickles cheaply"""
+
+    def __init__(self, source: str, kind: str, start: int, stop: int, seed: int, clientes: int, productos: int, render: Optional[str]):
+        self.source = source
+        self.kind = kind
+        self.start = start
+        self.stop = stop
+        self.seed = seed
+        self.clientes = clientes
+        self.productos = productos
+        self.render = render
+
+    def rng(self) -> random.Random:
+        return random.Random(f"{self.seed}:{self.source}:{self.kind}:{self.start}")
+
+
+# Relational rows ------------------------------------------------------------------------------
+
+def _mssql(chunk: _Chunk) -> Dict[str, list]:
+    seed = chunk.seed
+    numbers = range(chunk.start, chunk.stop)
+    if chunk.kind == "productos":
+        return {"productos": [(i, sku(i), f"Producto {i}", _pick(CATEGORIAS, seed, i, 1)) for i in numbers]}
+    if chunk.kind == "clientes":
+        return {"clientes": [
+            (i, f"Cliente {i}", f"ms{i}@ejemplo.com", _pick(("Masculino", "Femenino"), seed, i, 2), _pick(PAISES, seed, i, 3), _fecha_registro(seed, i))
+            for i in numbers
+        ]}
+
+    rng = chunk.rng()
+    ordenes, detalle = [], []
+    for i in numbers:
+        total = 0.0
+        for linea, producto in enumerate(rng.sample(range(1, chunk.productos + 1), min(rng.randint(1, 4), chunk.productos))):
+            cantidad, precio = rng.randint(1, 5), round(rng.uniform(1, 50), 2)
+            descuento = 10.0 if rng.random() < 0.2 else None
+            total += cantidad * precio * (1 - (descuento or 0) / 100)
+            detalle.append((i * MAX_LINES + linea, i, producto, cantidad, precio, descuento))
+        fecha = START + timedelta(seconds=rng.randrange(DAYS * 86400))
+        ordenes.append((i, rng.randint(1, chunk.clientes), fecha.isoformat(" "), rng.choice(("WEB", "TIENDA", "APP")), "USD", round(total, 2)))
+    return {"ordenes": ordenes, "detalle": detalle}
+
+
+def _mysql(chunk: _Chunk) -> Dict[str, list]:
+    seed = chunk.seed
+    numbers = range(chunk.start, chunk.stop)
+    if chunk.kind == "productos":
+        return {"productos": [(i, codigo_alt(i), f"Producto {i}", _pick(CATEGORIAS, seed, i, 1)) for i in numbers]}
+    if chunk.kind == "clientes":
+        return {"clientes": [
+            (i, f"Cliente {i}", f"my{i}@ejemplo.com", _pick("MFX", seed, i, 2), _pick(PAISES, seed, i, 3), _fecha_registro(seed, i))
+            for i in numbers
+        ]}
+
+    rng = chunk.rng()
+    ordenes, detalle = [], []
+    for i in numbers:
+        moneda = rng.choice(("USD", "CRC"))
+        scale = CRC_PER_USD if moneda == "CRC" else 1
+        total = 0.0
+        for linea, producto in enumerate(rng.sample(range(1, chunk.productos + 1), min(rng.randint(1, 4), chunk.productos))):
+            cantidad, precio = rng.randint(1, 5), round(rng.uniform(1, 50) * scale, 2)
+            total += cantidad * precio
+            detalle.append((i * MAX_LINES + linea, i, producto, cantidad, _mysql_amount(precio, rng)))
+        fecha = START + timedelta(seconds=rng.randrange(DAYS * 86400))
+        canal = rng.choice(("web", "WEB", "Tienda ", "tienda", "APP", " app"))
+        ordenes.append((i, rng.randint(1, chunk.clientes), fecha.strftime("%Y-%m-%d %H:%M:%S"), canal, moneda, _mysql_amount(total, rng)))
+    return {"ordenes": ordenes, "detalle": detalle}
+
+
+def _supabase(chunk: _Chunk) -> Dict[str, list]:
+    seed = chunk.seed
+    numbers = range(chunk.start, chunk.stop)
+    if chunk.kind == "productos":
+        # About one producto in five has no SKU and must be mapped by name/category
+        return {"productos": [
+            (_uuid(seed, 1, i), sku(i) if _hash(seed, i, 4) % 5 else None, f"Producto {i}", _pick(CATEGORIAS, seed, i, 1))
+            for i in numbers
+        ]}
+    if chunk.kind == "clientes":
+        return {"clientes": [
+            (_uuid(seed, 2, i), f"Cliente {i}", f"sb{i}@ejemplo.com", _pick("MF", seed, i, 2), _pick(PAISES, seed, i, 3), _fecha_registro(seed, i))
+            for i in numbers
+        ]}
+
+    rng = chunk.rng()
+    ordenes, detalle = [], []
+    for i in numbers:
+        orden_id = _uuid(seed, 3, i)
+        moneda = rng.choice(("USD", "USD", "CRC"))
+        scale = CRC_PER_USD if moneda == "CRC" else 1
+        total = 0.0
+        for linea, producto in enumerate(rng.sample(range(1, chunk.productos + 1), min(rng.randint(1, 4), chunk.productos))):
+            cantidad, precio = rng.randint(1, 5), round(rng.uniform(1, 50) * scale, 2)
+            total += cantidad * precio
+            detalle.append((_uuid(seed, 4, i * MAX_LINES + linea), orden_id, _uuid(seed, 1, producto), cantidad, precio))
+        fecha = START + timedelta(seconds=rng.randrange(DAYS * 86400))
+        cliente_id = _uuid(seed, 2, rng.randint(1, chunk.clientes))
+        ordenes.append((orden_id, cliente_id, fecha.isoformat() + "+00:00", rng.choice(("WEB", "APP", "PARTNER")), moneda, round(total, 2)))
+    return {"ordenes": ordenes, "detalle": detalle}
+
+
+# Documents ------------------------------------------------------------------------------------
+
+def _mongo(chunk: _Chunk) -> Dict[str, list]:
+    seed = chunk.seed
+    numbers = range(chunk.start, chunk.stop)
+    if chunk.kind == "productos":
+        productos = []
+        for i in numbers:
+            producto = {"_id": _object_id(seed, 1, i), "codigo_mongo": codigo_mongo(i), "nombre": f"Producto {i}", "categoria": _pick(CATEGORIAS, seed, i, 1)}
+            # equivalencias is sometimes partial or missing altogether
+            completeness = _hash(seed, i, 5) % 10
+            if completeness < 6:
+                producto["equivalencias"] = {"sku": sku(i), "codigo_alt": codigo_alt(i)}
+            elif completeness < 8:
+                producto["equivalencias"] = {"sku": sku(i), "codigo_alt": None}
+            elif completeness < 9:
+                producto["equivalencias"] = {"sku": None, "codigo_alt": codigo_alt(i)}
+            productos.append(producto)
+        return {"productos": productos}
+    if chunk.kind == "clientes":
+        return {"clientes": [
+            {
+                "_id": _object_id(seed, 2, i), "nombre": f"Cliente {i}", "email": f"mg{i}@ejemplo.com",
+                "genero": _pick(("Masculino", "Femenino", "Otro"), seed, i, 2), "pais": _pick(PAISES, seed, i, 3),
+                "creado": datetime.strptime(_fecha_registro(seed, i), "%Y-%m-%d"),
+            }
+            for i in numbers
+        ]}
+
+    rng = chunk.rng()
+    ordenes = []
+    for i in numbers:
+        # CRC integers, no decimals
+        items = [
+            {"producto_id": _object_id(seed, 1, producto), "cantidad": rng.randint(1, 5), "precio_unit": rng.randrange(500, 25000)}
+            for producto in rng.sample(range(1, chunk.productos + 1), min(rng.randint(1, 4), chunk.productos))
+        ]
+        ordenes.append({
+            "_id": _object_id(seed, 3, i),
+            "cliente_id": _object_id(seed, 2, rng.randint(1, chunk.clientes)),
+            "fecha": START + timedelta(seconds=rng.randrange(DAYS * 86400)),
+            "canal": rng.choice(("WEB", "APP")),
+            "moneda": "CRC",
+            "total": sum(item["cantidad"] * item["precio_unit"] for item in items),
+            "items": items,
+        })
+    return {"ordenes": ordenes}
+
+
+def _neo4j_cliente(seed: int, i: int) -> dict:
+    return {
+        "id": f"C-{i}", "nombre": f"Cliente {i}", "email": f"n4j{i}@ejemplo.com",
+        "genero": _pick(("M", "Femenino", "otro", "F", "masculino", None), seed, i, 2),
+        "pais": _pick(PAISES, seed, i, 3), "fecha_registro": _fecha_registro(seed, i),
+    }
+
+
+def _neo4j_producto(seed: int, i: int) -> dict:
+    producto = {"id": f"P-{i}", "nombre": f"Producto {i}", "categoria": _pick(CATEGORIAS, seed, i, 1), "codigo_alt": codigo_alt(i)}
+    # Several codes per producto, not all of them always present
+    codes = _hash(seed, i, 6) % 4
+    if codes == 0:
+        producto["sku"] = sku(i)
+    elif codes == 1:
+        producto["codigo_mongo"] = codigo_mongo(i)
+    return producto
+
+
+def _neo4j(chunk: _Chunk) -> Dict[str, list]:
+    seed = chunk.seed
+    rng = chunk.rng()
+    records = []
+    for i in range(chunk.start, chunk.stop):
+        items = [
+            {"producto": _neo4j_producto(seed, producto), "cantidad": rng.randint(1, 5), "precio_unit": rng.randrange(1, 50), "moneda": rng.choice(("USD", "CRC"))}
+            for producto in rng.sample(range(1, chunk.productos + 1), min(rng.randint(1, 4), chunk.productos))
+        ]
+        fecha = START + timedelta(seconds=rng.randrange(DAYS * 86400))
+        orden = {"id": f"O-{i:08d}", "fecha": fecha.isoformat(), "canal": rng.choice(("WEB", "APP", "TIENDA")), "moneda": "USD", "total": None}
+        records.append({"cliente": _neo4j_cliente(seed, rng.randint(1, chunk.clientes)), "orden": orden, "items": items})
+    return {"ordenes": records}
+
+
+GENERATORS = {"mssql": _mssql, "mysql": _mysql, "supabase": _supabase, "mongo": _mongo, "neo4j": _neo4j}
+
+
+def _render(source: str, tables: Dict[str, list], render: str) -> Dict[str, str]:
+    """Serialize a chunk inside the worker so the parent only writes text"""
+    out = {}
+    for table, rows in tables.items():
+        buffer = io.StringIO()
+        if source in DOCUMENTS:
+            for document in rows:
+                buffer.write(json_util.dumps(document, json_options=json_util.RELAXED_JSON_OPTIONS))
+                buffer.write("\n")
+        elif render == "csv":
+            csv.writer(buffer, lineterminator="\n").writerows(rows)
+        else:
+            columns = TABLES[source][table][2]
+            for row in rows:
+                buffer.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                buffer.write("\n")
+        out[table] = buffer.getvalue()
+    return out
+
+
+def generate_chunk(chunk: _Chunk) -> Tuple[_Chunk, Dict[str, list], int]:
+    """Rows (or rendered text) of one chunk and the number of orden lines it holds"""
+    tables = GENERATORS[chunk.source](chunk)
+    if chunk.kind != "ordenes":
+        lines = 0
+    elif chunk.source in DOCUMENTS:
+        lines = sum(len(record["items"]) for record in tables["ordenes"])
+    else:
+        lines = len(tables["detalle"])
+    if chunk.render:
+        tables = _render(chunk.source, tables, chunk.render)
+    return chunk, tables, lines
+
+
+# Sinks ----------------------------------------------------------------------------------------
+
+class FileSink:
+    """One file per source table under directory/<source>/, written as chunks arrive"""
+
+    def __init__(self, directory: str, format: str = "ndjson"):
+        self.directory = directory
+        self.render = format
+        self._files: Dict[Tuple[str, str], io.TextIOBase] = {}
+
+    def path(self, source: str, table: str) -> str:
+        if source in DOCUMENTS:
+            return os.path.join(self.directory, source, f"{DOCUMENTS[source][table]}.ndjson")
+        return os.path.join(self.directory, source, f"{TABLES[source][table][1]}.{self.render}")
+
+    def _file(self, source: str, table: str):
+        key = (source, table)
+        if key not in self._files:
+            path = self.path(source, table)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle = self._files[key] = open(path, "w", newline="", encoding="utf-8")
+            if self.render == "csv" and source not in DOCUMENTS:
+                csv.writer(handle, lineterminator="\n").writerow(TABLES[source][table][2])
+        return self._files[key]
+
+    def write(self, source: str, tables: Dict[str, str]):
+        for table, text in tables.items():
+            self._file(source, table).write(text)
+
+    def close(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+
+class StandinSink:
+    """Rows into etl/standins.py stores: SQLite files, a Mongo database and an InMemoryGraph.
+
+    mongo_db or graph may be None (e.g. from the command line, where they would not outlive
+    the process); those sources then go to NDJSON files through fallback.
+    """
+
+    render = None
+
+    def __init__(self, standins, mongo_db=None, graph=None, fallback: Optional[FileSink] = None):
+        self.standins = standins
+        self.mongo_db = mongo_db
+        self.graph = graph
+        self.fallback = fallback
+        self._connections = {}
+
+    def open(self, sources: Sequence[str]):
+        """Empty the stand-ins of the generated sources; reseeding starts from scratch"""
+        for source in sources:
+            if source in TABLES:
+                connection = self._connections[source] = getattr(self.standins, source)()
+                for table, _, _ in TABLES[source].values():
+                    connection.execute(f"DELETE FROM {table}")
+            elif source == "mongo" and self.mongo_db is not None:
+                for collection in DOCUMENTS["mongo"].values():
+                    self.mongo_db[collection].drop()
+
+    def write(self, source: str, tables: Dict[str, list]):
+        if source in TABLES:
+            connection = self._connections[source]
+            for table, rows in tables.items():
+                name, _, columns = TABLES[source][table]
+                connection.executemany(f"INSERT INTO {name} VALUES ({', '.join('?' * len(columns))})", rows)
+        elif source == "mongo" and self.mongo_db is not None:
+            for table, documents in tables.items():
+                self.mongo_db[DOCUMENTS["mongo"][table]].insert_many(documents, ordered=False)
+        elif source == "neo4j" and self.graph is not None:
+            for record in tables["ordenes"]:
+                self.graph.add_orden(record["cliente"], record["orden"], record["items"])
+        elif self.fallback is not None:
+            self.fallback.write(source, _render(source, tables, "ndjson"))
+
+    def close(self):
+        for connection in self._connections.values():
+            connection.commit()
+            connection.close()
+        self._connections.clear()
+        if self.fallback is not None:
+            self.fallback.close()
+
+
+# Driver ---------------------------------------------------------------------------------------
+
+class SyntheticGenerator:
+    """Deterministic per seed; workers <= 1 generates in this process"""
+
+    def __init__(
+        self,
+        ordenes: int,
+        clientes: Optional[int] = None,
+        productos: Optional[int] = None,
+        seed: int = 1,
+        sources: Sequence[str] = SOURCES,
+        workers: Optional[int] = None,
+        chunk_size: int = 20000,
+    ):
+        unknown = set(sources) - set(SOURCES)
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(sorted(unknown))}")
+        self.ordenes = ordenes
+        self.clientes = clientes or default_clientes(ordenes)
+        self.productos = productos or default_productos(ordenes)
+        self.seed = seed
+        self.sources = list(sources)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+
+    def chunks(self, render: Optional[str] = None) -> Iterator[_Chunk]:
+        counts = {"productos": self.productos, "clientes": self.clientes, "ordenes": self.ordenes}
+        for source in self.sources:
+            for kind in KINDS:
+                # neo4j embeds clientes and productos in each orden record
+                if source == "neo4j" and kind != "ordenes":
+                    continue
+                for start in range(1, counts[kind] + 1, self.chunk_size):
+                    yield _Chunk(source, kind, start, min(start + self.chunk_size, counts[kind] + 1), self.seed, self.clientes, self.productos, render)
+
+    def _results(self, render: Optional[str]) -> Iterator[Tuple[_Chunk, Dict[str, list], int]]:
+        if self.workers <= 1:
+            yield from map(generate_chunk, self.chunks(render))
+            return
+        # Bounded and in submission order: output is identical for any worker count
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for chunk in self.chunks(render):
+                pending.append(executor.submit(generate_chunk, chunk))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def run(self, sink) -> dict:
+        start = time.perf_counter()
+        report = {source: {"rows": {}, "lines": 0} for source in self.sources}
+        if hasattr(sink, "open"):
+            sink.open(self.sources)
+        try:
+            for chunk, tables, lines in self._results(sink.render):
+                sink.write(chunk.source, tables)
+                rows = report[chunk.source]["rows"]
+                for table, content in tables.items():
+                    rows[table] = rows.get(table, 0) + (content.count("\n") if isinstance(content, str) else len(content))
+                report[chunk.source]["lines"] += lines
+        finally:
+            sink.close()
+        seconds = time.perf_counter() - start
+        lines = sum(source["lines"] for source in report.values())
+        return {
+            "seed": self.seed,
+            "ordenes": self.ordenes,
+            "clientes": self.clientes,
+            "productos": self.productos,
+            "workers": self.workers,
+            "sources": report,
+            "lines": lines,
+            "seconds": round(seconds, 3),
+            "lines_per_minute": round(lines / seconds * 60) if seconds else None,
+        }
+
+
+def seed_standins(standins, mongo_db, graph, ordenes: int = 100, seed: int = 1, workers: Optional[int] = None) -> dict:
+    """Fill every stand-in with `ordenes` ordenes per source"""
+    return SyntheticGenerator(ordenes, seed=seed, workers=workers).run(StandinSink(standins, mongo_db, graph))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic data for the five sources")
+    parser.add_argument("--ordenes", type=int, required=True, help="Ordenes per source")
+    parser.add_argument("--clientes", type=int, default=None, help="Clientes per source (default ordenes / 5)")
+    parser.add_argument("--productos", type=int, default=None, help="Productos per source (default ordenes / 500, at least 20)")
+    parser.add_argument("--seed", type=int, default=1, help="Same seed, same data")
+    parser.add_argument("--sources", default=",".join(SOURCES), help="Comma-separated subset of " + ",".join(SOURCES))
+    parser.add_argument("--workers", type=int, default=None, help="Generator processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Rows generated per task")
+    parser.add_argument("--format", choices=["standins", "ndjson", "csv"], default="standins", help="Where the data goes")
+    parser.add_argument("--out", default="etl_standins", help="Stand-in or output directory")
+    args = parser.parse_args()
+
+    generator = SyntheticGenerator(
+        args.ordenes, args.clientes, args.productos, args.seed,
+        [name.strip() for name in args.sources.split(",") if name.strip()], args.workers, args.chunk_size
+    )
+    if args.format == "standins":
+        from etl.standins import SqliteStandins
+        sink = StandinSink(SqliteStandins(args.out), fallback=FileSink(args.out))
+    else:
+        sink = FileSink(args.out, args.format)
+    print(json.dumps(generator.run(sink), indent=2))
+
+
+if __name__ == "__main__":
+    main()
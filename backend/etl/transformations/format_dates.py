@@ -0,0 +1,39 @@
+"""Date parsing for the formats the sources actually store.
+
+MySQL keeps 'YYYY-MM-DD' / 'YYYY-MM-DD HH:MM:SS' strings, Supabase returns timestamptz,
+Neo4j its own temporal types and the rest native datetimes.
+"""
+from datetime import date, datetime
+from typing import Optional
+
+_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y", "%Y/%m/%d")
+
+
+def to_datetime(value) -> Optional[datetime]:
+    """Naive datetime for any supported value; the source's wall-clock time is kept"""
+    if value is None or value == "":
+        return None
+    if hasattr(value, "to_native"):  # neo4j.time.Date/DateTime
+        value = value.to_native()
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        pass
+    for fmt in _FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date: {value!r}")
+
+
+def to_date_str(value) -> Optional[str]:
+    """'YYYY-MM-DD' for DATE columns"""
+    parsed = to_datetime(value)
+    return parsed.date().isoformat() if parsed else None
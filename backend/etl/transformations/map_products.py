@@ -0,0 +1,136 @@
+"""Product code homologation against staging.MapProducto.
+
+The mapping is loaded once into nested dicts (FuenteOrigen -> CodigoFuente -> slot) whose
+slots point into one list of interned SKU_Oficial strings, so ETL batches resolve in memory
+instead of querying the DW per line. Refreshes only pull rows past the last MapID seen.
+"""
+import csv
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+MAP_PRODUCTO_QUERY = (
+    "SELECT MapID, FuenteOrigen, CodigoFuente, SKU_Oficial FROM staging.MapProducto"
+    " WHERE MapID > ? ORDER BY MapID"
+)
+
+MappingRow = Tuple[str, str, str]  # (FuenteOrigen, CodigoFuente, SKU_Oficial)
+
+
+def normalize_code(codigo) -> Optional[str]:
+    if codigo is None:
+        return None
+    codigo = str(codigo).strip()
+    return codigo or None
+
+
+class ProductMap:
+    """In-memory (FuenteOrigen, CodigoFuente) -> SKU_Oficial index with miss tracking"""
+
+    def __init__(self, rows: Iterable[MappingRow] = ()):
+        self._index: Dict[str, Dict[str, int]] = {}
+        self._skus: List[str] = []
+        self._sku_slots: Dict[str, int] = {}
+        self.last_map_id = 0
+        self.misses: Counter = Counter()
+        self.load(rows)
+
+    def __len__(self) -> int:
+        return sum(len(codes) for codes in self._index.values())
+
+    def load(self, rows: Iterable[MappingRow]) -> int:
+        """Add or overwrite mappings; returns how many rows were read"""
+        loaded = 0
+        for fuente, codigo, sku in rows:
+            codigo = normalize_code(codigo)
+            if codigo is None or not sku:
+                continue
+            slot = self._sku_slots.get(sku)
+            if slot is None:
+                slot = self._sku_slots[sku] = len(self._skus)
+                self._skus.append(sku)
+            self._index.setdefault(fuente, {})[codigo] = slot
+            self.misses.pop((fuente, codigo), None)
+            loaded += 1
+        return loaded
+
+    def refresh(self, connection, query: str = MAP_PRODUCTO_QUERY) -> int:
+        """Pull MapProducto rows added since the last refresh through a DB-API connection"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, (self.last_map_id,))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        if rows:
+            self.last_map_id = max(self.last_map_id, max(row[0] for row in rows))
+        return self.load((row[1], row[2], row[3]) for row in rows)
+
+    def resolve_one(self, fuente: str, codigo) -> Optional[str]:
+        return self.resolve(fuente, [codigo])[0]
+
+    def resolve(self, fuente: str, codigos: Sequence) -> List[Optional[str]]:
+        """SKU_Oficial for each code of one source, None (and a recorded miss) when unmapped"""
+        codes = self._index.get(fuente, {})
+        skus = self._skus
+        resolved = []
+        misses = self.misses
+        for codigo in codigos:
+            slot = codes.get(codigo)
+            if slot is None:
+                codigo = normalize_code(codigo)
+                slot = codes.get(codigo) if codigo is not None else None
+                if slot is None:
+                    misses[(fuente, codigo)] += 1
+                    resolved.append(None)
+                    continue
+            resolved.append(skus[slot])
+        return resolved
+
+    def resolve_rows(self, rows: List[dict], code_field: str = "producto_id", fuente_field: str = "fuente") -> List[dict]:
+        """Set sku_oficial on line rows in place, batching the lookups per source"""
+        by_fuente: Dict[str, List[dict]] = {}
+        for row in rows:
+            by_fuente.setdefault(row[fuente_field], []).append(row)
+        for fuente, group in by_fuente.items():
+            for row, sku in zip(group, self.resolve(fuente, [row[code_field] for row in group])):
+                row["sku_oficial"] = sku
+        return rows
+
+    def miss_report(self, limit: Optional[int] = None) -> List[dict]:
+        """Unmapped codes, most frequent first, for manual homologation"""
+        return [
+            {"FuenteOrigen": fuente, "CodigoFuente": codigo, "ocurrencias": count}
+            for (fuente, codigo), count in self.misses.most_common(limit)
+        ]
+
+    def write_misses_csv(self, path: str) -> int:
+        report = self.miss_report()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["FuenteOrigen", "CodigoFuente", "ocurrencias"])
+            writer.writeheader()
+            writer.writerows(report)
+        return len(report)
+
+    def stats(self) -> dict:
+        return {
+            "codes": len(self),
+            "skus": len(self._skus),
+            "by_fuente": {fuente: len(codes) for fuente, codes in self._index.items()},
+            "distinct_misses": len(self.misses),
+            "last_map_id": self.last_map_id,
+        }
+
+
+def mongo_mapping_rows(productos: Iterable[dict]) -> Iterable[MappingRow]:
+    """Seed MapProducto candidates from Mongo productos: equivalencias.sku is the official SKU"""
+    for producto in productos:
+        equivalencias = producto.get("equivalencias") or {}
+        sku = normalize_code(equivalencias.get("sku"))
+        if sku is None:
+            continue
+        yield ("MongoDB", producto.get("codigo"), sku)
+        yield ("SQL Server", sku, sku)
+        yield ("Supabase", sku, sku)
+        if equivalencias.get("codigo_alt"):
+            yield ("MySQL", equivalencias["codigo_alt"], sku)
@@ -0,0 +1,155 @@
+"""USD conversion of order lines from the daily USD->CRC rates in TIPOS_DE_CAMBIO.csv.
+
+Rates are held as a sorted datetime64[D] array so a whole batch is resolved with one
+searchsorted (as-of lookup): a date without its own rate uses the latest earlier one, the same
+forward fill fullSetup.sql applies to DimDate with a correlated subquery.
+"""
+import bisect
+import csv
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+import numpy as np
+
+DEFAULT_RATES_PATH = Path(__file__).resolve().parents[3] / "_dummy example DW" / "TIPOS_DE_CAMBIO.csv"
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+
+def parse_amount(value) -> Optional[float]:
+    """Amounts stored as text: '1200.50', '1,200.50', '84,500' or '12.000,50'.
+
+    With both separators the last one is the decimal mark; a lone comma followed by exactly
+    three digits is a thousands separator, any other lone comma is a decimal comma.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        return float(value)
+    text = value.strip().replace(" ", "")
+    if not text:
+        return None
+    if "," in text and "." in text:
+        if text.rfind(",") > text.rfind("."):
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+    elif "," in text:
+        parts = text.split(",")
+        if len(parts) > 2 or len(parts[-1]) == 3:
+            text = text.replace(",", "")
+        else:
+            text = text.replace(",", ".")
+    elif text.count(".") > 1:
+        text = text.replace(".", "")
+    return float(text)
+
+
+def to_datetime64(values: Iterable[DateLike]) -> np.ndarray:
+    """Parse ISO strings / datetimes into a datetime64[D] array (time of day is dropped)"""
+    array = np.asarray(values)
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[D]")
+    return array.astype("datetime64[s]").astype("datetime64[D]")
+
+
+class ExchangeRates:
+    """Daily USD->CRC rates with vectorized as-of lookup and conversion"""
+
+    def __init__(self, dates: np.ndarray, rates: np.ndarray):
+        order = np.argsort(dates, kind="stable")
+        self.dates = dates[order]
+        self.rates = rates[order]
+        # Forward fill blank rates in the file itself before any lookup
+        missing = np.isnan(self.rates)
+        if missing.any():
+            last = np.where(~missing, np.arange(len(self.rates)), 0)
+            np.maximum.accumulate(last, out=last)
+            self.rates = self.rates[last]
+        self._ordinals = self.dates.astype(np.int64).tolist()
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path] = DEFAULT_RATES_PATH) -> "ExchangeRates":
+        dates, rates = [], []
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                if not row.get("Fecha"):
+                    continue
+                dates.append(row["Fecha"].strip()[:10])
+                rate = (row.get("TipoCambio_USD_CRC") or "").strip()
+                rates.append(float(rate) if rate else np.nan)
+        if not dates:
+            raise ValueError(f"No exchange rates found in {path}")
+        return cls(np.array(dates, dtype="datetime64[D]"), np.array(rates, dtype=np.float64))
+
+    @property
+    def first_date(self) -> np.datetime64:
+        return self.dates[0]
+
+    @property
+    def last_date(self) -> np.datetime64:
+        return self.dates[-1]
+
+    def rate_at(self, fechas: Iterable[DateLike]) -> np.ndarray:
+        """As-of USD->CRC rate for each fecha; NaN before the first known rate"""
+        days = to_datetime64(fechas)
+        index = np.searchsorted(self.dates, days, side="right") - 1
+        rates = self.rates[np.clip(index, 0, None)]
+        return np.where(index >= 0, rates, np.nan)
+
+    def to_usd(self, amounts: Iterable[float], monedas: Iterable[str], fechas: Iterable[DateLike]) -> np.ndarray:
+        """Convert amounts to USD; unknown currencies and dates before the first rate give NaN"""
+        amounts = np.asarray(amounts, dtype=np.float64)
+        monedas = np.asarray(monedas)
+        usd = np.full(amounts.shape, np.nan)
+
+        is_usd = monedas == "USD"
+        usd[is_usd] = amounts[is_usd]
+        is_crc = monedas == "CRC"
+        if is_crc.any():
+            fechas = np.asarray(fechas)
+            usd[is_crc] = amounts[is_crc] / self.rate_at(fechas[is_crc])
+        return usd
+
+    def convert_lines(
+        self,
+        cantidad: Iterable[float],
+        precio_unit: Iterable[float],
+        descuento_pct: Iterable[Optional[float]],
+        monedas: Iterable[str],
+        fechas: Iterable[DateLike]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(PrecioUnitUSD, TotalVentaUSD) for a batch of order lines, rounded to 2 decimals"""
+        cantidad = np.asarray(cantidad, dtype=np.float64)
+        descuento = np.nan_to_num(np.asarray(descuento_pct, dtype=np.float64))
+        precio_usd = self.to_usd(precio_unit, monedas, fechas)
+        total_usd = precio_usd * (1 - descuento / 100) * cantidad
+        return np.round(precio_usd, 2), np.round(total_usd, 2)
+
+    def convert_rows(self, rows: List[dict]) -> List[dict]:
+        """Add precio_unit_usd/total_usd to line rows (etl.rows.LINE_COLUMNS) in place"""
+        if not rows:
+            return rows
+        precio_usd, total_usd = self.convert_lines(
+            [row["cantidad"] for row in rows],
+            [row["precio_unit"] for row in rows],
+            [row.get("descuento_pct") if row.get("descuento_pct") is not None else np.nan for row in rows],
+            [row["moneda"] for row in rows],
+            [row["fecha"] for row in rows],
+        )
+        for row, precio, total in zip(rows, precio_usd.tolist(), total_usd.tolist()):
+            row["precio_unit_usd"] = None if precio != precio else precio
+            row["total_usd"] = None if total != total else total
+        return rows
+
+    def to_usd_scalar(self, amount: float, moneda: str, fecha: DateLike) -> Optional[float]:
+        """Per-row reference conversion (bisect on the same table), kept for checks and benchmarks"""
+        if moneda == "USD":
+            return float(amount)
+        if moneda != "CRC":
+            return None
+        day = np.datetime64(fecha, "D").astype(np.int64)
+        index = bisect.bisect_right(self._ordinals, day) - 1
+        if index < 0:
+            return None
+        return float(amount) / float(self.rates[index])
@@ -0,0 +1,21 @@
+"""Gender homologation to the DimCliente domain ('Masculino', 'Femenino', 'No Especificado').
+
+Sources disagree: SQL Server stores full words, MySQL M/F/X, Supabase M/F, Mongo adds 'Otro'
+and Neo4j mixes all of them.
+"""
+from typing import Optional
+
+MASCULINO = "Masculino"
+FEMENINO = "Femenino"
+NO_ESPECIFICADO = "No Especificado"
+
+_GENEROS = {
+    "m": MASCULINO, "masculino": MASCULINO, "male": MASCULINO, "hombre": MASCULINO, "h": MASCULINO,
+    "f": FEMENINO, "femenino": FEMENINO, "female": FEMENINO, "mujer": FEMENINO,
+}
+
+
+def unify_gender(genero: Optional[str]) -> str:
+    if genero is None:
+        return NO_ESPECIFICADO
+    return _GENEROS.get(str(genero).strip().lower(), NO_ESPECIFICADO)
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import mongomock
+import pytest
+
+# Allow `python -m pytest` from the repository root as well as from backend/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def mongo_db(monkeypatch):
+    """A fresh mongomock database behind MongoDBConnection, with the shared caches emptied"""
+    from api.database.mongo_connection import MongoDBConnection
+    from api.services.cache import ReadCache
+    from api.services.mongo.clientes_service import ClienteServiceBase
+    from api.services.mongo.ordenes_service import OrdenServiceBase
+    from api.services.mongo.productos_service import ProductoServiceBase
+
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(MongoDBConnection, "_client", client)
+    monkeypatch.setattr(MongoDBConnection, "_db", client["sales_mongo"])
+    for service in (ClienteServiceBase, ProductoServiceBase, OrdenServiceBase):
+        service.totals.invalidate()
+    ReadCache.invalidate_all()
+    return client["sales_mongo"]
+
+
+@pytest.fixture
+def api_client(mongo_db):
+    """TestClient on the API without the startup hooks (no live Mongo, no index build)"""
+    from fastapi.testclient import TestClient
+    from api.main import app
+    return TestClient(app)
@@ -0,0 +1,35 @@
+"""The /admin routes are off by default and need X-Admin-Token when enabled."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.config import settings
+from api.routers import admin_routes
+
+
+@pytest.fixture
+def admin_app(monkeypatch, mongo_db):
+    # What api.main mounts when ADMIN_ROUTES_ENABLED is set
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+    app = FastAPI()
+    app.include_router(admin_routes.router, prefix="/admin")
+    return TestClient(app)
+
+
+def test_admin_routes_are_not_mounted_by_default(api_client):
+    assert api_client.post("/admin/cache/clear").status_code == 404
+    assert api_client.post("/admin/mongo/agg-ventas/rebuild").status_code == 404
+
+
+def test_admin_routes_require_the_token(admin_app):
+    assert admin_app.post("/admin/cache/clear").status_code == 403
+    assert admin_app.post("/admin/cache/clear", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    response = admin_app.post("/admin/cache/clear", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert "namespaces" in response.json()
+
+
+def test_empty_token_setting_locks_the_routes(admin_app, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    assert admin_app.get("/admin/cache", headers={"X-Admin-Token": ""}).status_code == 403
@@ -0,0 +1,110 @@
+"""Bulk create/upsert endpoints on mongomock: partial failures are reported per row and
+never abort the rest of the chunk (insert_many/bulk_write with ordered=False)."""
+import json
+
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from api.dependencies import get_mongo_clientes_service
+from api.main import app
+from api.services.mongo.clientes_service import ClienteService
+
+
+def cliente(i: int, **fields) -> dict:
+    return {"nombre": f"Cliente {i}", "email": f"c{i}@example.com", "genero": "F", "pais": "CR", **fields}
+
+
+class OrderedFalseBulkWrite:
+    """mongomock's bulk_write rejects current pymongo UpdateOne objects; this replays them one
+    by one with the server's ordered=False semantics (keep going, report writeErrors)"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    def bulk_write(self, operations, ordered=True):
+        details = {"writeErrors": [], "nUpserted": 0, "nModified": 0}
+        for index, operation in enumerate(operations):
+            assert isinstance(operation, UpdateOne)
+            try:
+                result = self.collection.update_one(operation._filter, operation._doc, upsert=operation._upsert)
+            except DuplicateKeyError as e:
+                details["writeErrors"].append({"index": index, "code": 11000, "errmsg": str(e)})
+                continue
+            details["nUpserted"] += result.upserted_id is not None
+            details["nModified"] += result.modified_count
+        if details["writeErrors"]:
+            raise BulkWriteError(details)
+        return type("BulkWriteResult", (), {"upserted_count": details["nUpserted"], "modified_count": details["nModified"]})()
+
+
+@pytest.fixture
+def clientes(mongo_db):
+    mongo_db.clientes.create_index("email", unique=True)
+    return mongo_db.clientes
+
+
+def test_insert_reports_duplicates_and_invalid_rows(api_client, clientes):
+    clientes.insert_one(cliente(0))
+    rows = [cliente(1), cliente(0), {"nombre": "sin email"}, cliente(2), cliente(1)]
+
+    response = api_client.post("/mongo/clientes/bulk?chunk_size=2", json=rows)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["received"] == 5
+    assert result["inserted"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 2, 4]
+    assert "email" in result["errors"][1]["error"]
+    assert clientes.count_documents({}) == 3
+
+
+def test_ndjson_body_keeps_going_after_a_bad_line(api_client, clientes):
+    body = "\n".join([json.dumps(cliente(1)), "{not json", json.dumps(cliente(2))]) + "\n"
+
+    response = api_client.post("/mongo/clientes/bulk", content=body, headers={"content-type": "application/x-ndjson"})
+
+    result = response.json()
+    assert result["inserted"] == 2
+    assert result["errors"][0]["index"] == 1
+    assert result["errors"][0]["error"].startswith("Invalid JSON")
+
+
+def test_upsert_updates_inserts_and_reports_conflicts(api_client, clientes, mongo_db):
+    app.dependency_overrides[get_mongo_clientes_service] = lambda: ClienteService(OrderedFalseBulkWrite(clientes))
+    try:
+        clientes.insert_one(cliente(0))
+        clientes.insert_one(cliente(9))
+        # Row 2 is a new email whose nombre cliente 9 already owns: the unique index rejects it
+        mongo_db.clientes.create_index("nombre", unique=True)
+        rows = [cliente(0, pais="PA"), cliente(1), cliente(3, nombre="Cliente 9")]
+
+        response = api_client.post("/mongo/clientes/bulk?upsert=true", json=rows)
+    finally:
+        app.dependency_overrides.pop(get_mongo_clientes_service)
+
+    result = response.json()
+    assert (result["modified"], result["upserted"]) == (1, 1)
+    assert [error["index"] for error in result["errors"]] == [2]
+    assert clientes.find_one({"email": "c0@example.com"})["pais"] == "PA"
+    assert clientes.count_documents({}) == 3
+
+
+def test_bulk_ordenes_insert_valid_rows_only(api_client, mongo_db):
+    orden = {"cliente_id": "c1", "fecha": "2024-03-01T10:00:00", "canal": "WEB", "moneda": "USD",
+             "items": [{"producto_id": "p1", "cantidad": 2, "precio_unit": 5.0}]}
+    rows = [orden, dict(orden, items=[]), dict(orden, moneda="CRC")]
+
+    result = api_client.post("/mongo/ordenes/bulk", json=rows).json()
+
+    assert (result["received"], result["inserted"]) == (3, 2)
+    assert [error["index"] for error in result["errors"]] == [1]
+    assert mongo_db.ordenes.find_one({"moneda": "USD"})["total"] == 10.0
+
+
+def test_non_array_body_is_a_400(api_client, mongo_db):
+    response = api_client.post("/mongo/clientes/bulk", json={"nombre": "x"})
+    assert response.status_code == 400
@@ -0,0 +1,37 @@
+"""ReadCache counters stay exact when threadpool workers share a namespace."""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from api.services.cache import LRUBackend, ReadCache
+
+
+def test_counters_are_exact_under_concurrent_reads(monkeypatch):
+    monkeypatch.setattr(ReadCache, "_backend", LRUBackend(maxsize=64))
+    cache = ReadCache("test-counters", ttl=60)
+    cache.enabled = True
+
+    def read(i: int):
+        return cache.fetch(("item", i % 32), lambda: i % 32)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(read, range(20000)))
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 20000
+    assert stats["misses"] >= 32
+
+
+def test_backend_errors_fail_open_and_are_logged(monkeypatch, caplog):
+    class Broken(LRUBackend):
+        def get(self, key):
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(ReadCache, "_backend", Broken())
+    cache = ReadCache("test-errors", ttl=60)
+    cache.enabled = True
+
+    with caplog.at_level(logging.WARNING, logger="api.services.cache"):
+        assert cache.fetch(("item",), lambda: "from mongo") == "from mongo"
+
+    assert cache.stats()["errors"] == 1
+    assert "Cache backend error (test-errors): redis down" in caplog.text
@@ -0,0 +1,34 @@
+"""The slow-command log shows the shape of a command, never its documents."""
+import logging
+from types import SimpleNamespace
+
+from api.database.command_monitor import CommandStatsListener, command_shape
+
+
+def event(**fields):
+    defaults = {"connection_id": ("localhost", 27017), "request_id": 1, "duration_micros": 250_000, "reply": {"n": 2}}
+    return SimpleNamespace(**{**defaults, **fields})
+
+
+def test_shape_redacts_values_and_summarizes_batches():
+    ids = [f"id-{i}" for i in range(500)]
+    find = {"find": "clientes", "filter": {"email": "ana@example.com", "_id": {"$in": ids}}, "sort": {"_id": 1}}
+    update = {"update": "agg_ventas", "updates": [{"q": {"_id": 1}, "u": {"$inc": {"monto": 9.5}}, "upsert": True}] * 40}
+
+    assert command_shape("find", find) == {"filter": {"email": "?", "_id": {"$in": ["?", "?", "?", "... 497 more"]}}, "sort": {"_id": "?"}}
+    assert command_shape("insert", {"insert": "ordenes", "documents": [{"nombre": "x"}] * 1000}) == {"documents": 1000}
+    assert command_shape("update", update) == {
+        "updates": 40, "updates[0]": {"q": {"_id": "?"}, "u": {"$inc": {"monto": "?"}}, "upsert": "?"}
+    }
+
+
+def test_slow_insert_is_logged_without_its_documents(caplog):
+    listener = CommandStatsListener(slow_ms=100)
+    command = {"insert": "clientes", "documents": [{"email": f"c{i}@example.com"} for i in range(5000)]}
+
+    listener.started(event(command_name="insert", command=command))
+    with caplog.at_level(logging.WARNING, logger="api.database.command_monitor"):
+        listener.succeeded(event(command_name="insert"))
+
+    [record] = caplog.records
+    assert record.getMessage() == 'Slow MongoDB insert on clientes (250.0 ms, 2 docs): {"documents": 5000}'
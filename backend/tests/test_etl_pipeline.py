@@ -0,0 +1,103 @@
+"""ETL into the SQLite DW stand-in: reruns are idempotent and surrogate keys are stable."""
+import argparse
+import os
+
+import pytest
+
+from etl.loaders.dimensions import DimensionStage, tiempo_ids
+from etl.loaders.facts import FactVentasLoader
+from etl.loaders.sqlite_dw import connect_sqlite_dw
+from etl.main import build_sources, run_dw
+
+
+def dw_args(directory: str, run: int) -> argparse.Namespace:
+    # Every run seeds its own stand-ins with the same seed, so it extracts the same ordenes
+    return argparse.Namespace(
+        standins=os.path.join(directory, f"sources-{run}"), sample=40, seed=3, sample_workers=1, live="",
+        workers=2, max_pending=4, batch_size=50, partition_size=25, dw=os.path.join(directory, "dw"),
+        fact_batch_size=60,
+    )
+
+
+def fact_count(directory: str) -> int:
+    connection = connect_sqlite_dw(os.path.join(directory, "dw"))
+    try:
+        return connection.execute("SELECT COUNT(*) FROM dwh.FactVentas").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_rerun_replaces_facts_instead_of_duplicating(tmp_path):
+    first = run_dw(dw_args(str(tmp_path), 1), build_sources(dw_args(str(tmp_path), 1)))
+    rows = fact_count(str(tmp_path))
+    second = run_dw(dw_args(str(tmp_path), 2), build_sources(dw_args(str(tmp_path), 2)))
+
+    assert set(first["sources"]) == {"SQL Server", "MySQL", "Supabase", "MongoDB", "Neo4j"}
+    assert first["facts"]["inserted"] == rows > 0
+    assert first["facts"]["deleted"] == 0
+    assert second["facts"]["deleted"] == second["facts"]["inserted"] == rows
+    assert fact_count(str(tmp_path)) == rows
+    # Every member already exists: the rerun only reads the dimensions
+    assert all(dimension["inserted"] == 0 for dimension in second["dimensions"].values())
+
+
+def line(i: int, **fields) -> dict:
+    row = {
+        "fuente": "MongoDB", "orden_id": f"o{i // 2}", "linea": i % 2 + 1, "cliente_id": f"c{i % 7}",
+        "cliente_nombre": f"Cliente {i % 7}", "sku_oficial": f"SKU-{i % 5}", "fecha": f"2024-02-{i % 28 + 1:02d}",
+        "canal": ("WEB", "APP")[i % 2], "moneda": "USD", "total_usd": 10.0, "cantidad": 1,
+        "precio_unit_usd": 10.0, "descuento_pct": None,
+    }
+    row.update(fields)
+    return row
+
+
+@pytest.fixture
+def dw():
+    connection = connect_sqlite_dw()
+    yield connection
+    connection.close()
+
+
+def test_surrogate_keys_are_stable_across_caches(dw):
+    rows = [line(i) for i in range(200)]
+    DimensionStage(dw).assign_keys(rows)
+
+    assert len({row["ClienteID"] for row in rows}) == 7
+    assert len({row["ProductoID"] for row in rows}) == 5
+    assert len({row["CanalID"] for row in rows}) == 2
+    assert rows[0]["TiempoID"] == 20240201
+    assert dw.execute("SELECT COUNT(*) FROM dwh.DimCliente").fetchone()[0] == 7
+
+    # A bounded LRU without preload resolves the same keys from the database
+    again = [line(i) for i in range(200)]
+    bounded = DimensionStage(dw, maxsize=3)
+    bounded.assign_keys(again)
+    assert [(row["ClienteID"], row["ProductoID"]) for row in again] == [(row["ClienteID"], row["ProductoID"]) for row in rows]
+    assert bounded.stats()["DimCliente"]["inserted"] == 0
+    assert len(bounded.clientes.cache) <= 3
+
+
+def test_same_cliente_id_from_two_fuentes_gets_two_keys(dw):
+    rows = [line(0), line(0, fuente="MySQL")]
+    DimensionStage(dw).assign_keys(rows)
+    assert rows[0]["ClienteID"] != rows[1]["ClienteID"]
+    assert rows[0]["ProductoID"] == rows[1]["ProductoID"]
+
+
+def test_unusable_natural_keys_are_rejected_not_inserted(dw):
+    rows = [line(0), line(1, cliente_id=None), line(2, fecha="not a date"), line(3, fecha=None)]
+    DimensionStage(dw).assign_keys(rows)
+    loader = FactVentasLoader(dw)
+    loader.add(rows)
+
+    assert rows[0]["ClienteID"] is not None
+    assert rows[1]["TiempoID"] is not None and rows[1]["ClienteID"] is None
+    assert rows[2]["TiempoID"] is None and rows[3]["TiempoID"] is None
+    assert dw.execute("SELECT COUNT(*) FROM dwh.DimCliente").fetchone()[0] == 1
+    assert [error["error"].split(" (")[0] for error in loader.rejected] == ["missing ClienteID", "missing TiempoID", "missing TiempoID"]
+    assert loader.close()["inserted"] == 1
+
+
+def test_tiempo_ids_are_yyyymmdd():
+    assert tiempo_ids(["2024-02-29", "2024-12-31 23:59:59"]).tolist() == [20240229, 20241231]
@@ -0,0 +1,75 @@
+"""Peak memory of the ordenes export must not grow with the number of ordenes streamed."""
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from api.services.mongo.ordenes_service import OrdenService
+
+BASELINE = 10_000
+BATCH_SIZE = 1000
+
+
+class GeneratedOrdenes:
+    """Stands in for a server-side cursor: one fresh document per orden, nothing retained"""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def find(self, filter_criteria=None, projection=None, batch_size=None):
+        fecha = datetime(2024, 1, 1)
+        for i in range(self.count):
+            yield {
+                "_id": ObjectId(),
+                "cliente_id": f"cliente-{i % 5000}",
+                "fecha": fecha + timedelta(seconds=i),
+                "canal": "WEB",
+                "moneda": "CRC",
+                "total": 2900.0,
+                "items": [
+                    {"producto_id": "p-1", "cantidad": 1, "precio_unit": 1000},
+                    {"producto_id": "p-2", "cantidad": 2, "precio_unit": 1000, "descuento_pct": 5},
+                ],
+            }
+
+
+def export_peak(count: int, format: str):
+    """(peak traced bytes, first chunk, lines written) for one full export"""
+    service = OrdenService(GeneratedOrdenes(count))
+    first, lines = None, 0
+    tracemalloc.start()
+    try:
+        for chunk in service.export_ordenes(format=format, batch_size=BATCH_SIZE):
+            first = first or chunk
+            lines += chunk.count(b"\n")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, first, lines
+
+
+@pytest.mark.parametrize("ordenes", [100_000, pytest.param(1_000_000, marks=pytest.mark.slow)])
+@pytest.mark.parametrize("format, lines_per_orden, header", [("ndjson", 1, 0), ("csv", 2, 1)])
+def test_export_memory_is_flat(ordenes, format, lines_per_orden, header):
+    baseline, _, _ = export_peak(BASELINE, format)
+    peak, _, lines = export_peak(ordenes, format)
+
+    assert lines == ordenes * lines_per_orden + header
+    # One flushed block at a time: far more ordenes, about the same peak as the baseline
+    assert peak < baseline * 1.5 + 256 * 1024
+    assert peak < 8 * 1024 * 1024
+
+
+def test_export_chunks_are_parseable():
+    _, first, _ = export_peak(5, "ndjson")
+    documents = [json.loads(line) for line in first.decode("utf-8").splitlines()]
+    assert len(documents) == 5
+    assert documents[0]["fecha"] == "2024-01-01T00:00:00"
+    assert isinstance(documents[0]["_id"], str)
+
+    _, first, _ = export_peak(5, "csv")
+    rows = first.decode("utf-8").splitlines()
+    assert rows[0].startswith("orden_id,linea,cliente_id,fecha")
+    assert len(rows) == 11
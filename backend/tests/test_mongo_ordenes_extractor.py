@@ -0,0 +1,94 @@
+"""MongoOrdenesExtractor on mongomock with SQLite checkpoints and staging."""
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from etl.checkpoints import CheckpointStore
+from etl.extractors.mongo_ordenes import MongoOrdenesExtractor
+from etl.staging import SQLiteStagingSink
+
+START = datetime(2024, 1, 1)
+
+
+def orden(actualizado: datetime, items: int = 2) -> dict:
+    return {
+        "_id": ObjectId(),
+        "cliente_id": "c1",
+        "fecha": START,
+        "canal": "WEB",
+        "moneda": "USD",
+        "total": 10.0 * items,
+        "actualizado": actualizado,
+        "items": [{"producto_id": f"p{i}", "cantidad": 1, "precio_unit": 10.0} for i in range(items)],
+    }
+
+
+@pytest.fixture
+def extractor(mongo_db, tmp_path):
+    checkpoints = CheckpointStore(str(tmp_path / "state.db"))
+    yield MongoOrdenesExtractor(mongo_db.ordenes, checkpoints, batch_size=4, lag_seconds=30)
+    checkpoints.close()
+
+
+@pytest.fixture
+def sink(tmp_path):
+    sink = SQLiteStagingSink(str(tmp_path / "staging.db"))
+    yield sink
+    sink.close()
+
+
+def test_first_run_extracts_everything_in_batches(mongo_db, extractor, sink):
+    documents = [orden(START + timedelta(minutes=i)) for i in range(10)]
+    mongo_db.ordenes.insert_many(documents)
+
+    report = extractor.run(sink)
+
+    assert report["batches"] == 3
+    assert report["ordenes"] == 10
+    assert sink.count() == 20
+    assert report["watermark"]["_id"] == documents[-1]["_id"]
+    assert extractor.checkpoints.load(extractor.watermark_name)["_id"] == documents[-1]["_id"]
+
+
+def test_rerun_only_rereads_the_lag_window(mongo_db, extractor, sink):
+    mongo_db.ordenes.insert_many([orden(START + timedelta(minutes=i)) for i in range(10)])
+    extractor.run(sink)
+
+    # Last mark at minute 9, lag 30 s: only the orden at minute 9 is inside the window
+    report = extractor.run(sink)
+    assert report["ordenes"] == 1
+    assert sink.count() == 20
+
+
+def test_changed_and_late_ordenes_are_picked_up(mongo_db, extractor, sink):
+    documents = [orden(START + timedelta(minutes=i)) for i in range(10)]
+    mongo_db.ordenes.insert_many(documents)
+    first = extractor.run(sink)
+
+    # An update past the mark, and a write that committed late with an older actualizado
+    mongo_db.ordenes.update_one(
+        {"_id": documents[0]["_id"]},
+        {"$set": {"actualizado": START + timedelta(minutes=20), "items": documents[0]["items"][:1]}}
+    )
+    late = orden(START + timedelta(minutes=9, seconds=30), items=3)
+    mongo_db.ordenes.insert_one(late)
+
+    report = extractor.run(sink)
+    staged = {row[0] for row in sink.connection.execute("SELECT orden_id FROM stg_orden_lineas")}
+
+    assert str(late["_id"]) in staged
+    assert sink.count() == 20 - 1 + 3
+    assert report["watermark"]["_id"] == documents[0]["_id"]
+    assert report["watermark"]["actualizado"] > first["watermark"]["actualizado"]
+
+
+def test_watermark_never_moves_back(mongo_db, extractor, sink):
+    mongo_db.ordenes.insert_many([orden(START + timedelta(minutes=i)) for i in range(3)])
+    saved = extractor.run(sink)["watermark"]
+
+    mongo_db.ordenes.insert_one(orden(START + timedelta(minutes=1, seconds=50)))
+    report = extractor.run(sink)
+
+    assert report["ordenes"] == 2
+    assert report["watermark"]["_id"] == saved["_id"]
@@ -0,0 +1,37 @@
+"""Stored total/total_usd: CRC ordenes are converted at write time and check_totals survives bad data."""
+from datetime import datetime
+
+from api.services.exchange_rates import get_rates
+from api.services.mongo.ordenes_service import OrdenService
+
+ORDEN = {
+    "cliente_id": "c1", "fecha": "2024-03-01T10:00:00", "canal": "WEB", "moneda": "CRC",
+    "items": [{"producto_id": "p1", "cantidad": 2, "precio_unit": 2600.0}],
+}
+
+
+def test_crc_orden_gets_total_usd_at_the_fecha_rate(api_client):
+    created = api_client.post("/mongo/ordenes/", json=ORDEN).json()
+
+    rate = float(get_rates().rate_at(["2024-03-01"])[0])
+    assert created["total"] == 5200.0
+    assert created["total_usd"] == round(5200.0 / rate, 2)
+
+    updated = api_client.patch(f"/mongo/ordenes/{created['id']}", json=dict(ORDEN, moneda="USD")).json()
+    assert updated["total_usd"] == 5200.0
+
+
+def test_check_totals_reports_missing_and_non_numeric_totals(mongo_db):
+    item = {"producto_id": "p1", "cantidad": 1, "precio_unit": 10.0}
+    ids = mongo_db.ordenes.insert_many([
+        {"fecha": datetime(2024, 3, 1), "moneda": "USD", "items": [item], "total": 10.0, "total_usd": 10.0},
+        {"fecha": datetime(2024, 3, 1), "moneda": "USD", "items": [item], "total": None},
+        {"fecha": "not a date", "moneda": "CRC", "items": [item], "total": "10", "total_usd": "x"},
+        {"fecha": datetime(2024, 3, 1), "moneda": "USD", "items": [item]},
+    ]).inserted_ids
+
+    report = OrdenService(mongo_db.ordenes).check_totals()
+
+    assert report["checked"] == 4
+    assert report["mismatched"] == 3
+    assert report["sample"] == [str(orden_id) for orden_id in ids[1:]]
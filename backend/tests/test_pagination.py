@@ -0,0 +1,56 @@
+"""Keyset cursors are tied to the sort they were issued for."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.services.mongo.pagination import FECHA_SORT, decode_cursor, encode_cursor
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def ordenes(mongo_db):
+    mongo_db.ordenes.insert_many([
+        {"cliente_id": "c1", "fecha": START + timedelta(days=i), "canal": "WEB", "moneda": "USD",
+         "items": [{"producto_id": "p1", "cantidad": 1, "precio_unit": 1.0}], "total": 1.0}
+        for i in range(5)
+    ])
+    return mongo_db.ordenes
+
+
+def fecha_page(api_client, order: str, cursor: str = None):
+    params = {"fecha_inicio": START.isoformat(), "fecha_fin": (START + timedelta(days=10)).isoformat(),
+              "limit": 2, "order": order, "total": "false"}
+    if cursor:
+        params["cursor"] = cursor
+    return api_client.get("/mongo/ordenes/fecha", params=params)
+
+
+def test_cursor_walks_the_range_in_both_directions(api_client, ordenes):
+    for order, expected in (("asc", [0, 1, 2, 3, 4]), ("desc", [4, 3, 2, 1, 0])):
+        days, cursor = [], None
+        while True:
+            page = fecha_page(api_client, order, cursor).json()
+            days += [datetime.fromisoformat(orden["fecha"]).day - 1 for orden in page["data"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert days == expected
+
+
+def test_cursor_reused_with_the_other_order_is_a_400(api_client, ordenes):
+    cursor = fecha_page(api_client, "asc").json()["next_cursor"]
+
+    response = fecha_page(api_client, "desc", cursor)
+
+    assert response.status_code == 400
+    assert "sort order" in response.json()["detail"]
+
+
+def test_cursor_from_another_sort_or_garbage_is_rejected():
+    cursor = encode_cursor({"_id": 1}, ("_id",))
+    assert decode_cursor(cursor, ("_id",)) == {"_id": 1}
+    with pytest.raises(ValueError, match="sort order"):
+        decode_cursor(cursor, FECHA_SORT)
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("not-a-cursor", ("_id",))
@@ -0,0 +1,39 @@
+"""agg_ventas buckets: USD amounts at the AGG_VENTAS_USD grain, rebuilt by swapping collections."""
+from datetime import datetime
+
+from api.services.exchange_rates import get_rates
+from api.services.mongo.ventas_aggregates import VentasAggregates, change_deltas
+
+CRC = {"fecha": datetime(2024, 3, 1), "moneda": "CRC", "items": [{"producto_id": "p1", "cantidad": 2, "precio_unit": 2600.0}]}
+USD = {"fecha": datetime(2024, 3, 5), "moneda": "USD", "items": [{"producto_id": "p1", "cantidad": 1, "precio_unit": 10.0, "descuento_pct": 10}]}
+
+
+def test_currencies_share_one_usd_bucket():
+    deltas = change_deltas(None, CRC)
+    for key, delta in change_deltas(None, USD).items():
+        for field, value in delta.items():
+            deltas[key][field] += value
+
+    rate = float(get_rates().rate_at(["2024-03-01"])[0])
+    assert list(deltas) == [(2024, 3, "p1")]
+    assert deltas[(2024, 3, "p1")]["cantidad"] == 3
+    assert abs(deltas[(2024, 3, "p1")]["monto"] - (round(5200.0 / rate, 2) + 9.0)) < 0.005
+
+
+def test_update_that_changes_nothing_folds_nothing():
+    assert change_deltas(CRC, dict(CRC, fecha=datetime(2024, 3, 1))) == {}
+
+
+def test_rebuild_swaps_in_a_complete_collection(mongo_db):
+    mongo_db.ordenes.insert_many([dict(CRC), dict(USD), dict(CRC, fecha=datetime(1990, 1, 1))])
+    mongo_db.agg_ventas.insert_one({"_id": "stale"})
+
+    report = VentasAggregates(mongo_db.agg_ventas).rebuild(mongo_db.ordenes)
+    months = VentasAggregates(mongo_db.agg_ventas).monthly()
+
+    # The 1990 CRC orden predates the first rate and has no USD value
+    assert report == {"ordenes": 3, "buckets": 1}
+    assert mongo_db.agg_ventas.find_one({"_id": "stale"}) is None
+    assert "agg_ventas_rebuild" not in mongo_db.list_collection_names()
+    assert "agg_ventas_periodo" in mongo_db.agg_ventas.index_information()
+    assert [(month["anio"], month["mes"], month["ventas"][0]["cantidad"]) for month in months] == [(2024, 3, 3)]
@@ -111,6 +111,7 @@ CREATE INDEX IX_FactVentas_Cliente ON dwh.FactVentas(ClienteID);
 CREATE INDEX IX_FactVentas_Producto ON dwh.FactVentas(ProductoID);
 CREATE INDEX IX_FactVentas_Canal ON dwh.FactVentas(CanalID);
 CREATE INDEX IX_FactVentas_Fuente ON dwh.FactVentas(FuenteOrigen);
+CREATE INDEX IX_FactVentas_Orden ON dwh.FactVentas(OrdenID_Natural, FuenteOrigen); -- recarga idempotente del ETL
 
 -- Índices para MetasVentas
 CREATE INDEX IX_MetasVentas_ClienteProducto ON dwh.MetasVentas(ClienteID, ProductoID);